@@ -0,0 +1,137 @@
+"""Shared process pool for batch-mode tools. Lives at repo root so main.py
+doesn't list it as a tool.
+
+    for png in pool_map(make_certificate, [(name, text, signer, style, logo) for name in names]):
+        ...
+
+runs a tool's own per-item function in a warm ProcessPoolExecutor and yields
+the results in input order while driving an `st.progress` bar, so a batch uses
+every core instead of holding the GIL in the session's script thread. Workers
+import the tool module by file path (toolutil.load_tool), so the function is
+passed unchanged; its arguments and result must be picklable (PIL images are).
+
+Worker count: TOOLS_WORKERS, else the CPUs this process may run on. With one
+worker, or for tiny batches, items run inline in the calling thread.
+"""
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import streamlit as st
+from toolutil import load_tool
+
+INLINE_BELOW = 3  # batches smaller than this aren't worth the IPC round-trips
+
+_pool = None
+_lock = threading.Lock()
+
+
+def workers():
+    """Number of worker processes the pool uses."""
+    env = os.environ.get("TOOLS_WORKERS", "").strip()
+    if env.isdigit() and int(env) > 0:
+        return int(env)
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS/Windows
+        return os.cpu_count() or 1
+
+
+def context():
+    """Start method for worker pools: Streamlit runs sessions in threads, and forking a threaded process is unsafe."""
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def _executor():
+    """The process-wide pool, created on first use (None when running inline)."""
+    global _pool
+    if workers() <= 1:
+        return None
+    with _lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=workers(), mp_context=context())
+        return _pool
+
+
+def _reset():
+    global _pool
+    with _lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def _call(tool_path, func_name, args):
+    """Worker side: import the tool by path (once per worker) and call the function."""
+    return getattr(load_tool(tool_path), func_name)(*args)
+
+
+def pool_map(func, items, total=None, tagged=False, progress_text=None, window=None):
+    """Yield `func(*args)` for each args tuple in `items`, in order, computed in the pool.
+
+    `items` is consumed lazily and at most `window` items (default: 4 per
+    worker) are in flight, so a large batch never holds every decoded input at
+    once; pass `total` when `items` is a generator so the progress bar can fill.
+    With `tagged=True` each item is `(tag, args)` and `(tag, result)` pairs are
+    yielded, e.g. to keep an output filename next to its result. Shows an
+    `st.progress` bar (with `progress_text`) while running; worker exceptions
+    propagate.
+    """
+    if total is None:
+        items = list(items)
+        total = len(items)
+    if not tagged:
+        items = ((None, args) for args in items)
+    bar = st.progress(0.0, text=progress_text) if total else None
+    pool = _executor() if total >= INLINE_BELOW else None
+    tool_path, func_name = func.__globals__["__file__"], func.__name__
+    window = window or 4 * workers()
+    done = 0
+
+    def emit(tag, result):
+        nonlocal done
+        done += 1
+        if bar is not None:
+            frac = min(1.0, done / total)
+            bar.progress(frac, text=f"{progress_text} {done}/{total}" if progress_text else f"{done}/{total}")
+        return (tag, result) if tagged else result
+
+    try:
+        if pool is None:
+            for tag, args in items:
+                yield emit(tag, func(*args))
+            return
+        try:
+            for tag, result in ordered(pool, tool_path, func_name, items, window):
+                yield emit(tag, result)
+        except BrokenProcessPool:
+            _reset()  # a worker died (e.g. OOM-killed); next batch gets a fresh pool
+            raise
+    finally:
+        if bar is not None:
+            bar.empty()
+
+
+def ordered(pool, tool_path, func_name, items, window):
+    """Yield `(tag, result)` for `(tag, args)` items run in `pool`, in input order.
+
+    No Streamlit involved, so the headless CLI (toolcli.py) uses it with its own
+    pool. At most `window` items are submitted ahead of the one being awaited.
+    """
+    pending = deque()
+    try:
+        for tag, args in items:
+            pending.append((tag, pool.submit(_call, tool_path, func_name, args)))
+            if len(pending) >= window:
+                tag, fut = pending.popleft()
+                yield tag, fut.result()
+        while pending:
+            tag, fut = pending.popleft()
+            yield tag, fut.result()
+    finally:
+        for _, fut in pending:
+            fut.cancel()
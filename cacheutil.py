@@ -0,0 +1,205 @@
+"""Content-addressed result cache shared by the tools. Lives at repo root so
+main.py doesn't list it as a tool.
+
+    @content_cache("PDF to text")
+    def _extract_pages(data):
+        ...
+
+Results are keyed by (tool, function, SHA-256 of every bytes-like / uploaded-file
+argument, normalized remaining options), so re-clicking "Process" on the same
+upload — in any session — returns the stored result instead of recomputing it.
+
+Tiers, both off by default: they keep results of users' uploads after their
+session ends, which PRIVACY.md rules out. Update the privacy notice if you
+enable either.
+  1. an in-memory LRU shared by all sessions, bounded by pickled size
+     (TOOLS_CACHE_MEMORY_MB, default 0 = off);
+  2. an on-disk tier under TOOLS_CACHE_DIR, evicting least recently used files
+     past TOOLS_CACHE_DISK_MB (default 512). Keep the directory private (the
+     entries are pickles).
+With neither configured, decorated functions are called straight through.
+
+`stats()` reports hits per tier and misses per tool (shown on the metrics page).
+"""
+import functools
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+
+MEMORY_LIMIT = int(os.environ.get("TOOLS_CACHE_MEMORY_MB", "0")) * 1024 * 1024
+DISK_DIR = os.environ.get("TOOLS_CACHE_DIR") or None
+DISK_LIMIT = int(os.environ.get("TOOLS_CACHE_DISK_MB", "512")) * 1024 * 1024
+
+_MISS = object()
+_lock = threading.Lock()
+_memory = OrderedDict()  # key -> pickled result
+_memory_size = 0
+_disk_size = None  # bytes under DISK_DIR; scanned on first use
+_counters = {}  # tool -> {"memory": n, "disk": n, "miss": n}
+
+
+def _digest(value):
+    """Hashable, stable stand-in for one argument."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return "sha256:" + hashlib.sha256(value).hexdigest()
+    if hasattr(value, "getvalue") and hasattr(value, "name"):  # Streamlit UploadedFile
+        return "sha256:" + hashlib.sha256(value.getvalue()).hexdigest()
+    if isinstance(value, dict):
+        return {str(k): _digest(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, (list, tuple)):
+        return [_digest(v) for v in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return repr(value)
+
+
+def _key(tool, func, args, kwargs):
+    payload = json.dumps([tool, func, _digest(list(args)), _digest(kwargs)], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _count(tool, field):
+    _counters.setdefault(tool, {"memory": 0, "disk": 0, "miss": 0})[field] += 1
+
+
+def _remember(key, blob):
+    """Insert into the memory tier, evicting least recently used entries. Caller holds _lock."""
+    global _memory_size
+    if len(blob) > MEMORY_LIMIT // 4:
+        return
+    old = _memory.pop(key, None)
+    if old is not None:
+        _memory_size -= len(old)
+    _memory[key] = blob
+    _memory_size += len(blob)
+    while _memory_size > MEMORY_LIMIT and _memory:
+        _, evicted = _memory.popitem(last=False)
+        _memory_size -= len(evicted)
+
+
+def _disk_path(key):
+    return os.path.join(DISK_DIR, key[:2], key + ".pkl")
+
+
+def _disk_get(key):
+    path = _disk_path(key)
+    try:
+        with open(path, "rb") as f:
+            blob = f.read()
+        os.utime(path)  # mtime doubles as "last used" for eviction
+        return blob
+    except OSError:
+        return None
+
+
+def _disk_entries():
+    for sub in os.listdir(DISK_DIR):
+        folder = os.path.join(DISK_DIR, sub)
+        if os.path.isdir(folder):
+            for name in os.listdir(folder):
+                if name.endswith(".pkl"):
+                    path = os.path.join(folder, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    yield st.st_mtime, st.st_size, path
+
+
+def _disk_put(key, blob):
+    global _disk_size
+    if len(blob) > DISK_LIMIT // 4:
+        return
+    path = _disk_path(key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(blob)
+    os.replace(tmp, path)
+    with _lock:
+        if _disk_size is None:
+            _disk_size = sum(size for _, size, _ in _disk_entries())
+        else:
+            _disk_size += len(blob)
+        if _disk_size <= DISK_LIMIT:
+            return
+        # Over budget: drop least recently used files down to 90% of the limit.
+        for _, size, old in sorted(_disk_entries()):
+            if _disk_size <= DISK_LIMIT * 0.9:
+                break
+            try:
+                os.remove(old)
+                _disk_size -= size
+            except OSError:
+                pass
+
+
+def content_cache(tool, cache_if=None):
+    """Decorator: cache a pure function's results by content (see module docstring).
+
+    `cache_if(result)` can veto storing a result, e.g. one that reports an error.
+    The undecorated function stays available as `.uncached`.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not MEMORY_LIMIT and not DISK_DIR:
+                return func(*args, **kwargs)
+            key = _key(tool, func.__qualname__, args, kwargs)
+            with _lock:
+                blob = _memory.get(key)
+                if blob is not None:
+                    _memory.move_to_end(key)
+                    _count(tool, "memory")
+            if blob is None and DISK_DIR:
+                blob = _disk_get(key)
+                if blob is not None:
+                    with _lock:
+                        _remember(key, blob)
+                        _count(tool, "disk")
+            if blob is not None:
+                return pickle.loads(blob)
+
+            result = func(*args, **kwargs)
+            with _lock:
+                _count(tool, "miss")
+            if cache_if is not None and not cache_if(result):
+                return result
+            blob = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+            with _lock:
+                _remember(key, blob)
+            if DISK_DIR:
+                try:
+                    _disk_put(key, blob)
+                except OSError:
+                    pass  # a full or read-only disk shouldn't break the tool
+            return result
+
+        wrapper.uncached = func
+        return wrapper
+    return decorator
+
+
+def stats():
+    """One row per tool: hits per tier, misses and hit rate, plus overall tier sizes."""
+    with _lock:
+        rows = []
+        for tool, c in sorted(_counters.items()):
+            total = c["memory"] + c["disk"] + c["miss"]
+            rows.append({"tool": tool, "hits_memory": c["memory"], "hits_disk": c["disk"], "misses": c["miss"],
+                         "hit_rate": round((c["memory"] + c["disk"]) / total, 3) if total else None})
+        return {"rows": rows, "memory_entries": len(_memory), "memory_mb": round(_memory_size / 1048576, 1),
+                "disk_mb": round((_disk_size or 0) / 1048576, 1) if DISK_DIR else None}
+
+
+def clear():
+    """Drop the memory tier and reset the counters (the disk tier is left alone)."""
+    global _memory_size
+    with _lock:
+        _memory.clear()
+        _memory_size = 0
+        _counters.clear()
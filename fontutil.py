@@ -0,0 +1,127 @@
+"""Font registry shared by the Pillow tools and pdfutil. Lives at repo root so
+main.py doesn't list it as a tool.
+
+    font(40, "sans-bold", "sans")   # cached FreeTypeFont; first face found wins
+    add_pdf_fonts(pdf)              # DejaVu on a fresh FPDF, without re-parsing the TTFs
+
+Font files are located once per process: system DejaVu first (fonts-dejavu-core
+in the Docker image), then the copies bundled with matplotlib, which is always
+installed (located without importing it). CJK glyphs are not covered by DejaVu.
+
+Pillow fonts are kept in an LRU per (size, faces), so a batch of certificates
+opens each face and size once instead of once per item. fpdf2 parses a TTF with
+fontTools on every add_font (~50 ms per face); here the faces are parsed once
+into a template document and copied into each new one instead. `stats()`
+reports hits and loads for both (shown on the metrics page).
+"""
+import copy
+import functools
+import importlib.util
+import os
+import threading
+
+from PIL import ImageFont
+
+SYSTEM_DIR = "/usr/share/fonts/truetype/dejavu"
+
+FACES = {
+    "sans": "DejaVuSans.ttf",
+    "sans-bold": "DejaVuSans-Bold.ttf",
+    "sans-italic": "DejaVuSans-Oblique.ttf",
+    "serif": "DejaVuSerif.ttf",
+    "serif-bold": "DejaVuSerif-Bold.ttf",
+}
+
+# fpdf2 style -> face registered under the "DejaVu" family.
+PDF_STYLES = {"": "sans", "B": "sans-bold", "I": "sans-italic"}
+
+_pdf_lock = threading.Lock()
+_pdf_template = None
+_pdf_copies = 0
+
+
+@functools.lru_cache(maxsize=1)
+def _matplotlib_dir():
+    # Locate the package on disk without importing it (matplotlib is slow to import).
+    try:
+        spec = importlib.util.find_spec("matplotlib")
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    return os.path.join(spec.submodule_search_locations[0], "mpl-data", "fonts", "ttf")
+
+
+@functools.lru_cache(maxsize=None)
+def font_path(face):
+    """Path of a face's TTF file, or None when it isn't installed."""
+    for folder in (SYSTEM_DIR, _matplotlib_dir()):
+        if folder and os.path.exists(os.path.join(folder, FACES[face])):
+            return os.path.join(folder, FACES[face])
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _font(size, faces):
+    for face in faces:
+        # A bare file name lets Pillow search the OS font folders as a last resort.
+        try:
+            return ImageFont.truetype(font_path(face) or FACES[face], size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+
+def font(size, *faces):
+    """A Pillow font of `size` px in the first available face (default "sans").
+
+    Fonts are shared between callers and sessions: draw with them, don't mutate them.
+    """
+    return _font(int(size), faces or ("sans",))
+
+
+def _template():
+    """An empty FPDF holding the parsed DejaVu faces (None without a regular face). Caller holds _pdf_lock."""
+    global _pdf_template
+    if _pdf_template is None:
+        from fpdf import FPDF
+        paths = {style: font_path(face) for style, face in PDF_STYLES.items()}
+        template = False
+        if paths[""]:
+            template = FPDF()
+            for style, path in paths.items():
+                if path:
+                    template.add_font("DejaVu", style, path)
+        _pdf_template = template
+    return _pdf_template or None
+
+
+def add_pdf_fonts(pdf):
+    """Register DejaVu (regular, bold, italic where installed) on a fresh FPDF; return the family to use.
+
+    Copies the template's parsed fonts instead of calling add_font, so the TTFs
+    aren't re-parsed. fpdf2 numbers fonts per document, so `pdf` must not have
+    any fonts yet. Falls back to "Helvetica" (Latin-1 only) without DejaVu.
+    """
+    global _pdf_copies
+    with _pdf_lock:  # the copy reads tables fontTools loads lazily
+        template = _template()
+        if template is None:
+            return "Helvetica"
+        fonts = copy.deepcopy(template.fonts)
+        _pdf_copies += 1
+    from fontTools import ttLib  # installed with fpdf2
+    for f in fonts.values():
+        # fpdf2's deepcopy shares the fontTools font, which output() subsets in place:
+        # give each document its own (a lazy open reads only the table directory).
+        f.ttfont = ttLib.TTFont(f.ttffile, recalcTimestamp=False,
+                                fontNumber=getattr(f, "collection_font_number", 0), lazy=True)
+    pdf.fonts.update(fonts)
+    return "DejaVu"
+
+
+def stats():
+    """Pillow font cache hits/loads and PDF documents served from the parsed template."""
+    info = _font.cache_info()
+    return {"pillow_hits": info.hits, "pillow_loads": info.misses, "pillow_cached": info.currsize,
+            "pdf_documents": _pdf_copies}
@@ -0,0 +1,70 @@
+"""Two-colour gradients for the image tools. Lives at repo root so main.py
+doesn't list it as a tool.
+
+    img = gradient((2048, 1152), "#3f37c9", "#4895ef", "horizontal")
+    colors = ramp("#000000", "#ff0000", 255)      # (255, 3) uint8, e.g. for a palette
+
+The blend mask is computed in one NumPy pass from cached 1-D axis ramps —
+instead of one Python-level `px[x, y] = v` per pixel.
+"""
+import functools
+import math
+
+import numpy as np
+from PIL import Image, ImageColor
+
+DIRECTIONS = ("horizontal", "vertical", "diagonal", "radial")
+
+
+def _rgb(color):
+    return ImageColor.getrgb(color)[:3] if isinstance(color, str) else tuple(color)[:3]
+
+
+@functools.lru_cache(maxsize=64)
+def ramp(c1, c2, steps=256):
+    """`steps` colours from `c1` to `c2` inclusive, as a shared read-only (steps, 3) uint8 array."""
+    a = np.array(_rgb(c1), dtype=np.float32)
+    b = np.array(_rgb(c2), dtype=np.float32)
+    out = np.rint(a + (b - a) * np.linspace(0, 1, steps, dtype=np.float32)[:, None]).astype(np.uint8)
+    out.flags.writeable = False
+    return out
+
+
+@functools.lru_cache(maxsize=64)
+def _axis(n):
+    """0 → 1 over `n` pixels, as a shared read-only float32 vector (n * 4 bytes)."""
+    out = np.linspace(0, 1, n, dtype=np.float32) if n > 1 else np.zeros(n, dtype=np.float32)
+    out.flags.writeable = False
+    return out
+
+
+def mask(size, direction="horizontal"):
+    """L-mode mask going from 0 (first colour) to 255 (second colour).
+
+    horizontal: left → right; vertical: top → bottom; diagonal: top-left →
+    bottom-right; radial: centre → corners. Only the 1-D ramps are cached:
+    uploads come in every size, and a cached full-size mask per size would pin
+    megabytes per entry across sessions.
+    """
+    w, h = size
+    if direction == "horizontal":
+        level = np.broadcast_to(_axis(w)[None, :], (h, w))
+    elif direction == "vertical":
+        level = np.broadcast_to(_axis(h)[:, None], (h, w))
+    elif direction in ("diagonal", "radial"):
+        x = np.arange(w, dtype=np.float32)[None, :]
+        y = np.arange(h, dtype=np.float32)[:, None]
+        if direction == "diagonal":
+            level = (x + y) / max(1, w + h - 2)
+        else:
+            cx, cy = (w - 1) / 2, (h - 1) / 2
+            level = np.hypot(x - cx, y - cy) / max(1.0, math.hypot(cx, cy))
+    else:
+        raise ValueError(f"Unknown gradient direction: {direction!r}")
+    return Image.fromarray((level * 255).astype(np.uint8))
+
+
+def gradient(size, c1, c2, direction="horizontal", mode="RGB"):
+    """An image of `size` blending colour `c1` into `c2` (hex strings or RGB tuples)."""
+    size = tuple(size)
+    return Image.composite(Image.new(mode, size, c2), Image.new(mode, size, c1), mask(size, direction))
@@ -0,0 +1,52 @@
+"""Deferred imports for heavy libraries. Lives at repo root so main.py doesn't
+list it as a tool.
+
+    plt = lazy_import("matplotlib.pyplot", before=_use_agg)
+
+binds a module stand-in at import time; the real import happens on the first
+attribute access (i.e. when the tool actually renders something with it), so
+opening a tool — or starting the app — doesn't pay for matplotlib, markitdown,
+Faker, gTTS, PyPDF2, EbookLib or sqlparse up front.
+"""
+import importlib
+import threading
+import types
+
+_lock = threading.RLock()
+
+
+class LazyModule(types.ModuleType):
+    """Module stand-in that imports the real module on first attribute access."""
+
+    def __init__(self, name, before=None):
+        super().__init__(name)
+        self._before = before
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            with _lock:
+                if self._module is None:
+                    if self._before is not None:
+                        self._before()
+                    self._module = importlib.import_module(self.__name__)
+        return self._module
+
+    @property
+    def loaded(self):
+        return self._module is not None
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name, before=None):
+    """Return a stand-in for module `name`; `before()` runs once, right before the import."""
+    return LazyModule(name, before)
@@ -2,11 +2,12 @@ import streamlit as st
 import os
 import re
 import html
-import importlib.util
 from collections import defaultdict
 from urllib.parse import quote
-from translations import translations
-from views import about, privacy, imprint
+from translations import LANGUAGES, for_lang
+from toolutil import load_tool, SERVICES_DIR
+from perfutil import measure
+from views import about, privacy, imprint, metrics
 
 REPO_URL = "https://github.com/vasylm1/my-tools-hub"
 
@@ -181,11 +182,10 @@ h1 { font-weight:800; }
 """, unsafe_allow_html=True)
 
 # 🌍 Language selector — shared across every page
-languages = list(translations.keys())
-lang = st.sidebar.selectbox("🌍 Language", languages, index=0)
+lang = st.sidebar.selectbox("🌍 Language", LANGUAGES, index=0)
 st.sidebar.markdown(f"<a href='{REPO_URL}' target='_blank' style='font-size:.85rem;color:#64748b;text-decoration:none;'>↗ GitHub</a>", unsafe_allow_html=True)
-# Merge over English so any key missing in the selected language never crashes.
-t = {**translations.get("English", {}), **translations.get(lang, {})}
+# Precompiled over English, so any key missing in the selected language never crashes.
+t = for_lang(lang)
 
 # Safe defaults for this file's own UI strings (resilient to a partial deploy).
 _UI_DEFAULTS = {
@@ -204,13 +204,11 @@ def ui(key):
 
 
 def _run_tool(filename):
-    services_dir = os.path.join(os.path.dirname(__file__), "services")
-    file_path = os.path.join(services_dir, filename)
-    spec = importlib.util.spec_from_file_location("tool_module", file_path)
-    tool_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(tool_module)
+    # Imported once per process (and per file mtime); reruns only call run().
+    tool_module = load_tool(filename)
     if hasattr(tool_module, "run"):
-        tool_module.run(lang)
+        with measure(filename):
+            tool_module.run(lang)
 
 
 def _member_label(fname):
@@ -234,11 +232,83 @@ def _run_group(gid):
     _run_tool(label_to_file[choice])
 
 
+def _services_mtime():
+    """Directory mtime of services/: changes when a tool file is added or removed."""
+    os.makedirs(SERVICES_DIR, exist_ok=True)
+    return os.stat(SERVICES_DIR).st_mtime_ns
+
+
+@st.cache_resource(show_spinner=False)
+def _scan_services(mtime):
+    """Tool id -> service filename, rescanned only when services/ changes."""
+    return {f[:-3]: f for f in sorted(os.listdir(SERVICES_DIR)) if f.endswith(".py")}
+
+
+# The landing-page caches below take `lang` as their key; `t` (and so ui() and
+# _member_label()) is derived from `lang` alone, so it is safe to read inside them.
+@st.cache_resource(show_spinner=False)
+def _landing_index(lang, mtime):
+    """Prebuilt per-language landing data.
+
+    Returns (categories, index): categories in display order, and per category
+    its header HTML plus a tuple of (search haystack, card HTML) sorted by label.
+    """
+    by_id = _scan_services(mtime)
+    # Entries per category: (label, href_id, haystack). Groups first, then ungrouped tools.
+    by_cat = defaultdict(list)
+    for gid, (cat_key, _, members) in TOOL_GROUPS.items():
+        label = ui("group_" + gid)
+        haystack = (label + " " + " ".join(_member_label(m) for m in members)).lower()
+        by_cat[cat_key].append((label, "group:" + gid, haystack))
+    for fid, fname in by_id.items():
+        if fname in GROUPED_FILES:
+            continue
+        cat_key, title_key = TOOL_REGISTRY.get(fid, ("cat_other", None))
+        label = t.get(title_key, fid) if title_key else fid
+        by_cat[cat_key].append((label, fid, label.lower()))
+
+    categories = tuple([c for c in CATEGORY_ORDER if c in by_cat] + [c for c in by_cat if c not in CATEGORY_ORDER])
+    index = {}
+    for cat in categories:
+        color = CAT_COLORS.get(cat, "#4f46e5")
+        head = f'<div class="cat-head" style="--cat:{color}">{html.escape(_noemoji(ui(cat)))}</div>'
+        cards = []
+        for label, href_id, haystack in sorted(by_cat[cat]):
+            badge = html.escape((label.strip()[:1] or "•").upper())
+            grp = " tc-group" if href_id.startswith("group:") else ""
+            cards.append((haystack,
+                          f'<a class="tool-card{grp}" style="--cat:{color}" href="?tool={quote(href_id)}" target="_self">'
+                          f'<span class="tc-badge">{badge}</span>'
+                          f'<span class="tc-name">{html.escape(label)}</span></a>'))
+        index[cat] = (head, tuple(cards))
+    return categories, index
+
+
+@st.cache_resource(show_spinner=False, max_entries=512)
+def _grid_blocks(lang, sel_cat, query, mtime):
+    """Card-grid HTML, one block per category, for a language + filter + search query."""
+    categories, index = _landing_index(lang, mtime)
+    blocks = []
+    for cat in categories:
+        if sel_cat is not None and cat != sel_cat:
+            continue
+        head, cards = index[cat]
+        html_cards = "".join(card for haystack, card in cards if not query or query in haystack)
+        if html_cards:
+            blocks.append(f'{head}<div class="tool-grid">{html_cards}</div>')
+    return tuple(blocks)
+
+
 def tools_page():
     """Searchable card grid: pick a tool or group to open it (?tool=<id>)."""
-    services_dir = os.path.join(os.path.dirname(__file__), "services")
-    os.makedirs(services_dir, exist_ok=True)
-    by_id = {f[:-3]: f for f in sorted(os.listdir(services_dir)) if f.endswith(".py")}
+    mtime = _services_mtime()
+    by_id = _scan_services(mtime)
+
+    # Hidden metrics page (?admin=<key>); see views/metrics.py.
+    admin = st.query_params.get("admin")
+    if admin and metrics.allowed(admin):
+        metrics.render(t)
+        return
 
     active = st.query_params.get("tool")
     # A group page
@@ -262,11 +332,7 @@ def tools_page():
     )
 
     # Categories that actually contain tools (for the filter).
-    present = {cat for cat, _, _ in TOOL_GROUPS.values()}
-    for fid, fname in by_id.items():
-        if fname not in GROUPED_FILES:
-            present.add(TOOL_REGISTRY.get(fid, ("cat_other", None))[0])
-    ordered = [c for c in CATEGORY_ORDER if c in present] + [c for c in present if c not in CATEGORY_ORDER]
+    ordered, _ = _landing_index(lang, mtime)
 
     query = st.text_input("search", placeholder="🔍  " + ui("tools_search"), label_visibility="collapsed").strip().lower()
     all_label = ui("cat_all")
@@ -279,44 +345,12 @@ def tools_page():
         chosen = st.radio("filter", options, horizontal=True, label_visibility="collapsed")
     sel_cat = label_to_cat.get(chosen) if (chosen and chosen != all_label) else None
 
-    # Entries per category: (label, href_id). Groups first, then ungrouped tools.
-    by_cat = defaultdict(list)
-    for gid, (cat_key, _, members) in TOOL_GROUPS.items():
-        label = ui("group_" + gid)
-        haystack = (label + " " + " ".join(_member_label(m) for m in members)).lower()
-        if query and query not in haystack:
-            continue
-        by_cat[cat_key].append((label, "group:" + gid))
-    for fid, fname in by_id.items():
-        if fname in GROUPED_FILES:
-            continue
-        cat_key, title_key = TOOL_REGISTRY.get(fid, ("cat_other", None))
-        label = t.get(title_key, fid) if title_key else fid
-        if query and query not in label.lower():
-            continue
-        by_cat[cat_key].append((label, fid))
-
-    categories = [c for c in CATEGORY_ORDER if c in by_cat] + [c for c in by_cat if c not in CATEGORY_ORDER]
-    if sel_cat is not None:
-        categories = [c for c in categories if c == sel_cat]
-    if not categories:
+    blocks = _grid_blocks(lang, sel_cat, query, mtime)
+    if not blocks:
         st.info(ui("tools_none"))
         return
-
-    for cat in categories:
-        color = CAT_COLORS.get(cat, "#4f46e5")
-        cat_label = html.escape(_noemoji(ui(cat)))
-        cards = ""
-        for label, href_id in sorted(by_cat[cat]):
-            badge = html.escape((label.strip()[:1] or "•").upper())
-            grp = " tc-group" if href_id.startswith("group:") else ""
-            cards += (
-                f'<a class="tool-card{grp}" style="--cat:{color}" href="?tool={quote(href_id)}" target="_self">'
-                f'<span class="tc-badge">{badge}</span>'
-                f'<span class="tc-name">{html.escape(label)}</span></a>'
-            )
-        st.markdown(f'<div class="cat-head" style="--cat:{color}">{cat_label}</div>'
-                    f'<div class="tool-grid">{cards}</div>', unsafe_allow_html=True)
+    for block in blocks:
+        st.markdown(block, unsafe_allow_html=True)
 
 
 # 🧭 Multipage navigation
@@ -2,53 +2,97 @@
 doesn't treat it as a tool. Always registers a Unicode font (DejaVu) so
 Latin + Cyrillic text renders; CJK glyphs are not covered by DejaVu.
 
-Font sources (first that exists wins, per style):
-  1. system DejaVu (e.g. fonts-dejavu-core in the Docker image)
-  2. the DejaVu fonts bundled with matplotlib (always installed — it's a dep)
-"""
-import os
-from fpdf import FPDF
-
-_SYSTEM = {
-    "": "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-    "B": "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-    "I": "/usr/share/fonts/truetype/dejavu/DejaVuSans-Oblique.ttf",
-}
+Font files are located and parsed once per process by fontutil (system
+DejaVu, else the copies bundled with matplotlib).
 
+merge_pdfs() concatenates PDFs rendered separately (e.g. shards from the
+worker pool) and stores images that are identical across them (a logo) once.
+"""
+import hashlib
+import io
 
-def _matplotlib_fonts():
-    try:
-        import matplotlib
-        ttf = os.path.join(matplotlib.get_data_path(), "fonts", "ttf")
-        return {"": os.path.join(ttf, "DejaVuSans.ttf"),
-                "B": os.path.join(ttf, "DejaVuSans-Bold.ttf"),
-                "I": os.path.join(ttf, "DejaVuSans-Oblique.ttf")}
-    except Exception:
-        return {}
-
+from fpdf import FPDF
+from fontutil import add_pdf_fonts
+from lazyutil import lazy_import
 
-def _font_paths():
-    mpl = _matplotlib_fonts()
-    paths = {}
-    for style in ("", "B", "I"):
-        if os.path.exists(_SYSTEM[style]):
-            paths[style] = _SYSTEM[style]
-        elif style in mpl and os.path.exists(mpl[style]):
-            paths[style] = mpl[style]
-    return paths
+PyPDF2 = lazy_import("PyPDF2")
 
 
 def make_pdf(orientation="P", fmt="A4", unit="mm"):
     """Return (FPDF, font_family). Uses DejaVu (Unicode) when available, else Helvetica."""
     pdf = FPDF(orientation=orientation, format=fmt, unit=unit)
     pdf.set_auto_page_break(auto=True, margin=15)
-    paths = _font_paths()
-    if "" in paths:
-        for style, path in paths.items():
-            pdf.add_font("DejaVu", style, path)
-        return pdf, "DejaVu"
-    return pdf, "Helvetica"
+    return pdf, add_pdf_fonts(pdf)
 
 
 def pdf_bytes(pdf):
     return bytes(pdf.output())
+
+
+def _feed(h, obj, seen):
+    """Hash a PDF object's content, following references (so copies in different files match)."""
+    generic = PyPDF2.generic
+    if isinstance(obj, generic.IndirectObject):
+        if obj.idnum in seen:
+            h.update(b"<cycle>")
+            return
+        seen.add(obj.idnum)
+        obj = obj.get_object()
+    if isinstance(obj, generic.StreamObject):
+        h.update(obj._data)  # as stored: decoding can fail (e.g. PNG predictors) and isn't needed
+    if isinstance(obj, generic.DictionaryObject):
+        for key in sorted(obj):
+            if key not in ("/Length", "/Parent"):
+                h.update(key.encode())
+                _feed(h, obj.raw_get(key), seen)
+    elif isinstance(obj, generic.ArrayObject):
+        for item in obj:
+            _feed(h, item, seen)
+    else:
+        h.update(repr(obj).encode())
+
+
+def merge_pdfs(parts):
+    """Concatenate PDFs (bytes, in order) into one and return its bytes.
+
+    Before a page is copied in, each /Font and /XObject it uses that is
+    identical to one already copied from an earlier part is re-pointed at that
+    copy, so a logo shared by every part is stored once. Fonts rarely qualify:
+    fpdf2 embeds a subset of the glyphs each part uses, so every part normally
+    keeps its own subset. The output has no timestamps or random IDs: the same
+    parts give the same bytes.
+    """
+    writer = PyPDF2.PdfWriter()
+    written = {}  # content digest -> reference in the writer
+    for part in parts:
+        reader = PyPDF2.PdfReader(io.BytesIO(part))
+        digests = {}  # idnum in this part -> content digest
+        for page in reader.pages:
+            pending = []
+            resources = page.get("/Resources")  # fpdf2 shares one dict between all pages
+            resources = resources.get_object() if resources is not None else {}
+            for kind in ("/Font", "/XObject"):
+                entries = resources.get(kind)
+                if entries is None:
+                    continue
+                entries = entries.get_object()
+                for name in list(entries):
+                    ref = entries.raw_get(name)
+                    if not isinstance(ref, PyPDF2.generic.IndirectObject) or ref.pdf is not reader:
+                        continue
+                    if ref.idnum not in digests:
+                        h = hashlib.sha256()
+                        _feed(h, ref, set())
+                        digests[ref.idnum] = h.digest()
+                    digest = digests[ref.idnum]
+                    if digest in written:
+                        entries[name] = written[digest]
+                    else:
+                        pending.append((kind, name, digest))
+            copied = writer.add_page(page)
+            for kind, name, digest in pending:
+                copied_entries = copied["/Resources"][kind]
+                written.setdefault(digest, copied_entries.raw_get(name))
+    buf = io.BytesIO()
+    writer.write(buf)
+    return buf.getvalue()
@@ -0,0 +1,133 @@
+"""Per-tool run metrics for capacity planning. Lives at repo root so main.py
+doesn't list it as a tool.
+
+main._run_tool wraps every `run(lang)` in `measure(filename)`, which records
+wall time, CPU time of the script thread, upload bytes seen by any `file_uploader`
+and — when memory tracing is on — the peak `tracemalloc` allocation. Samples go
+into a bounded ring buffer per tool; `summary()` turns them into p50/p95/p99 rows
+for the hidden metrics view (views/metrics.py).
+
+Memory tracing slows every allocation in the process, so it is off unless
+TOOLS_TRACEMALLOC=1 is set (or it is switched on from the metrics view). The
+tracemalloc peak is process-wide: with concurrent sessions it is an upper bound.
+"""
+import csv
+import io
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+
+import streamlit as st
+from streamlit.delta_generator import DeltaGenerator
+
+MAX_SAMPLES = 500  # per tool
+PERCENTILES = (50, 95, 99)
+METRICS = ("wall_ms", "cpu_ms", "peak_kb", "upload_kb")
+
+_samples = {}  # tool filename -> deque of sample dicts
+_lock = threading.Lock()
+_local = threading.local()
+
+
+def _count_uploads(uploader):
+    def file_uploader(*args, **kwargs):
+        files = uploader(*args, **kwargs)
+        if getattr(_local, "upload", None) is not None and files:
+            for f in files if isinstance(files, list) else [files]:
+                _local.upload += getattr(f, "size", 0) or 0
+        return files
+    file_uploader._counts_uploads = True
+    return file_uploader
+
+
+# Patch the class so uploaders in columns, containers, forms and the sidebar are counted
+# too; `st.file_uploader` is a method bound to the main DeltaGenerator at import time.
+if not getattr(DeltaGenerator.file_uploader, "_counts_uploads", False):
+    DeltaGenerator.file_uploader = _count_uploads(DeltaGenerator.file_uploader)
+if not getattr(st.file_uploader, "_counts_uploads", False):
+    st.file_uploader = _count_uploads(st.file_uploader)
+
+if os.environ.get("TOOLS_TRACEMALLOC") == "1" and not tracemalloc.is_tracing():
+    tracemalloc.start()
+
+
+def set_memory_tracing(on):
+    """Switch tracemalloc on or off for the whole process."""
+    if on and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    elif not on and tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+@contextmanager
+def measure(tool):
+    """Record one run of `tool` (a service filename) into its ring buffer."""
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.reset_peak()
+    _local.upload = 0
+    wall, cpu = time.perf_counter(), time.thread_time()
+    error = None
+    try:
+        yield
+    except Exception as e:  # Streamlit's rerun/stop signals are not Exceptions
+        error = type(e).__name__
+        raise
+    finally:
+        sample = {
+            "ts": time.time(),
+            "wall_ms": (time.perf_counter() - wall) * 1000,
+            "cpu_ms": (time.thread_time() - cpu) * 1000,
+            "peak_kb": tracemalloc.get_traced_memory()[1] / 1024 if tracing and tracemalloc.is_tracing() else None,
+            "upload_kb": _local.upload / 1024,
+            "error": error,
+        }
+        _local.upload = None
+        with _lock:
+            _samples.setdefault(tool, deque(maxlen=MAX_SAMPLES)).append(sample)
+
+
+def _percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    k = max(0, min(len(sorted_values) - 1, -(-p * len(sorted_values) // 100) - 1))
+    return sorted_values[k]
+
+
+def samples():
+    """Snapshot of all samples as flat rows (tool first), oldest first per tool."""
+    with _lock:
+        return [{"tool": tool, **s} for tool, buf in sorted(_samples.items()) for s in buf]
+
+
+def summary():
+    """One row per tool: run/error counts plus p50/p95/p99 of every metric."""
+    with _lock:
+        snapshot = {tool: list(buf) for tool, buf in _samples.items()}
+    rows = []
+    for tool, runs in sorted(snapshot.items()):
+        row = {"tool": tool, "runs": len(runs), "errors": sum(1 for s in runs if s["error"])}
+        for metric in METRICS:
+            values = sorted(s[metric] for s in runs if s[metric] is not None)
+            for p in PERCENTILES:
+                row[f"{metric}_p{p}"] = round(_percentile(values, p), 1) if values else None
+        rows.append(row)
+    return rows
+
+
+def to_csv(rows):
+    """CSV text for a list of dict rows (header from the first row)."""
+    if not rows:
+        return ""
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=list(rows[0].keys()))
+    writer.writeheader()
+    writer.writerows(rows)
+    return buf.getvalue()
+
+
+def clear():
+    with _lock:
+        _samples.clear()
@@ -1,10 +1,24 @@
+import io
 from PIL import Image
 import streamlit as st
-from translations import translations
+from translations import for_lang
+from cacheutil import content_cache
+
+
+@content_cache("Brand palette")
+def _palette(data, n):
+    """The n most frequent colors (HEX, most frequent first) of an image given as bytes."""
+    small = Image.open(io.BytesIO(data)).convert("RGB")
+    small.thumbnail((200, 200))
+    quant = small.quantize(colors=n, method=Image.MEDIANCUT)
+    palette = quant.getpalette()
+    # getcolors() -> list of (count, palette_index); sort by frequency desc.
+    counts = sorted(quant.getcolors() or [], reverse=True)[:n]
+    return ["#{:02X}{:02X}{:02X}".format(*palette[idx * 3:idx * 3 + 3]) for _, idx in counts]
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["palette_title"])
 
     up = st.file_uploader(t["palette_upload"], type=["png", "jpg", "jpeg", "webp", "bmp"])
@@ -13,7 +27,7 @@ def run(lang):
         return
 
     try:
-        img = Image.open(up).convert("RGB")
+        Image.open(up)  # header check only; decoding happens (once) in _palette
     except Exception as e:
         st.error(f"{t['palette_error']} {e}")
         return
@@ -21,19 +35,16 @@ def run(lang):
     if not st.button("🎨 " + t["palette_extract"]):
         return
 
-    small = img.copy()
-    small.thumbnail((200, 200))
-    quant = small.quantize(colors=n, method=Image.MEDIANCUT)
-    palette = quant.getpalette()
-    # getcolors() -> list of (count, palette_index); sort by frequency desc.
-    counts = sorted(quant.getcolors() or [], reverse=True)[:n]
+    try:
+        colors = _palette(up.getvalue(), n)
+    except Exception as e:  # truncated or corrupt image data past the header
+        st.error(f"{t['palette_error']} {e}")
+        return
 
     st.subheader(t["palette_result"])
-    cols = st.columns(len(counts) or 1)
+    cols = st.columns(len(colors) or 1)
     css_lines = []
-    for i, (_, idx) in enumerate(counts):
-        r, g, b = palette[idx * 3:idx * 3 + 3]
-        hex_code = f"#{r:02X}{g:02X}{b:02X}"
+    for i, hex_code in enumerate(colors):
         with cols[i]:
             st.markdown(
                 f"<div style='background:{hex_code};height:64px;border-radius:8px;border:1px solid #ddd'></div>",
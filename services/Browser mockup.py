@@ -1,23 +1,14 @@
 import io
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 import streamlit as st
-from translations import translations
+from translations import for_lang
+import fontutil
 
-FONT_PATHS = ["/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"]
 BAR = 44
 
 
-def _font(size):
-    for p in FONT_PATHS:
-        try:
-            return ImageFont.truetype(p, size)
-        except Exception:
-            continue
-    return ImageFont.load_default()
-
-
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["brow_title"])
 
     up = st.file_uploader(t["brow_upload"], type=["png", "jpg", "jpeg", "webp"])
@@ -37,7 +28,7 @@ def run(lang):
         cx = 18 + i * 20
         d.ellipse([cx, BAR // 2 - 6, cx + 12, BAR // 2 + 6], fill=col)
     d.rounded_rectangle([90, 9, W - 16, BAR - 9], radius=12, fill="#ffffff")
-    d.text((104, BAR // 2 - 8), url[:80], font=_font(15), fill="#6b7280")
+    d.text((104, BAR // 2 - 8), url[:80], font=fontutil.font(15, "sans"), fill="#6b7280")
 
     canvas.paste(shot, (0, BAR))
     buf = io.BytesIO()
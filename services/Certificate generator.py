@@ -1,9 +1,10 @@
 import io
 import streamlit as st
 from PIL import Image
-from translations import translations
-from pdfutil import make_pdf, pdf_bytes
-from tablutil import read_table, template_bytes, TEMPLATE_MIME
+from translations import for_lang
+from batchutil import pool_map
+from pdfutil import make_pdf, merge_pdfs, pdf_bytes
+from tablutil import read_table, columns, template_bytes, TEMPLATE_MIME
 
 STYLES = {
     "classic": dict(accent=(67, 97, 238), border="double", title=(67, 97, 238), name=(20, 20, 20), sub=(90, 90, 90)),
@@ -12,8 +13,21 @@ STYLES = {
     "minimal": dict(accent=(17, 24, 39), border="thin", title=(17, 24, 39), name=(17, 24, 39), sub=(156, 163, 175)),
 }
 
+# Pages per worker task. Fixed (not derived from the worker count) so the merged
+# PDF is byte-for-byte the same whatever machine renders it, and small so that
+# batches of a few hundred names already spread over every worker.
+SHARD_PAGES = 40
 
-def _draw(pdf, fam, recipient, text, signer, cdate, style, logo):
+
+def _aspect(logo):
+    try:
+        im = Image.open(io.BytesIO(logo))
+        return im.width / im.height
+    except Exception:
+        return 1.0
+
+
+def _draw(pdf, fam, recipient, text, signer, cdate, style, logo, aspect=1.0):
     s = STYLES.get(style, STYLES["classic"])
     a = s["accent"]
     pdf.add_page()
@@ -36,12 +50,8 @@ def _draw(pdf, fam, recipient, text, signer, cdate, style, logo):
 
     y = 30
     if logo:
-        try:
-            im = Image.open(io.BytesIO(logo))
-            aspect = im.width / im.height
-        except Exception:
-            aspect = 1.0
         lw = 20 * aspect
+        # Same BytesIO contents every page: fpdf2 keys images by content and embeds them once.
         pdf.image(io.BytesIO(logo), x=(W - lw) / 2, y=16, h=20)
         y = 44
 
@@ -61,8 +71,16 @@ def _draw(pdf, fam, recipient, text, signer, cdate, style, logo):
         pdf.cell(0, 8, line, align="C", new_x="LMARGIN", new_y="NEXT")
 
 
+def render_pages(names, text, signer, cdate, style, logo=None, aspect=1.0):
+    """One certificate page per name, as PDF bytes (a shard of a batch; see merge_pdfs)."""
+    pdf, fam = make_pdf(orientation="L")
+    for name in names:
+        _draw(pdf, fam, name, text, signer, cdate, style, logo, aspect)
+    return pdf_bytes(pdf)
+
+
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["cert_title"])
 
     mode_map = {t["batch_single"]: "single", t["batch_multi"]: "batch"}
@@ -85,7 +103,7 @@ def run(lang):
             st.warning(t["cert_empty"])
             return
         pdf, fam = make_pdf(orientation="L")
-        _draw(pdf, fam, recipient, text, signer, cdate, style, logo)
+        _draw(pdf, fam, recipient, text, signer, cdate, style, logo, _aspect(logo) if logo else 1.0)
         st.download_button("⬇️ " + t["cert_download"], pdf_bytes(pdf), file_name="certificate.pdf", mime="application/pdf")
         return
 
@@ -98,16 +116,17 @@ def run(lang):
     up = st.file_uploader(t["batch_upload"], type=["csv", "xlsx", "xls"])
     if not up:
         return
-    df = read_table(up)
-    col = st.selectbox(t["batch_name_col"], list(df.columns))
+    col = st.selectbox(t["batch_name_col"], columns(up))
     if not st.button("🏆 " + t["batch_generate"]):
         return
+    df = read_table(up, usecols=[col], dtype=str)
     names = [str(v).strip() for v in df[col].dropna() if str(v).strip()]
     if not names:
         st.warning(t["batch_empty"])
         return
-    pdf, fam = make_pdf(orientation="L")
-    for name in names:
-        _draw(pdf, fam, name, text, signer, cdate, style, logo)
+    aspect = _aspect(logo) if logo else 1.0
+    shards = [(names[i:i + SHARD_PAGES], text, signer, cdate, style, logo, aspect)
+              for i in range(0, len(names), SHARD_PAGES)]
+    data = merge_pdfs(pool_map(render_pages, shards, total=len(shards)))
     st.success(f"{t['batch_done']}: {len(names)}")
-    st.download_button("⬇️ " + t["cert_download"], pdf_bytes(pdf), file_name="certificates.pdf", mime="application/pdf")
+    st.download_button("⬇️ " + t["cert_download"], data, file_name="certificates.pdf", mime="application/pdf")
@@ -1,17 +1,16 @@
 import io
-import zipfile
 import re
-from PIL import Image, ImageDraw, ImageFont
+import functools
+from PIL import Image, ImageDraw
 import streamlit as st
-from translations import translations
-from tablutil import read_table, template_bytes, TEMPLATE_MIME
-
-FONTS = {
-    "B": "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-    "": "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-    "S": "/usr/share/fonts/truetype/dejavu/DejaVuSerif.ttf",
-    "SB": "/usr/share/fonts/truetype/dejavu/DejaVuSerif-Bold.ttf",
-}
+from translations import for_lang
+from tablutil import read_table, columns, template_bytes, TEMPLATE_MIME
+from batchutil import pool_map
+from ziputil import ZipSink
+import fontutil
+
+W, H = 1200, 850
+LOGO_H = 90  # logo height in px
 
 # Each style: accent color, background, name color, sub color, border kind, serif flag.
 STYLES = {
@@ -23,13 +22,10 @@ STYLES = {
 
 
 def _font(size, bold=False, serif=False):
-    keys = (("SB", "S", "B", "") if bold else ("S", "SB", "", "B")) if serif else (("B", "") if bold else ("", "B"))
-    for k in keys:
-        try:
-            return ImageFont.truetype(FONTS[k], size)
-        except Exception:
-            continue
-    return ImageFont.load_default()
+    sans = ("sans-bold", "sans") if bold else ("sans", "sans-bold")
+    if not serif:
+        return fontutil.font(size, *sans)
+    return fontutil.font(size, *(("serif-bold", "serif") if bold else ("serif", "serif-bold")), *sans)
 
 
 def _centered(d, y, text, font, fill, W):
@@ -54,39 +50,61 @@ def _border(d, s, W, H):
         d.rectangle([40, 40, W - 40, H - 40], outline=a, width=2)
 
 
-def make_certificate(recipient, text, signer, style_key, logo_img):
+def logo_png(logo_img):
+    """The logo scaled to its final height as PNG bytes (None without a logo): small to send to workers, hashable."""
+    if logo_img is None:
+        return None
+    logo = logo_img.convert("RGBA")
+    lw = int(logo.width * (LOGO_H / logo.height))
+    logo = logo.resize((max(1, lw), LOGO_H), Image.LANCZOS)
+    buf = io.BytesIO()
+    logo.save(buf, "PNG")
+    return buf.getvalue()
+
+
+@functools.lru_cache(maxsize=8)
+def _template(text, signer, style_key, logo):
+    """Every layer except the recipient's name, rendered once per (text, signer, style, logo): (image, name y)."""
     s = STYLES.get(style_key, STYLES["classic"])
     serif = s["serif"]
-    W, H = 1200, 850
     img = Image.new("RGB", (W, H), s["bg"])
     d = ImageDraw.Draw(img)
     _border(d, s, W, H)
 
     y = 120
-    if logo_img is not None:
-        logo = logo_img.convert("RGBA")
-        lw = int(logo.width * (90 / logo.height))
-        logo = logo.resize((max(1, lw), 90), Image.LANCZOS)
-        img.paste(logo, ((W - logo.width) // 2, 70), logo)
+    if logo is not None:
+        logo_img = Image.open(io.BytesIO(logo))
+        img.paste(logo_img, ((W - logo_img.width) // 2, 70), logo_img)
         y = 190
 
     _centered(d, y, "CERTIFICATE", _font(60, True, serif), s["accent"], W)
     _centered(d, y + 78, "OF ACHIEVEMENT", _font(24, False, serif), s["sub"], W)
-    _centered(d, y + 190, recipient, _font(52, True, serif), s["name"], W)
     d.line([(W / 2 - 220, y + 270), (W / 2 + 220, y + 270)], fill=s["accent"], width=2)
     _centered(d, y + 300, text[:80], _font(23, False, serif), s["sub"], W)
     if signer.strip():
         _centered(d, H - 150, signer, _font(22, True, serif), s["name"], W)
         d.line([(W / 2 - 140, H - 120), (W / 2 + 140, H - 120)], fill="#d1d5db", width=1)
         _centered(d, H - 112, "Signature", _font(15, False, serif), s["sub"], W)
+    return img, y + 190
+
 
+def render_certificate(recipient, text, signer, style_key, logo=None):
+    """PNG bytes of one certificate; `logo` comes from logo_png. Only the name is drawn per call."""
+    s = STYLES.get(style_key, STYLES["classic"])
+    base, name_y = _template(text, signer, style_key, logo)
+    img = base.copy()
+    _centered(ImageDraw.Draw(img), name_y, recipient, _font(52, True, s["serif"]), s["name"], W)
     buf = io.BytesIO()
     img.save(buf, "PNG")
     return buf.getvalue()
 
 
+def make_certificate(recipient, text, signer, style_key, logo_img):
+    return render_certificate(recipient, text, signer, style_key, logo_png(logo_img))
+
+
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["certimg_title"])
 
     mode_map = {t["batch_single"]: "single", t["batch_multi"]: "batch"}
@@ -121,18 +139,20 @@ def run(lang):
     up = st.file_uploader(t["batch_upload"], type=["csv", "xlsx", "xls"])
     if not up:
         return
-    df = read_table(up)
-    col = st.selectbox(t["batch_name_col"], list(df.columns))
+    col = st.selectbox(t["batch_name_col"], columns(up))
     if not st.button("🏅 " + t["batch_generate"]):
         return
+    df = read_table(up, usecols=[col], dtype=str)
     names = [str(v).strip() for v in df[col].dropna() if str(v).strip()]
     if not names:
         st.warning(t["batch_empty"])
         return
-    zip_buf = io.BytesIO()
-    with zipfile.ZipFile(zip_buf, "w", zipfile.ZIP_DEFLATED) as zf:
-        for name in names:
+    # The logo is scaled once here; each worker renders the static layers once and then only draws names.
+    logo = logo_png(logo_img)
+    jobs = [(name, text, signer, style_key, logo) for name in names]
+    with ZipSink() as zf:
+        for name, png in zip(names, pool_map(render_certificate, jobs)):
             safe = re.sub(r"[^\w-]+", "_", name)[:40] or "certificate"
-            zf.writestr(f"{safe}.png", make_certificate(name, text, signer, style_key, logo_img))
+            zf.add(f"{safe}.png", png)
     st.success(f"{t['batch_done']}: {len(names)}")
-    st.download_button("⬇️ " + t["batch_zip"], zip_buf.getvalue(), file_name="certificates.zip", mime="application/zip")
+    st.download_button("⬇️ " + t["batch_zip"], zf.file(), file_name="certificates.zip", mime="application/zip")
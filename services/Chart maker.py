@@ -1,27 +1,34 @@
 import io
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
 import pandas as pd
 import streamlit as st
-from translations import translations
+from translations import for_lang
+from tablutil import read_table, preview
+from lazyutil import lazy_import
+
+
+def _use_agg():
+    import matplotlib
+    matplotlib.use("Agg")
+
+
+plt = lazy_import("matplotlib.pyplot", before=_use_agg)
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["chart_title"])
 
     up = st.file_uploader(t["chart_upload"], type=["csv", "xlsx", "xls"])
     if not up:
         return
     try:
-        df = pd.read_csv(up) if up.name.lower().endswith(".csv") else pd.read_excel(up)
+        head = preview(up, rows=20)
     except Exception as e:
         st.error(f"{t['chart_error']} {e}")
         return
 
-    st.dataframe(df.head(20), use_container_width=True)
-    cols = list(df.columns)
+    st.dataframe(head, use_container_width=True)
+    cols = list(head.columns)
     type_map = {t["chart_bar"]: "bar", t["chart_line"]: "line", t["chart_pie"]: "pie"}
     ctype = type_map[st.selectbox(t["chart_type"], list(type_map.keys()))]
     x = st.selectbox(t["chart_x"], cols)
@@ -32,7 +39,7 @@ def run(lang):
 
     fig, ax = plt.subplots(figsize=(7, 4))
     try:
-        data = df[[x, y]].dropna()
+        data = read_table(up, usecols=list(dict.fromkeys([x, y])))[[x, y]].dropna()
         if ctype == "bar":
             ax.bar(data[x].astype(str), pd.to_numeric(data[y], errors="coerce"))
             ax.tick_params(axis="x", rotation=45)
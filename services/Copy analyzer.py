@@ -1,7 +1,7 @@
 import re
 from collections import Counter
 import streamlit as st
-from translations import translations
+from translations import for_lang
 
 STOPWORDS = set("""
 a an the and or but of to in on for with at by from is are was were be this that it as not your you
@@ -16,7 +16,7 @@ def _syllables(word):
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["copyan_title"])
 
     text = st.text_area(t["copyan_input"], height=220)
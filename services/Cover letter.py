@@ -1,11 +1,11 @@
 from datetime import date
 import streamlit as st
-from translations import translations
+from translations import for_lang
 from pdfutil import make_pdf, pdf_bytes
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["cl_title"])
 
     name = st.text_input(t["cl_name"])
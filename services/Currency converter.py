@@ -1,7 +1,7 @@
 import json
 import urllib.request
 import streamlit as st
-from translations import translations
+from translations import for_lang
 
 CURRENCIES = ["USD", "EUR", "PLN", "GBP", "UAH", "CHF", "JPY", "CNY", "CAD",
               "AUD", "SEK", "NOK", "CZK", "HUF", "TRY", "DKK"]
@@ -29,7 +29,7 @@ def _fmt(value):
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["cur_title"])
     st.caption(t["net_warning"])  # currency codes are sent to open.er-api.com
 
@@ -1,32 +1,122 @@
 import io
+import itertools
 import re
 import hashlib
+import secrets
+import numpy as np
 import pandas as pd
 import streamlit as st
-from translations import translations
+from batchutil import pool_map, workers
+from translations import for_lang
+from tablutil import read_table, preview, csv_file, chunk_count, CHUNK_ROWS
 
-EMAIL_RE = re.compile(r"([A-Za-z0-9._%+-])[A-Za-z0-9._%+-]*(@[A-Za-z0-9.-]+)")
-PHONE_RE = re.compile(r"(\+?\d[\d\s().-]{6,}\d)")
+EMAIL_RE = re.compile(r"(?P<user>[A-Za-z0-9._%+-])[A-Za-z0-9._%+-]*(?P<domain>@[A-Za-z0-9.-]+)")
+PHONE = r"\+?\d[\d\s().-]{6,}\d"
+PHONE_RE = re.compile(f"(?P<phone>{PHONE})")
 
+KEY_BYTES = 32
+DIGEST_BYTES = 8  # pseudonyms are 16 hex characters
 
-def _mask_email(m):
-    return f"{m.group(1)}***{m.group(2)}"
 
+# "*" * k for every digit count a phone number can have; indexed with a whole column of counts.
+_STARS = np.array(["*" * k for k in range(64)], dtype=object)
 
-def _mask_phones(text):
-    def repl(m):
-        digits = re.sub(r"\D", "", m.group(1))
-        keep = digits[-2:] if len(digits) >= 2 else digits
-        return "*" * max(0, len(digits) - 2) + keep
-    return PHONE_RE.sub(repl, text)
 
+def _mask_phone(m):
+    digits = "".join(filter(str.isdigit, m.group("phone")))
+    return "*" * (len(digits) - 2) + digits[-2:]
 
-def _hash(value):
-    return hashlib.sha1(str(value).encode("utf-8")).hexdigest()[:10]
+
+def _mask_whole_phones(values):
+    """Mask cells that are exactly one phone number, without a Python call per cell."""
+    digits = values.str.replace(r"\D", "", regex=True)
+    count = (digits.str.len() - 2).clip(0, len(_STARS) - 1).to_numpy(dtype=int)
+    return pd.Series(_STARS[count] + digits.str[-2:].to_numpy(dtype=object), index=values.index)
+
+
+def _mask_text(text, emails, phones):
+    """Masked copy of a column of strings (no missing values)."""
+    if emails:
+        hits = text.str.contains("@", regex=False)
+        if hits.any():
+            text = text.copy()
+            text[hits] = text[hits].str.replace(EMAIL_RE.pattern, r"\1***\2", regex=True)
+    if phones:
+        hits = text.str.contains(PHONE, regex=True)
+        if hits.any():
+            text = text.copy()
+            whole = text[hits].str.fullmatch(PHONE)
+            text[whole[whole].index] = _mask_whole_phones(text[whole[whole].index])
+            rest = whole[~whole].index
+            text[rest] = text[rest].str.replace(PHONE_RE, _mask_phone, regex=True)
+    return text
+
+
+def mask_pii(df, emails=True, phones=True, exclude=()):
+    """Mask emails (j***@example.com) and phone numbers (*******89) in the text cells of `df`, in place.
+
+    Emails first, then phone numbers, as before. Every step is a vectorized
+    str method (pyarrow's C kernels when pandas stores text in Arrow) over
+    only the cells a vectorized contains() finds a candidate in, so columns
+    that can't hold either are skipped outright. Only phone numbers embedded
+    in longer text still need a Python callback per match.
+    """
+    if not (emails or phones):
+        return df
+    for c in df.select_dtypes(include=["object", "str"]).columns.difference(exclude, sort=False):
+        col = df[c]
+        # Object columns mix text with numbers/dates (Excel): mask the strings as a str column, leave the rest.
+        is_text = col.map(type).eq(str) if col.dtype == object else col.notna()
+        if not is_text.any():
+            continue
+        text = col[is_text]
+        masked = _mask_text(text.astype("str") if col.dtype == object else text, emails, phones)
+        if masked is not text:
+            col = col.copy()
+            col[is_text] = masked.astype(object) if col.dtype == object else masked
+            df[c] = col
+    return df
+
+
+def new_key():
+    """A random pseudonymization key, as hex."""
+    return secrets.token_hex(KEY_BYTES)
+
+
+def parse_key(text):
+    """Key bytes from hex text, or None unless it is 16-64 bytes (BLAKE2b's key limit)."""
+    try:
+        key = bytes.fromhex(text.strip())
+    except ValueError:
+        return None
+    return key if 16 <= len(key) <= 64 else None
+
+
+def pseudonymize(df, columns, key):
+    """Replace the values of `columns` with keyed BLAKE2b pseudonyms, in place.
+
+    The key makes the pseudonyms impossible to recompute from a dictionary of
+    likely values without it, and the same key gives the same pseudonym for a
+    value in every file. Each distinct value is hashed once (pd.factorize)
+    and the digests are mapped back by code. Missing cells stay missing.
+    """
+    for c in columns:
+        codes, uniques = pd.factorize(df[c])
+        digests = [hashlib.blake2b(str(v).encode("utf-8"), key=key, digest_size=DIGEST_BYTES).hexdigest()
+                   for v in uniques.tolist()]
+        df[c] = np.array(digests + [None], dtype=object)[codes]  # code -1 (missing) picks None
+    return df
+
+
+def anonymize(df, emails, phones, hash_cols=(), key=None):
+    """Anonymize one chunk (runs in the worker pool)."""
+    # Pseudonymize the original values: masking first would give every "j***@x.com" the same pseudonym.
+    pseudonymize(df, hash_cols, key)
+    return mask_pii(df, emails, phones, exclude=hash_cols)
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["anon_title"])
 
     up = st.file_uploader(t["anon_upload"], type=["csv", "xlsx", "xls"])
@@ -34,40 +124,58 @@ def run(lang):
         return
     is_csv = up.name.lower().endswith(".csv")
     try:
-        df = pd.read_csv(up) if is_csv else pd.read_excel(up)
+        head = preview(up, rows=20)
     except Exception as e:
         st.error(f"{t['anon_error']} {e}")
         return
 
-    st.dataframe(df.head(20), use_container_width=True)
+    st.dataframe(head, use_container_width=True)
     st.markdown(f"**{t['anon_options']}**")
     do_emails = st.checkbox(t["anon_emails"], value=True)
     do_phones = st.checkbox(t["anon_phones"], value=True)
-    hash_col = st.selectbox(t["anon_names_col"], ["—"] + list(df.columns))
+    hash_cols = st.multiselect(t["anon_names_col"], list(head.columns))
+    if hash_cols:
+        if not st.session_state.get("anon_key"):
+            st.session_state.anon_key = new_key()
+        key_text = st.text_input(t["anon_key"], key="anon_key", help=t["anon_key_help"])
+        st.download_button("🔑 " + t["anon_key_download"], key_text, file_name="anonymizer-key.txt", mime="text/plain")
 
     if not st.button("🕵️ " + t["anon_run"]):
         return
-    if not (do_emails or do_phones or hash_col != "—"):
+    if not (do_emails or do_phones or hash_cols):
         st.warning(t["anon_none"])
         return
+    key = parse_key(key_text) if hash_cols else None
+    if hash_cols and key is None:
+        st.error(t["anon_key_invalid"])
+        return
 
-    out = df.copy()
-    for c in out.select_dtypes(include="object"):
-        if do_emails:
-            out[c] = out[c].map(lambda v: EMAIL_RE.sub(_mask_email, v) if isinstance(v, str) else v)
-        if do_phones:
-            out[c] = out[c].map(lambda v: _mask_phones(v) if isinstance(v, str) else v)
-    if hash_col != "—":
-        out[hash_col] = out[hash_col].map(_hash)
-
-    st.dataframe(out.head(20), use_container_width=True)
-    buf = io.BytesIO()
+    # Pseudonymized columns are read as text so every chunk and file hashes a value the same way.
+    dtype = {c: str for c in hash_cols} or None
+    if is_csv:
+        chunks, total = read_table(up, dtype=dtype, chunksize=CHUNK_ROWS), chunk_count(up)
+    else:
+        df = read_table(up, dtype=dtype)
+        chunks = (df.iloc[i:i + CHUNK_ROWS].copy() for i in range(0, len(df), CHUNK_ROWS))
+        total = -(-len(df) // CHUNK_ROWS)
+    # A couple of chunks per worker in flight keeps every core busy without holding the file in RAM.
+    results = pool_map(anonymize, ((c, do_emails, do_phones, hash_cols, key) for c in chunks),
+                       total=total, window=2 * workers())
     if is_csv:
-        out.to_csv(buf, index=False)
+        # CSV is processed chunk by chunk into a spooled file, so memory stays bounded.
+        first = next(results, None)
+        if first is not None:
+            st.dataframe(first.head(20), use_container_width=True)
+            results = itertools.chain([first], results)
+        data = csv_file(results)
         fname, mime = "anonymized.csv", "text/csv"
     else:
+        out = pd.concat(list(results)) if total else df
+        st.dataframe(out.head(20), use_container_width=True)
+        buf = io.BytesIO()
         with pd.ExcelWriter(buf, engine="openpyxl") as w:
             out.to_excel(w, index=False)
+        data = buf.getvalue()
         fname = "anonymized.xlsx"
         mime = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-    st.download_button("⬇️ " + t["anon_download"], buf.getvalue(), file_name=fname, mime=mime)
+    st.download_button("⬇️ " + t["anon_download"], data, file_name=fname, mime=mime)
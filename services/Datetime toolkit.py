@@ -2,7 +2,7 @@ from datetime import datetime, date, time, timedelta
 from zoneinfo import ZoneInfo
 import pandas as pd
 import streamlit as st
-from translations import translations
+from translations import for_lang
 
 TIMEZONES = [
     "UTC", "Europe/Warsaw", "Europe/Berlin", "Europe/London", "Europe/Kyiv",
@@ -11,7 +11,7 @@ TIMEZONES = [
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["dt_title"])
 
     mode_map = {t["dt_diff"]: "diff", t["dt_workdays"]: "work", t["dt_tz"]: "tz"}
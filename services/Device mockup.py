@@ -1,7 +1,7 @@
 import io
 from PIL import Image, ImageDraw
 import streamlit as st
-from translations import translations
+from translations import for_lang
 
 
 def _phone(shot):
@@ -42,7 +42,7 @@ def _laptop(shot):
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["dev_title"])
 
     up = st.file_uploader(t["dev_upload"], type=["png", "jpg", "jpeg", "webp"])
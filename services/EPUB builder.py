@@ -4,12 +4,14 @@ import re
 import tempfile
 import markdown as md
 import streamlit as st
-from ebooklib import epub
-from translations import translations
+from translations import for_lang
+from lazyutil import lazy_import
+
+epub = lazy_import("ebooklib.epub")
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["epub_title"])
 
     book_title = st.text_input(t["epub_book_title"])
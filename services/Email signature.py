@@ -3,7 +3,7 @@ import html
 import random
 import streamlit as st
 import streamlit.components.v1 as components
-from translations import translations
+from translations import for_lang
 
 # Neutral demo identities used only to populate the preview before the user
 # types anything. Order matches SOCIALS (LinkedIn, X, GitHub, Instagram, Website).
@@ -228,7 +228,7 @@ def build_signature(data, design=1):
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["email_signature_title"])
 
     # Pick one random demo persona per session (stable across reruns).
@@ -1,17 +1,41 @@
 # services/xls_to_ical.py
+import re
+import tempfile
 import uuid
+import numpy as np
 import streamlit as st
 import pandas as pd
 from io import BytesIO
-from datetime import datetime, timezone
-from translations import translations
+from datetime import date, datetime, timedelta, timezone
+from dateutil.rrule import rrulestr
+from translations import for_lang
+from lazyutil import lazy_import
+from tablutil import read_table, preview, CHUNK_ROWS, TEMPLATE_MIME
+from ziputil import SPOOL_LIMIT, readable
+
+xlsxwriter = lazy_import("xlsxwriter")
+
+EXCEL_EPOCH = pd.Timestamp("1899-12-30")  # day 0 of Excel's serial dates (1900 system)
+ICS_DATE = "%Y%m%dT%H%M%S"
+FOLD_AT = 75  # RFC 5545 3.1: content lines are folded at 75 octets
+_ISO_TO_ICS = str.maketrans("", "", "-:")  # 2024-01-01T09:00:00 -> 20240101T090000
+COLUMNS = 5   # Start, End, Title, Description, Location — by position
+TEMPLATE_COLUMNS = ["Start Date", "End Date", "Event Title", "Description", "Location"]
+EXCEL_ROWS = 1_048_576  # rows per worksheet, header included
+MIN_SERIES = 3  # fewer occurrences than this stay separate events
+
+DAY, WEEK = 86_400, 604_800
+# RRULE FREQ for a step in seconds, coarsest unit that divides it.
+_FREQS = ((WEEK, "WEEKLY"), (DAY, "DAILY"), (3_600, "HOURLY"), (60, "MINUTELY"), (1, "SECONDLY"))
+_WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
 
 
 def format_date(dt):
+    """Format one cell as an ICS local date-time ("" when it isn't a date); see parse_dates for columns."""
     if pd.isna(dt):
         return ""
     if isinstance(dt, float):
-        dt = pd.to_datetime("1899-12-30") + pd.to_timedelta(dt, unit="D")
+        dt = EXCEL_EPOCH + pd.to_timedelta(dt, unit="D")
     elif isinstance(dt, str):
         try:
             dt = pd.to_datetime(dt)
@@ -22,7 +46,45 @@ def format_date(dt):
             dt = pd.to_datetime(dt)
         except Exception:
             return ""
-    return dt.strftime("%Y%m%dT%H%M%S")
+    return dt.strftime(ICS_DATE)
+
+
+def parse_dates(values):
+    """Format a whole column as ICS date-times, vectorized ("" where a cell isn't a date).
+
+    Numbers, and text that parses as one, are Excel serial days (the fraction
+    is the time of day); other text goes through a single pd.to_datetime call,
+    and only the values it can't read with the column's format are retried
+    one by one.
+    """
+    values = pd.Series(values)
+    if pd.api.types.is_datetime64_any_dtype(values):
+        dt = values
+    else:
+        serial = pd.to_numeric(values, errors="coerce")
+        serial = serial.where(serial.between(-80_000, 130_000))  # what fits a datetime64[ns]
+        dt = EXCEL_EPOCH + pd.to_timedelta((serial * 86400).round(), unit="s")  # to the second, like Excel shows it
+        text = serial.isna() & values.notna()
+        if text.any():
+            dt[text] = _to_datetime(values[text].astype(str)).to_numpy()
+    if dt.dt.tz is not None:
+        dt = dt.dt.tz_localize(None)  # keep the wall-clock time, as strftime does on one value
+    # ISO strings from NumPy's C formatter, minus separators: much faster than Series.dt.strftime.
+    iso = np.datetime_as_string(dt.to_numpy(dtype="datetime64[s]"), unit="s")
+    return pd.Series([v.translate(_ISO_TO_ICS) if v != "NaT" else "" for v in iso], index=values.index, dtype=object)
+
+
+def _to_datetime(text):
+    try:
+        dt = pd.to_datetime(text, errors="coerce")  # format inferred from the first value
+        if dt.dt.tz is not None:
+            dt = dt.dt.tz_localize(None)
+    except (ValueError, TypeError):  # e.g. mixed UTC offsets
+        dt = pd.Series(pd.NaT, index=text.index, dtype="datetime64[ns]")
+    missed = dt.isna()
+    if missed.any():
+        dt[missed] = pd.to_datetime(text[missed].map(format_date), format=ICS_DATE, errors="coerce").to_numpy()
+    return dt
 
 
 def escape_ics(value):
@@ -35,36 +97,391 @@ def escape_ics(value):
     return text
 
 
-def generate_ics(df):
-    lines = [
-        "BEGIN:VCALENDAR",
-        "VERSION:2.0",
-        "PRODID:-//My Tools Hub//EN",
-        "CALSCALE:GREGORIAN",
-    ]
-    dtstamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-    for _, row in df.iterrows():
-        start = format_date(row.iloc[0])
-        end = format_date(row.iloc[1])
-        if not start or not end:
-            continue  # skip rows without a valid time range
-        title = row.iloc[2] if pd.notna(row.iloc[2]) else "Event"
-        description = row.iloc[3] if pd.notna(row.iloc[3]) else ""
-        location = row.iloc[4] if pd.notna(row.iloc[4]) else ""
-        lines.append("BEGIN:VEVENT")
-        lines.append(f"UID:{uuid.uuid4()}@my-tools-hub")
-        lines.append(f"DTSTAMP:{dtstamp}")
-        lines.append(f"DTSTART:{start}")
-        lines.append(f"DTEND:{end}")
-        lines.append(f"SUMMARY:{escape_ics(title)}")
-        if description:
-            lines.append(f"DESCRIPTION:{escape_ics(description)}")
-        if location:
-            lines.append(f"LOCATION:{escape_ics(location)}")
-        lines.append("END:VEVENT")
-    lines.append("END:VCALENDAR")
-    # RFC 5545 mandates CRLF line endings.
-    return "\r\n".join(lines)
+def fold(line):
+    """Fold a content line to at most 75 octets per physical line (continuations start with a space)."""
+    if len(line) <= FOLD_AT and (line.isascii() or len(line.encode("utf-8")) <= FOLD_AT):
+        return line
+    if line.isascii():
+        parts = [line[:FOLD_AT]] + [line[i:i + FOLD_AT - 1] for i in range(FOLD_AT, len(line), FOLD_AT - 1)]
+        return "\r\n ".join(parts)
+    # Count UTF-8 octets so a multi-byte character is never split.
+    parts, current, size, limit = [], [], 0, FOLD_AT
+    for ch in line:
+        n = len(ch.encode("utf-8"))
+        if size + n > limit:
+            parts.append("".join(current))
+            current, size, limit = [], 0, FOLD_AT - 1  # the leading space takes one octet
+        current.append(ch)
+        size += n
+    parts.append("".join(current))
+    return "\r\n ".join(parts)
+
+
+def _text(values, default=""):
+    """A text column with missing cells set to `default`, escaped with escape_ics.
+
+    Each distinct value is escaped once: titles, rooms and descriptions repeat
+    heavily in real timetables.
+    """
+    codes, uniques = pd.factorize(values)
+    escaped = np.array([escape_ics(v) for v in uniques.tolist()] + [escape_ics(default)], dtype=object)
+    return pd.Series(escaped[codes], index=values.index)  # code -1 (missing) picks the default
+
+
+def events(df):
+    """Rows of an event table with a valid start and end, as ICS-ready strings.
+
+    Columns are taken by position (Start, End, Title, Description, Location);
+    missing trailing columns count as empty.
+    """
+    df = df.reset_index(drop=True)
+    empty = pd.Series(None, index=df.index, dtype=object)
+    cols = [df.iloc[:, i] if i < df.shape[1] else empty for i in range(COLUMNS)]
+    out = pd.DataFrame({
+        "start": parse_dates(cols[0]),
+        "end": parse_dates(cols[1]),
+        "title": _text(cols[2], "Event"),
+        "description": _text(cols[3]),
+        "location": _text(cols[4]),
+    })
+    return out[(out["start"] != "") & (out["end"] != "")]  # skip rows without a valid time range
+
+
+def _seconds(ics_dates):
+    return pd.to_datetime(ics_dates, format=ICS_DATE).to_numpy().astype("datetime64[s]").astype(np.int64)
+
+
+def _ics_date(seconds):
+    return np.datetime_as_string(np.asarray(seconds, dtype="datetime64[s]"), unit="s")
+
+
+def _step_rule(starts):
+    """(RRULE, all generated starts) for one fixed step — the GCD of the gaps — or None."""
+    step = int(np.gcd.reduce(np.diff(starts)))
+    slots = (starts[-1] - starts[0]) // step + 1
+    if slots > 2 * len(starts):  # too sparse: more EXDATEs than events
+        return None
+    unit, freq = next((u, f) for u, f in _FREQS if step % u == 0)
+    rule = f"FREQ={freq};COUNT={slots}" + (f";INTERVAL={step // unit}" if step != unit else "")
+    return rule, starts[0] + step * np.arange(slots)
+
+
+def _weekday_rule(starts):
+    """(RRULE, all generated starts) for "every k weeks on these weekdays at this time", or None."""
+    if len(set((starts % DAY).tolist())) != 1:
+        return None
+    days = starts // DAY
+    weekdays = (days + 3) % 7  # 1970-01-01 was a Thursday; Monday = 0
+    weeks = np.unique((days - weekdays - 4) // 7)  # Monday-based week numbers (WKST=MO); day 4 was a Monday
+    if len(weeks) < 2:
+        return None
+    k = int(np.gcd.reduce(np.diff(weeks)))
+    used = np.unique(weekdays)
+    span = np.arange(weeks[0], weeks[-1] + 1, k)
+    generated = ((span[:, None] * 7 + 4 + used[None, :]) * DAY).ravel() + starts[0] % DAY
+    generated = generated[(generated >= starts[0]) & (generated <= starts[-1])]
+    if len(generated) > 2 * len(starts):
+        return None
+    rule = f"FREQ=WEEKLY;COUNT={len(generated)}" + (f";INTERVAL={k}" if k > 1 else "")
+    return rule + ";BYDAY=" + ",".join(_WEEKDAYS[d] for d in used.tolist()), generated
+
+
+def _series(group):
+    """Rows of one (title, description, location, duration) group, with repeats folded into an RRULE."""
+    starts, first = np.unique(group["_start"].to_numpy(), return_index=True)
+    if len(starts) < MIN_SERIES:
+        return group
+    candidates = [c for c in (_step_rule(starts), _weekday_rule(starts)) if c is not None]
+    if not candidates:
+        return group
+    # The rule with the fewest gaps wins; gaps become EXDATEs.
+    rule, generated = min(candidates, key=lambda c: len(c[1]))
+    head = group.iloc[[first[0]]].copy()
+    head["rrule"] = rule
+    head["exdate"] = ",".join(s.translate(_ISO_TO_ICS) for s in _ics_date(np.setdiff1d(generated, starts)))
+    duplicates = np.ones(len(group), dtype=bool)
+    duplicates[first] = False  # same start twice: the extra copies stay separate events
+    return pd.concat([head, group[duplicates]])
+
+
+def recurrences(ev):
+    """Fold events that repeat at a regular interval into single events with RRULE/EXDATE.
+
+    `ev` is an events() table. Rows are grouped by title, description,
+    location and duration; within a group, starts on a fixed step (every n
+    minutes/hours/days/weeks) or on fixed weekdays every n weeks become one
+    event with a COUNT-limited RRULE, and the missing occurrences EXDATEs. A
+    rule is only used when it has no more gaps than events. The result has
+    "rrule" and "exdate" columns ("" for plain events), in first-row order.
+    """
+    ev = ev.assign(rrule="", exdate="", _start=_seconds(ev["start"]))
+    duration = _seconds(ev["end"]) - ev["_start"]
+    key = ev.groupby([ev["title"], ev["description"], ev["location"], duration], sort=False).ngroup()
+    size = key.map(key.value_counts())
+    parts = [ev[size < MIN_SERIES]]  # most rows in a one-off calendar: no per-group Python work
+    parts += [_series(g) for _, g in ev[size >= MIN_SERIES].groupby(key[size >= MIN_SERIES], sort=False)]
+    return pd.concat(parts).sort_index(kind="stable").drop(columns="_start")
+
+
+def iter_ics(frames, dtstamp=None, recurring=False):
+    """Yield an ICS calendar piece by piece: the header, one VEVENT block per event, the footer.
+
+    `frames` is an iterable of event tables (e.g. read_table chunks), so a
+    large sheet is converted chunk by chunk and never held as one string.
+    With `recurring=True` repeats are folded into RRULEs first (see
+    recurrences), which needs every event at once.
+    Every line ends in CRLF, as RFC 5545 mandates. UIDs are one random UUID
+    per calendar plus the event's number, unique without a uuid4() per event.
+    """
+    dtstamp = dtstamp or datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    calendar_id = uuid.uuid4()
+    n = 0
+    yield "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//My Tools Hub//EN\r\nCALSCALE:GREGORIAN\r\n"
+    tables = (events(df) for df in frames)
+    if recurring:
+        tables = [recurrences(pd.concat(list(tables), ignore_index=True))]
+    for ev in tables:
+        if "rrule" not in ev:
+            ev = ev.assign(rrule="", exdate="")
+        for start, end, title, description, location, rrule, exdate in zip(
+                *(ev[c].tolist() for c in ("start", "end", "title", "description", "location", "rrule", "exdate"))):
+            n += 1
+            lines = [
+                "BEGIN:VEVENT",
+                f"UID:{calendar_id}-{n}@my-tools-hub",
+                f"DTSTAMP:{dtstamp}",
+                f"DTSTART:{start}",
+                f"DTEND:{end}",
+                fold(f"SUMMARY:{title}"),
+            ]
+            if rrule:
+                lines.append(f"RRULE:{rrule}")
+            if exdate:
+                lines.append(fold(f"EXDATE:{exdate}"))
+            if description:
+                lines.append(fold(f"DESCRIPTION:{description}"))
+            if location:
+                lines.append(fold(f"LOCATION:{location}"))
+            lines.append("END:VEVENT\r\n")
+            yield "\r\n".join(lines)
+    yield "END:VCALENDAR\r\n"
+
+
+def generate_ics(df, recurring=False):
+    """The calendar for one event table as a string."""
+    return "".join(iter_ics([df], recurring=recurring))
+
+
+def ics_file(frames, recurring=False):
+    """Write the calendar into a spooled temp file; return a handle for st.download_button."""
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_LIMIT, mode="w+b")
+    for piece in iter_ics(frames, recurring=recurring):
+        spool.write(piece.encode("utf-8"))
+    return readable(spool)
+
+
+# --- ICS -> Excel ---
+
+_UNESCAPE = re.compile(r"\\([\\;,nN])")
+_DURATION = re.compile(r"([+-])?P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$")
+_UTC_UNTIL = re.compile(r"(UNTIL=\d{8}(?:T\d{6})?)Z")
+
+
+def unescape_ics(text):
+    """Inverse of escape_ics."""
+    return _UNESCAPE.sub(lambda m: "\n" if m.group(1) in "nN" else m.group(1), text)
+
+
+def _lines(source):
+    """Decoded lines of an uploaded .ics file (or a path), read from the start."""
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            yield from _lines(f)
+        return
+    source.seek(0)
+    for n, raw in enumerate(source):
+        yield raw.decode("utf-8-sig" if n == 0 else "utf-8", "replace")
+
+
+def _unfold(lines):
+    """Logical content lines: folded continuations (leading space or tab) joined, line endings dropped."""
+    parts = []
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and parts:
+            parts.append(line[1:])
+            continue
+        if parts:
+            yield "".join(parts)
+        parts = [line] if line else []
+    if parts:
+        yield "".join(parts)
+
+
+def _property(line):
+    """(NAME, {PARAM: value}, value) of one content line."""
+    if '"' in line:  # quoted parameter values may contain ':' and ';'
+        quoted, split = False, len(line)
+        for i, ch in enumerate(line):
+            if ch == '"':
+                quoted = not quoted
+            elif ch == ":" and not quoted:
+                split = i
+                break
+        head, value = line[:split], line[split + 1:]
+    else:
+        head, _, value = line.partition(":")
+    name, *params = head.split(";")
+    return name.upper(), dict(p.upper().partition("=")[::2] for p in params), value
+
+
+def _ics_datetime(value):
+    """A date or date-time value as a naive datetime (wall-clock time as written), or None."""
+    value = value.strip()
+    try:
+        # Sliced by hand: strptime costs several times more, and every event has two of these.
+        if len(value) == 8:
+            return datetime(int(value[:4]), int(value[4:6]), int(value[6:8]))
+        if value[8] == "T":
+            return datetime(int(value[:4]), int(value[4:6]), int(value[6:8]),
+                            int(value[9:11]), int(value[11:13]), int(value[13:15]))
+    except (ValueError, IndexError):
+        pass
+    return None
+
+
+def _duration(value):
+    m = _DURATION.match(value.strip())
+    if not m:
+        return None
+    weeks, days, hours, minutes, seconds = (int(g or 0) for g in m.groups()[1:])
+    delta = timedelta(weeks=weeks, days=days, hours=hours, minutes=minutes, seconds=seconds)
+    return -delta if m.group(1) == "-" else delta
+
+
+def read_events(lines):
+    """Yield each VEVENT of a calendar as a dict, one at a time.
+
+    Properties of nested components (VALARM) are skipped. Keys: DTSTART,
+    DTEND, RECURRENCE-ID (datetimes), EXDATE, RDATE (lists), SUMMARY,
+    DESCRIPTION, LOCATION (unescaped), RRULE, DURATION, UID and all_day.
+    """
+    event, depth = None, 0
+    for line in _unfold(lines):
+        name, params, value = _property(line)
+        if name == "BEGIN":
+            if event is not None:
+                depth += 1
+            elif value.strip().upper() == "VEVENT":
+                event = {"EXDATE": [], "RDATE": [], "all_day": False}
+        elif name == "END":
+            if depth:
+                depth -= 1
+            elif event is not None and value.strip().upper() == "VEVENT":
+                yield event
+                event = None
+        elif event is None or depth:
+            continue
+        elif name in ("DTSTART", "DTEND", "RECURRENCE-ID"):
+            event[name] = _ics_datetime(value)
+            if name == "DTSTART":
+                event["all_day"] = params.get("VALUE") == "DATE" or len(value.strip()) == 8
+        elif name in ("EXDATE", "RDATE"):
+            event[name] += [d for d in map(_ics_datetime, value.split(",")) if d]
+        elif name in ("SUMMARY", "DESCRIPTION", "LOCATION"):
+            event[name] = unescape_ics(value)
+        elif name in ("RRULE", "DURATION", "UID"):
+            event[name] = value.strip()
+
+
+def _overrides(lines):
+    """(UID, RECURRENCE-ID) of every instance a calendar overrides with its own VEVENT.
+
+    A quick pass that only looks at the lines it needs.
+    """
+    found, uid, recurrence_id = set(), None, None
+    for line in _unfold(lines):
+        head = line[:13].upper()
+        if head.startswith("BEGIN:VEVENT"):
+            uid = recurrence_id = None
+        elif head.startswith(("UID:", "UID;")):
+            uid = _property(line)[2].strip()
+        elif head == "RECURRENCE-ID":
+            recurrence_id = _ics_datetime(_property(line)[2])
+        elif head.startswith("END:VEVENT") and recurrence_id:
+            found.add((uid, recurrence_id))
+    return found
+
+
+def occurrences(event, window, overridden=frozenset()):
+    """Yield (start, end) of each occurrence of one read_events() event.
+
+    Recurring events are expanded from their RRULE and RDATEs within
+    `window` (start, end datetimes), minus EXDATEs and the instances listed in
+    `overridden`; single events are yielded as they are.
+    """
+    start = event.get("DTSTART")
+    if start is None:
+        return
+    end = event.get("DTEND")
+    if end is None:
+        length = _duration(event["DURATION"]) if event.get("DURATION") else None
+        end = start + (length if length is not None else timedelta(days=1 if event["all_day"] else 0))
+    length = end - start
+    if not event.get("RRULE") and not event["RDATE"]:
+        yield start, end
+        return
+    lo, hi = window
+    starts = set(event["RDATE"]) | {start}
+    if event.get("RRULE"):
+        # Times are kept as floating wall-clock values, so a UTC UNTIL is compared the same way.
+        rule = rrulestr(_UTC_UNTIL.sub(r"\1", event["RRULE"]), dtstart=start)
+        starts.update(rule.between(lo, hi, inc=True))
+    skipped = set(event["EXDATE"])
+    uid = event.get("UID")
+    for s in sorted(starts):
+        if lo <= s <= hi and s not in skipped and (uid, s) not in overridden:
+            yield s, s + length
+
+
+def ics_rows(source, window):
+    """Yield (start, end, title, description, location) for every occurrence in an .ics file.
+
+    The file is read twice, event by event, and never held in memory: first
+    for the instances that RECURRENCE-ID events override, then to expand.
+    """
+    overridden = _overrides(_lines(source))
+    for event in read_events(_lines(source)):
+        title, description, location = (event.get(k, "") for k in ("SUMMARY", "DESCRIPTION", "LOCATION"))
+        for start, end in occurrences(event, window, overridden):
+            yield start, end, title, description, location
+
+
+def excel_file(rows):
+    """Write rows in the template's five-column layout to .xlsx; return a handle for st.download_button.
+
+    xlsxwriter's constant_memory mode flushes each row as it is written, and
+    the workbook is spooled to disk when large. Past Excel's row limit the
+    rows continue on another sheet.
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_LIMIT, mode="w+b")
+    book = xlsxwriter.Workbook(spool, {"constant_memory": True})
+    when = book.add_format({"num_format": "yyyy-mm-dd hh:mm"})
+    sheet, row = None, EXCEL_ROWS
+    for values in rows:
+        if row == EXCEL_ROWS:
+            sheet = book.add_worksheet("Events" if sheet is None else f"Events {len(book.worksheets()) + 1}")
+            sheet.set_column(0, 1, 17)
+            sheet.write_row(0, 0, TEMPLATE_COLUMNS)
+            row = 1
+        sheet.write_datetime(row, 0, values[0], when)
+        sheet.write_datetime(row, 1, values[1], when)
+        sheet.write_row(row, 2, values[2:])
+        row += 1
+    if sheet is None:
+        book.add_worksheet("Events").write_row(0, 0, TEMPLATE_COLUMNS)
+    book.close()
+    return readable(spool)
 
 
 def get_template_file():
@@ -72,7 +489,7 @@ def get_template_file():
         ["2023-01-01 09:00", "2023-01-01 10:00", "Team Meeting", "Weekly sync", "Conference Room A"],
         ["2023-01-02 14:00", "2023-01-02 15:30", "Client Call", "Project discussion", "Zoom"],
         ["2023-01-03 10:00", "2023-01-03 12:00", "Workshop", "Training session", "Training Room"],
-    ], columns=["Start Date", "End Date", "Event Title", "Description", "Location"])
+    ], columns=TEMPLATE_COLUMNS)
     output = BytesIO()
     with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
         sample.to_excel(writer, index=False, sheet_name="Events")
@@ -80,23 +497,53 @@ def get_template_file():
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
 
     st.markdown(f"### {t['ical_title']}")
 
+    direction_map = {t["ical_to_ics"]: "to_ics", t["ical_to_excel"]: "to_excel"}
+    direction = direction_map[st.radio(t["ical_direction"], list(direction_map.keys()), horizontal=True)]
+    if direction == "to_excel":
+        _run_to_excel(t)
+        return
+
     st.markdown(f"#### 📘 {t['ical_instructions']}")
     st.download_button(f"📥 {t['ical_template']}", get_template_file(), file_name="Calendar_Template.xlsx")
 
-    uploaded_file = st.file_uploader(t["ical_upload"], type=["xls", "xlsx"])
+    uploaded_file = st.file_uploader(t["ical_upload"], type=["xls", "xlsx", "csv"])
 
     if uploaded_file:
         try:
-            df = pd.read_excel(uploaded_file)
             st.markdown(f"### 📊 {t['ical_preview']}")
-            st.dataframe(df)
+            st.dataframe(preview(uploaded_file))
+            recurring = st.checkbox(t["ical_recurring"])
 
             if st.button(f"🔁 {t['ical_convert']}"):
-                ics_content = generate_ics(df)
+                ics_content = ics_file(read_table(uploaded_file, chunksize=CHUNK_ROWS), recurring=recurring)
                 st.download_button(f"📤 {t['ical_download']}", data=ics_content, file_name="calendar.ics", mime="text/calendar")
         except Exception as e:
             st.error(t["ical_error"] + str(e))
+
+
+def years_from(day, years):
+    """The same day `years` later (or earlier); Feb 29 becomes Feb 28 in a common year."""
+    try:
+        return day.replace(year=day.year + years)
+    except ValueError:
+        return day.replace(year=day.year + years, day=28)
+
+
+def _run_to_excel(t):
+    uploaded_file = st.file_uploader(t["ical_upload_ics"], type=["ics"])
+    today = date.today()
+    window = st.date_input(t["ical_window"], value=(years_from(today, -1), years_from(today, 2)))
+    if not uploaded_file or len(window) != 2:
+        return
+    if st.button(f"🔁 {t['ical_convert_excel']}"):
+        try:
+            lo = datetime.combine(window[0], datetime.min.time())
+            hi = datetime.combine(window[1], datetime.max.time())
+            data = excel_file(ics_rows(uploaded_file, (lo, hi)))
+            st.download_button(f"📤 {t['ical_download_excel']}", data=data, file_name="calendar.xlsx", mime=TEMPLATE_MIME)
+        except Exception as e:
+            st.error(t["ical_error"] + str(e))
@@ -1,41 +1,418 @@
-import io
-import pandas as pd
+import functools
+import importlib.util
+import json
+import re
+import threading
+import zlib
+import time
+import numpy as np
 import streamlit as st
-from faker import Faker
-from translations import translations
+import pandas as pd
+from translations import for_lang
+from lazyutil import lazy_import
+from batchutil import pool_map
+from tablutil import csv_file, jsonl_file, parquet_file, HAS_PYARROW
+from ziputil import ZipSink
+
+faker = lazy_import("faker")
+yaml = lazy_import("yaml")
+HAS_YAML = importlib.util.find_spec("yaml") is not None  # optional: JSON specs work without it
 
 # App language -> Faker locale for region-appropriate sample data.
 LOCALES = {"English": "en_US", "Polski": "pl_PL", "Deutsch": "de_DE", "Українська": "uk_UA", "中文": "zh_CN"}
 
+# Field id -> Faker method; the label is translations["faker_f_<id>"].
+FIELDS = {
+    "name": "name",
+    "email": "email",
+    "phone": "phone_number",
+    "company": "company",
+    "address": "address",
+    "city": "city",
+    "country": "country",
+    "job": "job",
+    "date": "date",
+}
+
+# Label, file extension, MIME type, writer.
+FORMATS = {
+    "csv": ("CSV", "csv", "text/csv", csv_file),
+    "jsonl": ("JSON Lines", "jsonl", "application/x-ndjson", jsonl_file),
+}
+if HAS_PYARROW:
+    FORMATS["parquet"] = ("Parquet", "parquet", "application/vnd.apache.parquet", parquet_file)
+
+MAX_ROWS = 10_000_000
+# st.download_button copies the whole file into Streamlit's in-memory media
+# store, so the row count is capped by the estimated file size (the container
+# has 1 GB).
+MAX_OUTPUT_MB = 200
+SAMPLE_ROWS = 200  # rows generated to estimate the bytes per row
+# Rows per worker task. Fixed (not derived from the worker count), so a seed
+# gives the same file whatever machine generates it.
+CHUNK = 100_000
+# Fast mode only: distinct Faker values drawn per column and chunk, which the
+# rows then sample. Faker needs up to ~250 µs a value (en_US names, addresses),
+# so fast mode is ~20x quicker, but values repeat: no use for unique columns.
+POOL = 2048
+
+MAX_SCHEMA_ROWS = 20_000_000  # all tables together; keys are int32
+TABLE_NAME = re.compile(r"[\w-]+")
+
+EXAMPLE_SCHEMA = """{
+  "tables": [
+    {"name": "customers", "rows": 1000, "primary_key": "id",
+     "columns": {"name": "name", "email": "email", "city": "city"}},
+    {"name": "orders", "primary_key": "id",
+     "foreign_keys": {"customer_id": {"table": "customers", "per_parent": [0, 5]}},
+     "columns": {"ordered_on": "date"}},
+    {"name": "order_notes", "rows": 500,
+     "foreign_keys": {"order_id": {"table": "orders"}},
+     "columns": {"author": "name"}}
+  ]
+}"""
+
+_local = threading.local()  # Faker instances are seeded per chunk: one per thread, never shared
+
+
+def _faker(locale):
+    instances = _local.__dict__.setdefault("fakers", {})
+    if locale not in instances:
+        instances[locale] = faker.Faker(locale)
+    return instances[locale]
+
+
+def chunk_seed(seed, index):
+    """Seed for chunk `index`: independent streams per chunk, derived only from the user's seed."""
+    return int(np.random.SeedSequence([seed, index]).generate_state(1)[0])
+
+
+def generate_chunk(locale, fields, names, seed, index, rows, pool=False):
+    """Chunk `index` of a table: `rows` rows with one column per field id, named `names`.
+
+    Every value is a fresh Faker call, built column by column. With `pool`,
+    each column draws only min(rows, POOL) values and the rows sample them
+    with NumPy (fast mode: values repeat).
+    """
+    fake = _faker(locale)
+    chunk_s = chunk_seed(seed, index)
+    fake.seed_instance(chunk_s)
+    rng = np.random.default_rng(chunk_s)
+    drawn = min(rows, POOL) if pool else rows
+    data = {}
+    for field, name in zip(fields, names):
+        make = getattr(fake, FIELDS[field])
+        values = np.array([make() for _ in range(drawn)], dtype=object)
+        if field == "address":
+            values = np.array([a.replace("\n", ", ") for a in values], dtype=object)
+        data[name] = values if drawn == rows else values[rng.integers(0, drawn, rows)]
+    return pd.DataFrame(data, index=pd.RangeIndex(rows))
+
+
+def generate(locale, fields, names, rows, seed, pool=False):
+    """Yield the table as DataFrame chunks of CHUNK rows, in order, generated in the worker pool."""
+    tasks = ((locale, fields, names, seed, i, min(CHUNK, rows - start), pool)
+             for i, start in enumerate(range(0, rows, CHUNK)))
+    yield from pool_map(generate_chunk, tasks, total=-(-rows // CHUNK))
+
+
+def file_size(sample, fmt):
+    """Bytes `sample` takes in `fmt`. Parquet is measured as CSV: on a few rows its overhead would dominate."""
+    write = csv_file if fmt == "parquet" else FORMATS[fmt][3]
+    data = write([sample])
+    size = data.seek(0, 2)
+    data.close()
+    return size
+
+
+@functools.lru_cache(maxsize=64)
+def row_bytes(locale, fields, names, fmt):
+    """Estimated bytes per row of a table in `fmt`, from SAMPLE_ROWS generated rows."""
+    return file_size(generate_chunk(locale, fields, names, 0, 0, SAMPLE_ROWS), fmt) / SAMPLE_ROWS
+
+
+# --- Relational schemas ---
+
+
+def _load_spec(text):
+    if HAS_YAML:  # YAML is a superset of JSON
+        try:
+            return yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise ValueError(str(e)) from None
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ValueError(str(e)) from None
+
+
+def _is_count(value):
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 0
+
+
+def parse_schema(text):
+    """Validate a schema spec (JSON, or YAML when PyYAML is installed); return its tables, parents first.
+
+    The spec is {"tables": [table, ...]}; each table has a "name" (letters,
+    digits, _ and -; it names the table's file in the ZIP) and:
+
+        "rows": N                  row count, unless a foreign key sets it with per_parent
+        "primary_key": "id"        optional integer key column, 1..rows
+        "foreign_keys": {"col": {"table": "parent", "per_parent": [min, max]}}
+                                   per_parent: each parent row gets min..max children (one
+                                   foreign key at most); without it every row references a
+                                   uniformly random parent row
+        "columns": {"col": "name"} a field from FIELDS per column
+
+    Raises ValueError describing the first problem found.
+    """
+    spec = _load_spec(text)
+    if not isinstance(spec, dict) or not isinstance(spec.get("tables"), list) or not spec["tables"]:
+        raise ValueError('the spec needs a non-empty "tables" list')
+    tables = {}
+    for table in spec["tables"]:
+        name = table.get("name") if isinstance(table, dict) else None
+        if not isinstance(name, str) or not name:
+            raise ValueError('every table needs a "name"')
+        if not TABLE_NAME.fullmatch(name):  # it becomes a file name in the ZIP
+            raise ValueError(f"table {name!r}: names may only use letters, digits, _ and -")
+        if name in tables:
+            raise ValueError(f"table {name!r} is defined twice")
+        columns = table.get("columns") or {}
+        fks = table.get("foreign_keys") or {}
+        pk = table.get("primary_key")
+        if not isinstance(columns, dict):
+            raise ValueError(f'{name}: "columns" must map column names to fields')
+        if not isinstance(fks, dict):
+            raise ValueError(f'{name}: "foreign_keys" must map column names to {{"table": ...}}')
+        if pk is not None and (not isinstance(pk, str) or not pk):
+            raise ValueError(f'{name}: "primary_key" must be a column name')
+        for col, field in columns.items():
+            if not isinstance(col, str) or not isinstance(field, str) or field not in FIELDS:
+                raise ValueError(f"{name}.{col}: unknown field {field!r} (one of: {', '.join(FIELDS)})")
+        for col, fk in fks.items():
+            if not isinstance(col, str) or not isinstance(fk, dict) or not isinstance(fk.get("table"), str):
+                raise ValueError(f'{name}.{col}: a foreign key needs a "table" name')
+        sized = [col for col, fk in fks.items() if "per_parent" in fk]
+        if len(sized) > 1:
+            raise ValueError(f"{name}: only one foreign key can set per_parent")
+        if sized:
+            bounds = fks[sized[0]]["per_parent"]
+            if not (isinstance(bounds, list) and len(bounds) == 2 and all(_is_count(b) for b in bounds)
+                    and bounds[0] <= bounds[1]):
+                raise ValueError(f"{name}.{sized[0]}: per_parent must be [min, max] with 0 <= min <= max")
+        elif not _is_count(table.get("rows")):
+            raise ValueError(f'{name}: "rows" must be a whole number (or a foreign key with per_parent)')
+        names = list(fks) + list(columns) + ([pk] if pk else [])
+        if len(set(names)) != len(names):
+            raise ValueError(f"{name}: a column name is used twice")
+        tables[name] = dict(table, columns=columns, foreign_keys=fks, primary_key=pk,
+                            sized_by=sized[0] if sized else None)
+
+    ordered, state = [], {}  # depth-first topological sort; state: 1 visiting, 2 done
+
+    def visit(name, path):
+        if state.get(name) == 2:
+            return
+        if state.get(name) == 1:
+            raise ValueError("foreign keys form a cycle: " + " -> ".join(path + [name]))
+        state[name] = 1
+        for col, fk in tables[name]["foreign_keys"].items():
+            parent = fk.get("table")
+            if parent not in tables:
+                raise ValueError(f"{name}.{col}: unknown table {parent!r}")
+            if not tables[parent].get("primary_key"):
+                raise ValueError(f"{name}.{col}: table {parent!r} has no primary_key")
+            visit(parent, path + [name])
+        state[name] = 2
+        ordered.append(tables[name])
+
+    for name in tables:
+        visit(name, [])
+    return ordered
+
+
+def _children_counts(rng, table, parent_rows):
+    """Child rows per parent row for a per_parent foreign key (drawn the same way when planning and writing)."""
+    lo, hi = table["foreign_keys"][table["sized_by"]]["per_parent"]
+    return rng.integers(lo, hi + 1, parent_rows, dtype=np.int32)
+
+
+def plan_rows(tables, seed):
+    """Row count per table. Checks MAX_SCHEMA_ROWS before anything large is allocated."""
+    rows, total = {}, 0
+    for no, table in enumerate(tables):
+        name = table["name"]
+        if table["sized_by"]:
+            parent = table["foreign_keys"][table["sized_by"]]["table"]
+            rng = np.random.default_rng(chunk_seed(seed, no))
+            rows[name] = int(_children_counts(rng, table, rows[parent]).sum(dtype=np.int64))
+        else:
+            rows[name] = table["rows"]
+        total += rows[name]
+        if total > MAX_SCHEMA_ROWS:
+            raise ValueError(f"the schema makes more than {MAX_SCHEMA_ROWS:,} rows")
+        for col, fk in table["foreign_keys"].items():
+            if rows[name] and not rows[fk["table"]]:
+                raise ValueError(f"{name}.{col}: table {fk['table']!r} has no rows to reference")
+    return rows
+
+
+def foreign_keys(table, no, rows, keys, seed):
+    """A table's foreign-key columns, drawn from its parents' in-memory key arrays."""
+    rng = np.random.default_rng(chunk_seed(seed, no))
+    n = rows[table["name"]]
+    values = {}
+    if table["sized_by"]:  # first, so the counts match plan_rows
+        parent = keys[table["foreign_keys"][table["sized_by"]]["table"]]
+        values[table["sized_by"]] = np.repeat(parent, _children_counts(rng, table, len(parent)))
+    for col, fk in table["foreign_keys"].items():
+        if col != table["sized_by"]:
+            parent = keys[fk["table"]]
+            values[col] = parent[rng.integers(0, len(parent), n)] if n else parent[:0]
+    return {col: values[col] for col in table["foreign_keys"]}
+
+
+def _key_frame(table, lo, n, fk_values):
+    """Primary and foreign keys of rows lo..lo+n of a table."""
+    keys = {}
+    if table["primary_key"]:
+        keys[table["primary_key"]] = np.arange(lo + 1, lo + n + 1, dtype=np.int32)
+    for col, values in fk_values.items():
+        keys[col] = values[lo:lo + n]
+    return pd.DataFrame(keys, index=pd.RangeIndex(n))
+
+
+def zip_bytes(locale, tables, rows, fmt):
+    """Estimated size of the schema's ZIP, from SAMPLE_ROWS rows per table with realistic keys.
+
+    CSV and JSON Lines are deflated in the ZIP, Parquet is stored (and measured as CSV).
+    """
+    total = 0
+    rng = np.random.default_rng(0)
+    for table in tables:
+        n = rows[table["name"]]
+        if not n:
+            continue
+        k = min(n, SAMPLE_ROWS)
+        sample = generate_chunk(locale, list(table["columns"].values()), list(table["columns"]), 0, 0, k)
+        fks = {col: rng.integers(1, rows[fk["table"]] + 1, k, dtype=np.int32)
+               for col, fk in table["foreign_keys"].items()}
+        sample = pd.concat([_key_frame(table, n - k, k, {}), pd.DataFrame(fks), sample], axis=1)
+        if fmt == "parquet":
+            size = file_size(sample, fmt)
+        else:
+            data = FORMATS[fmt][3]([sample])
+            size = len(zlib.compress(data.read()))
+            data.close()
+        total += size / k * n
+    return total
+
+
+def table_chunks(locale, table, rows, fk_values, seed, pool=False):
+    """Yield one table of a schema as DataFrame chunks: primary key, foreign keys, then Faker columns."""
+    fields = list(table["columns"].values())
+    names = list(table["columns"])
+    for i, chunk in enumerate(generate(locale, fields, names, rows, seed, pool)):
+        yield pd.concat([_key_frame(table, i * CHUNK, len(chunk), fk_values), chunk], axis=1)
+
+
+def generate_schema(locale, tables, seed, fmt, pool=False):
+    """Generate every table of a parsed schema; return (ZIP handle with one file per table, rows per table).
+
+    Raises ValueError when the schema has too many rows or its ZIP would pass
+    MAX_OUTPUT_MB. Only key columns are held in memory: a parent's key array
+    until its last child table is written, a table's foreign keys while it is.
+    """
+    _, ext, _, write = FORMATS[fmt]
+    rows = plan_rows(tables, seed)
+    size = zip_bytes(locale, tables, rows, fmt)
+    if size > MAX_OUTPUT_MB * 1024 * 1024:
+        raise ValueError(f"the ZIP would be about {size / 1048576:,.0f} MB; "
+                         f"downloads are limited to {MAX_OUTPUT_MB} MB")
+    last_child = {fk["table"]: no for no, table in enumerate(tables) for fk in table["foreign_keys"].values()}
+    keys = {}
+    with ZipSink() as zf:
+        for no, table in enumerate(tables):
+            name = table["name"]
+            fk_values = foreign_keys(table, no, rows, keys, seed)
+            for parent in [p for p, last in last_child.items() if last == no]:
+                del keys[parent]
+            data = write(table_chunks(locale, table, rows[name], fk_values, chunk_seed(seed, no), pool))
+            del fk_values
+            zf.add_file(f"{name}.{ext}", data)
+            data.close()
+            if name in last_child:
+                keys[name] = np.arange(1, rows[name] + 1, dtype=np.int32)
+    return zf.file(), rows
+
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["faker_title"])
 
-    fields = {
-        t["faker_f_name"]: lambda f: f.name(),
-        t["faker_f_email"]: lambda f: f.email(),
-        t["faker_f_phone"]: lambda f: f.phone_number(),
-        t["faker_f_company"]: lambda f: f.company(),
-        t["faker_f_address"]: lambda f: f.address().replace("\n", ", "),
-        t["faker_f_city"]: lambda f: f.city(),
-        t["faker_f_country"]: lambda f: f.country(),
-        t["faker_f_job"]: lambda f: f.job(),
-        t["faker_f_date"]: lambda f: f.date(),
-    }
-
-    rows = st.slider(t["faker_rows"], 5, 500, 50)
-    chosen = st.multiselect(t["faker_fields"], list(fields.keys()),
+    mode_map = {t["faker_mode_table"]: "table", t["faker_mode_schema"]: "schema"}
+    mode = mode_map[st.radio(t["faker_mode"], list(mode_map), horizontal=True)]
+    if mode == "schema":
+        _run_schema(t, lang)
+        return
+
+    labels = {t[f"faker_f_{f}"]: f for f in FIELDS}
+    chosen = st.multiselect(t["faker_fields"], list(labels),
                             default=[t["faker_f_name"], t["faker_f_email"], t["faker_f_company"]])
+    c1, c2 = st.columns(2)
+    fmt = c1.selectbox(t["faker_format"], list(FORMATS), format_func=lambda f: FORMATS[f][0])
+    seed = c2.number_input(t["faker_seed"], min_value=0, max_value=2**32 - 1, value=42, help=t["faker_seed_help"])
+    locale = LOCALES.get(lang, "en_US")
+    fields = [labels[c] for c in chosen]
+    limit = MAX_ROWS
+    if fields:
+        per_row = row_bytes(locale, tuple(fields), tuple(chosen), fmt)
+        limit = max(5, min(MAX_ROWS, int(MAX_OUTPUT_MB * 1024 * 1024 / per_row)))
+    rows = st.number_input(t["faker_rows"], min_value=5, max_value=limit, value=min(50, limit), step=1000,
+                           help=t["faker_rows_help"].format(rows=f"{limit:,}", mb=MAX_OUTPUT_MB))
+    pool = st.checkbox(t["faker_pool"].format(n=POOL), value=False, help=t["faker_pool_help"])
 
     if not st.button("🎲 " + t["faker_generate"]) or not chosen:
         return
 
-    fake = Faker(LOCALES.get(lang, "en_US"))
-    data = {col: [fields[col](fake) for _ in range(rows)] for col in chosen}
-    df = pd.DataFrame(data)
-    st.dataframe(df.head(50), use_container_width=True)
+    label, ext, mime, write = FORMATS[fmt]
+    first = []
+
+    def chunks():
+        for chunk in generate(locale, fields, chosen, int(rows), int(seed), pool):
+            if not first:
+                first.append(chunk.head(50))
+            yield chunk
+
+    start = time.perf_counter()
+    data = write(chunks())
+    elapsed = time.perf_counter() - start
+    st.dataframe(first[0], use_container_width=True)
+    st.success(f"{t['faker_done']}: {int(rows):,} · {int(rows) / max(elapsed, 1e-9):,.0f} {t['faker_rate']}")
+    st.download_button(f"⬇️ {t['faker_download']} ({label})", data, file_name=f"sample_data.{ext}", mime=mime)
+
 
-    buf = io.BytesIO()
-    df.to_csv(buf, index=False)
-    st.download_button("⬇️ " + t["faker_download"], buf.getvalue(), file_name="sample_data.csv", mime="text/csv")
+def _run_schema(t, lang):
+    spec = st.text_area(t["faker_schema"], value=EXAMPLE_SCHEMA, height=320,
+                        help=t["faker_schema_help"] + " " + ", ".join(FIELDS))
+    c1, c2 = st.columns(2)
+    fmt = c1.selectbox(t["faker_format"], list(FORMATS), format_func=lambda f: FORMATS[f][0])
+    seed = c2.number_input(t["faker_seed"], min_value=0, max_value=2**32 - 1, value=42, help=t["faker_seed_help"])
+    pool = st.checkbox(t["faker_pool"].format(n=POOL), value=False, help=t["faker_pool_help"])
+
+    if not st.button("🎲 " + t["faker_generate"]):
+        return
+    try:
+        tables = parse_schema(spec)
+        start = time.perf_counter()
+        data, rows = generate_schema(LOCALES.get(lang, "en_US"), tables, int(seed), fmt, pool)
+    except ValueError as e:
+        st.error(f"{t['faker_schema_error']} {e}")
+        return
+    elapsed = time.perf_counter() - start
+    total = sum(rows.values())
+    st.success(f"{t['faker_done']}: {total:,} · {total / max(elapsed, 1e-9):,.0f} {t['faker_rate']}")
+    st.caption(" · ".join(f"{name}: {n:,}" for name, n in rows.items()))
+    st.download_button(f"⬇️ {t['faker_download']} (ZIP)", data, file_name="sample_database.zip",
+                       mime="application/zip")
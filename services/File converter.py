@@ -1,9 +1,12 @@
 import streamlit as st
 import io
 from PIL import Image
-from gtts import gTTS
-from PyPDF2 import PdfReader
-from translations import translations
+from translations import for_lang
+from lazyutil import lazy_import
+from cacheutil import content_cache
+
+gtts = lazy_import("gtts")
+PyPDF2 = lazy_import("PyPDF2")
 
 # 📁 Universal File Converter UI and logic
 
@@ -22,6 +25,7 @@ IMAGE_CONVERSIONS = {
 }
 
 
+@content_cache("File converter")
 def convert_image(uploaded_file, pil_format):
     """Convert an uploaded image to the target format, returning PNG/JPEG bytes."""
     image = Image.open(uploaded_file)
@@ -36,23 +40,24 @@ def convert_image(uploaded_file, pil_format):
     return buf.getvalue()
 
 
+@content_cache("File converter")
 def pdf_to_mp3(uploaded_file, lang_code):
     """Extract PDF text and synthesize speech, returning MP3 bytes."""
-    reader = PdfReader(uploaded_file)
+    reader = PyPDF2.PdfReader(uploaded_file)
     text = "\n".join(page.extract_text() or "" for page in reader.pages).strip()
     if not text:
         return None, "no_text"
     truncated = len(text) > MAX_TTS_CHARS
     if truncated:
         text = text[:MAX_TTS_CHARS]
-    tts = gTTS(text=text, lang=lang_code)
+    tts = gtts.gTTS(text=text, lang=lang_code)
     buf = io.BytesIO()
     tts.write_to_fp(buf)
     return buf.getvalue(), ("truncated" if truncated else None)
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["fileconv_title"])
 
     # 🕽 File uploader
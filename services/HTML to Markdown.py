@@ -1,10 +1,10 @@
 import streamlit as st
 from markdownify import markdownify as mdify
-from translations import translations
+from translations import for_lang
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["html2md_title"])
 
     src = st.text_area(t["html2md_input"], height=240, placeholder="<h1>Title</h1><p>Some <b>HTML</b>...</p>")
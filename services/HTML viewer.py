@@ -2,7 +2,7 @@ import re
 
 import streamlit as st
 
-from translations import translations
+from translations import for_lang
 
 
 SAMPLE = """<!doctype html>
@@ -54,7 +54,7 @@ def _document(source, allow_external):
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["htmlview_title"])
     st.caption(t["htmlview_intro"])
 
@@ -1,7 +1,7 @@
 import re
 from collections import Counter
 import streamlit as st
-from translations import translations
+from translations import for_lang
 
 # Small multilingual stopword set (EN/FR/DE/PL/UK) — good enough for keyword ranking.
 STOPWORDS = set("""
@@ -16,7 +16,7 @@ ta i j v na z do ne shcho tse yak dlya bo ale abo ki vsi tilky
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["kw_title"])
 
     text = st.text_area(t["kw_input"], height=200)
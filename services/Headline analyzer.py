@@ -1,6 +1,6 @@
 import re
 import streamlit as st
-from translations import translations
+from translations import for_lang
 
 # English-oriented "power words" — detection is best for EN headlines.
 POWER_WORDS = {
@@ -11,7 +11,7 @@ POWER_WORDS = {
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["head_title"])
 
     headline = st.text_input(t["head_input"])
@@ -1,8 +1,10 @@
 import io
-import zipfile
 import streamlit as st
 from PIL import Image
-from translations import translations
+from translations import for_lang
+from batchutil import pool_map
+from ziputil import ZipSink
+from cacheutil import content_cache
 
 FAVICON_SIZES = [16, 32, 48, 180, 192]
 EXT = {"PNG": "png", "JPEG": "jpg", "WEBP": "webp"}
@@ -36,20 +38,33 @@ def _encode(img, fmt, quality):
 
 def _make_favicon_pack(img):
     base = _crop_square(img.convert("RGBA"))
-    zip_buf = io.BytesIO()
-    with zipfile.ZipFile(zip_buf, "w", zipfile.ZIP_DEFLATED) as zf:
+    with ZipSink() as zf:
         for size in FAVICON_SIZES:
             resized = base.resize((size, size), Image.LANCZOS)
             out = io.BytesIO()
             resized.save(out, format="PNG", optimize=True)
-            zf.writestr(f"favicon-{size}x{size}.png", out.getvalue())
+            zf.add(f"favicon-{size}x{size}.png", out.getvalue())
         # A classic multi-resolution .ico as well.
         ico = io.BytesIO()
         base.resize((64, 64), Image.LANCZOS).save(
             ico, format="ICO", sizes=[(16, 16), (32, 32), (48, 48)]
         )
-        zf.writestr("favicon.ico", ico.getvalue())
-    return zip_buf.getvalue()
+        zf.add("favicon.ico", ico.getvalue())
+    return zf.file().read()
+
+
+@content_cache("Image resizer")
+def _resize(data, fmt, max_dim, quality):
+    """Resize (0 = keep size) and encode image bytes; returns (bytes, (width, height))."""
+    work = Image.open(io.BytesIO(data))
+    if max_dim > 0:
+        work.thumbnail((max_dim, max_dim), Image.LANCZOS)
+    return _encode(work, fmt, quality), work.size
+
+
+@content_cache("Image resizer")
+def _favicon_pack(data):
+    return _make_favicon_pack(Image.open(io.BytesIO(data)))
 
 
 def _kb(n_bytes):
@@ -57,7 +72,7 @@ def _kb(n_bytes):
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["imgresize_title"])
 
     batch_map = {t["batch_single"]: "single", t["batch_multi"]: "batch"}
@@ -95,7 +110,7 @@ def run(lang):
     if mode == t["imgresize_mode_favicon"]:
         st.info(t["imgresize_favicon_info"])
         if st.button("⚙️ " + t["imgresize_process"]):
-            zip_bytes = _make_favicon_pack(img)
+            zip_bytes = _favicon_pack(orig_bytes)
             st.success(t["imgresize_success"])
             st.download_button(
                 "⬇️ " + t["imgresize_download_zip"],
@@ -112,13 +127,10 @@ def run(lang):
     quality = st.slider(t["imgresize_quality"], 10, 100, 85, disabled=(fmt == "PNG"))
 
     if st.button("⚙️ " + t["imgresize_process"]):
-        work = img.copy()
-        if max_dim > 0:
-            work.thumbnail((max_dim, max_dim), Image.LANCZOS)
-        out_bytes = _encode(work, fmt, quality)
+        out_bytes, (out_w, out_h) = _resize(orig_bytes, fmt, max_dim, quality)
 
         with col2:
-            st.image(out_bytes, caption=f"{t['imgresize_result']} · {_kb(len(out_bytes))} · {work.size[0]}×{work.size[1]}", use_container_width=True)
+            st.image(out_bytes, caption=f"{t['imgresize_result']} · {_kb(len(out_bytes))} · {out_w}×{out_h}", use_container_width=True)
 
         saved = 1 - (len(out_bytes) / len(orig_bytes)) if orig_bytes else 0
         if saved > 0:
@@ -144,8 +156,7 @@ def _run_batch(t):
     if not files or not st.button("⚙️ " + t["imgresize_process"]):
         return
 
-    zip_buf = io.BytesIO()
-    with zipfile.ZipFile(zip_buf, "w", zipfile.ZIP_DEFLATED) as zf:
+    def jobs():  # decoded lazily, so only the in-flight images are held in memory
         for i, f in enumerate(files):
             try:
                 img = Image.open(f)
@@ -154,7 +165,10 @@ def _run_batch(t):
                 continue
             if max_dim > 0:
                 img.thumbnail((max_dim, max_dim), Image.LANCZOS)
-            stem = f.name.rsplit(".", 1)[0] or f"image_{i + 1}"
-            zf.writestr(f"{stem}.{EXT[fmt]}", _encode(img, fmt, quality))
+            yield f.name.rsplit(".", 1)[0] or f"image_{i + 1}", (img, fmt, quality)
+
+    with ZipSink() as zf:
+        for stem, data in pool_map(_encode, jobs(), total=len(files), tagged=True):
+            zf.add(f"{stem}.{EXT[fmt]}", data)
     st.success(f"{t['batch_done']}: {len(files)}")
-    st.download_button("⬇️ " + t["batch_zip"], zip_buf.getvalue(), file_name="images.zip", mime="application/zip")
+    st.download_button("⬇️ " + t["batch_zip"], zf.file(), file_name="images.zip", mime="application/zip")
@@ -1,27 +1,14 @@
 import io
-import zipfile
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 import streamlit as st
-from translations import translations
+from translations import for_lang
+import fontutil
+from batchutil import pool_map
+from ziputil import ZipSink
 
 # Position label (language-neutral arrows) -> (fx, fy) anchor fractions.
 POSITIONS = {"↖": (0, 0), "↗": (1, 0), "●": (0.5, 0.5), "↙": (0, 1), "↘": (1, 1)}
 
-FONT_PATHS = [
-    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-    "DejaVuSans.ttf",
-]
-
-
-def _font(size):
-    for p in FONT_PATHS:
-        try:
-            return ImageFont.truetype(p, size)
-        except Exception:
-            continue
-    return ImageFont.load_default()
-
 
 def _anchor(outer, inner, fx, fy, margin):
     x = int((outer[0] - inner[0]) * fx)
@@ -33,7 +20,7 @@ def _anchor(outer, inner, fx, fy, margin):
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["wm_title"])
 
     batch_map = {t["batch_single"]: "single", t["batch_multi"]: "batch"}
@@ -55,17 +42,19 @@ def run(lang):
         if not text.strip() and logo_img is None:
             st.warning(t["wm_empty"])
             return
-        zip_buf = io.BytesIO()
-        with zipfile.ZipFile(zip_buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        def jobs():  # decoded lazily, so only the in-flight images are held in memory
             for i, f in enumerate(files):
                 try:
                     base = Image.open(f).convert("RGBA")
                 except Exception:
                     continue
-                stem = f.name.rsplit(".", 1)[0] or f"image_{i + 1}"
-                zf.writestr(f"{stem}.png", _apply(base, text, logo_img, pos, opacity, size))
+                yield f.name.rsplit(".", 1)[0] or f"image_{i + 1}", (base, text, logo_img, pos, opacity, size)
+
+        with ZipSink() as zf:
+            for stem, data in pool_map(_apply, jobs(), total=len(files), tagged=True):
+                zf.add(f"{stem}.png", data)
         st.success(f"{t['batch_done']}: {len(files)}")
-        st.download_button("⬇️ " + t["batch_zip"], zip_buf.getvalue(), file_name="watermarked.zip", mime="application/zip")
+        st.download_button("⬇️ " + t["batch_zip"], zf.file(), file_name="watermarked.zip", mime="application/zip")
         return
 
     up = st.file_uploader(t["wm_upload"], type=["png", "jpg", "jpeg", "webp"])
@@ -94,7 +83,7 @@ def _apply(base, text, logo_img, pos, opacity, size):
         overlay.alpha_composite(lg, _anchor((W, H), lg.size, fx, fy, margin))
     else:
         draw = ImageDraw.Draw(overlay)
-        font = _font(max(12, int(H * size / 100)))
+        font = fontutil.font(max(12, int(H * size / 100)), "sans-bold", "sans")
         bbox = draw.textbbox((0, 0), text, font=font)
         x, y = _anchor((W, H), (bbox[2] - bbox[0], bbox[3] - bbox[1]), fx, fy, margin)
         draw.text((x - bbox[0], y - bbox[1]), text, font=font, fill=(255, 255, 255, int(255 * opacity / 100)))
@@ -1,14 +1,14 @@
 import io
 from PIL import Image
 import streamlit as st
-from translations import translations
+from translations import for_lang
 
 # Page sizes in points (1/72"). None = fit each page to its image.
 PAGE_SIZES = {"A4": (595, 842), "Letter": (612, 792), "Fit to image": None}
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["img2pdf_title"])
 
     files = st.file_uploader(
@@ -2,11 +2,11 @@ import io
 import json
 import pandas as pd
 import streamlit as st
-from translations import translations
+from translations import for_lang
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["json_title"])
 
     raw = st.text_area(t["json_input"], height=240, placeholder='{"hello": "world"}')
@@ -1,10 +1,10 @@
 import streamlit as st
-from translations import translations
+from translations import for_lang
 from pdfutil import make_pdf, pdf_bytes
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["label_title"])
 
     raw = st.text_area(t["label_input"], height=180, placeholder="Label A\nLabel B\nLabel C")
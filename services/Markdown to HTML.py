@@ -1,7 +1,7 @@
 import markdown as md
 import streamlit as st
 import streamlit.components.v1 as components
-from translations import translations
+from translations import for_lang
 
 CSS = (
     "<style>body{font-family:'Segoe UI',Arial,sans-serif;line-height:1.6;color:#1f2937;"
@@ -16,7 +16,7 @@ CSS = (
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["md2html_title"])
 
     src = st.text_area(t["md2html_input"], height=260, placeholder="# Hello\n\nSome **markdown**...")
@@ -1,22 +1,8 @@
 import io
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 import streamlit as st
-from translations import translations
-
-FONT_PATHS = [
-    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-    "DejaVuSans.ttf",
-]
-
-
-def _font(size):
-    for p in FONT_PATHS:
-        try:
-            return ImageFont.truetype(p, size)
-        except Exception:
-            continue
-    return ImageFont.load_default()
+from translations import for_lang
+import fontutil
 
 
 def _draw_caption(draw, text, font, W, y_top):
@@ -33,7 +19,7 @@ def _draw_caption(draw, text, font, W, y_top):
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["meme_title"])
 
     up = st.file_uploader(t["meme_upload"], type=["png", "jpg", "jpeg", "webp"])
@@ -49,7 +35,7 @@ def run(lang):
     img = Image.open(up).convert("RGB")
     W, H = img.size
     draw = ImageDraw.Draw(img)
-    font = _font(max(20, W // 12))
+    font = fontutil.font(max(20, W // 12), "sans-bold", "sans")
 
     if top.strip():
         _draw_caption(draw, top, font, W, int(H * 0.03))
@@ -2,8 +2,12 @@ import streamlit as st
 import os
 import tempfile
 import re
-from markitdown import MarkItDown
-from translations import translations
+from translations import for_lang
+from lazyutil import lazy_import
+
+from cacheutil import content_cache
+
+markitdown = lazy_import("markitdown")
 
 # 📝 Office to Markdown Tool
 
@@ -25,13 +29,14 @@ def extract_youtube_id(url):
             return match.group(1)
     return None
 
+@content_cache("Office and YouTube to MD", cache_if=lambda result: not result[1])
 def convert_file_to_markdown(file_data, filename):
     try:
         ext = get_file_extension(filename)
         with tempfile.NamedTemporaryFile(delete=False, suffix=f".{ext}") as tmp_file:
             tmp_file.write(file_data)
             tmp_file_path = tmp_file.name
-        md = MarkItDown(enable_plugins=False)
+        md = markitdown.MarkItDown(enable_plugins=False)
         result = md.convert(tmp_file_path)
         os.unlink(tmp_file_path)
         return result.text_content, None
@@ -40,7 +45,7 @@ def convert_file_to_markdown(file_data, filename):
 
 def convert_youtube_to_markdown(url):
     try:
-        md = MarkItDown(enable_plugins=False)
+        md = markitdown.MarkItDown(enable_plugins=False)
         result = md.convert(url)
         return result.text_content, None
     except Exception as e:
@@ -56,7 +61,7 @@ def get_supported_formats():
     }
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
 
     if "markdown_content" not in st.session_state:
         st.session_state.markdown_content = ""
@@ -1,10 +1,22 @@
+import io
 import streamlit as st
-from PyPDF2 import PdfReader
-from translations import translations
+from translations import for_lang
+from lazyutil import lazy_import
+
+from cacheutil import content_cache
+
+PyPDF2 = lazy_import("PyPDF2")
+
+
+@content_cache("PDF to text")
+def _extract_pages(data):
+    """Text of every page of a PDF given as bytes."""
+    reader = PyPDF2.PdfReader(io.BytesIO(data))
+    return [page.extract_text() or "" for page in reader.pages]
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["pdftxt_title"])
 
     up = st.file_uploader(t["pdftxt_upload"], type=["pdf"])
@@ -14,12 +26,11 @@ def run(lang):
     if not st.button("📄 " + t["pdftxt_extract"]):
         return
     try:
-        reader = PdfReader(up)
+        pages = _extract_pages(up.getvalue())
     except Exception as e:
         st.error(f"{t['pdftxt_error']} {e}")
         return
 
-    pages = [page.extract_text() or "" for page in reader.pages]
     text = "\n\n".join(pages).strip()
 
     st.caption(f"{t['pdftxt_pages']}: {len(pages)}")
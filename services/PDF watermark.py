@@ -1,12 +1,14 @@
 import io
 import streamlit as st
-from PyPDF2 import PdfReader, PdfWriter
-from translations import translations
+from translations import for_lang
 from pdfutil import make_pdf
+from lazyutil import lazy_import
+
+PyPDF2 = lazy_import("PyPDF2")
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["pdfwm_title"])
 
     up = st.file_uploader(t["pdfwm_upload"], type=["pdf"])
@@ -19,7 +21,7 @@ def run(lang):
         return
 
     try:
-        reader = PdfReader(up)
+        reader = PyPDF2.PdfReader(up)
         page0 = reader.pages[0]
         w, h = float(page0.mediabox.width), float(page0.mediabox.height)
 
@@ -32,9 +34,9 @@ def run(lang):
         with pdf.rotation(45, w / 2, h / 2):
             pdf.set_xy(0, h / 2 - 30)
             pdf.cell(w, 60, text, align="C")
-        stamp = PdfReader(io.BytesIO(bytes(pdf.output()))).pages[0]
+        stamp = PyPDF2.PdfReader(io.BytesIO(bytes(pdf.output()))).pages[0]
 
-        writer = PdfWriter()
+        writer = PyPDF2.PdfWriter()
         for page in reader.pages:
             page.merge_page(stamp)
             writer.add_page(page)
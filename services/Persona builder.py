@@ -1,7 +1,7 @@
 import html
 import streamlit as st
 import streamlit.components.v1 as components
-from translations import translations
+from translations import for_lang
 
 
 def _card(title, body, primary):
@@ -13,7 +13,7 @@ def _card(title, body, primary):
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["persona_title"])
 
     left, right = st.columns([1, 1], gap="large")
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 
 import streamlit as st
 
-from translations import translations
+from translations import for_lang
 
 
 VALID_STATUSES = {"Succeeded", "Failed", "Skipped", "TimedOut"}
@@ -187,7 +187,7 @@ def _source_view(raw, line):
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["paj_title"])
     st.caption(t["paj_intro"])
     raw = st.text_area(t["paj_input"], height=330, placeholder='{"properties":{"definition":{"triggers":{},"actions":{}}}}')
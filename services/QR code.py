@@ -1,56 +1,53 @@
 import streamlit as st
 import qrcode
-from PIL import Image, ImageDraw, ImageFont
-from translations import translations
+from PIL import Image
+from fpdf.enums import RenderStyle
+from translations import for_lang
 import pandas as pd
 import io
-import zipfile
+import functools
+import numpy as np
+from batchutil import pool_map
+from ziputil import ZipSink
+from tablutil import read_table, columns, CHUNK_ROWS
+from gradutil import ramp
+from pdfutil import make_pdf, pdf_bytes
 
-_SHEET_FONT_PATHS = ["/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"]
+def make_qr_sheet(matrices, file_names, style="solid", color1="#000000", color2="#000000", cols=3, rows=4):
+    """Lay QR codes (module matrices from qr_matrix, with labels) onto A4 pages and return vector PDF bytes.
 
-
-def _sheet_font(size):
-    for p in _SHEET_FONT_PATHS:
-        try:
-            return ImageFont.truetype(p, size)
-        except Exception:
-            continue
-    return ImageFont.load_default()
-
-
-def make_qr_sheet(qr_images, file_names, cols=3, rows=4):
-    """Lay QR codes (with labels) onto A4 pages and return PDF bytes."""
-    PW, PH = 1240, 1754  # A4 at ~150 dpi
-    margin = 60
-    cell_w = (PW - 2 * margin) // cols
-    cell_h = (PH - 2 * margin) // rows
+    Each horizontal run of dark modules is one filled rectangle, so nothing is
+    rasterized or resampled and the codes stay sharp at any print resolution.
+    """
+    pdf, fam = make_pdf()
+    pdf.set_auto_page_break(False)
+    pdf.set_font(fam, size=10)
+    margin = 10  # mm
+    cell_w = (pdf.w - 2 * margin) / cols
+    cell_h = (pdf.h - 2 * margin) / rows
+    qr_size = min(cell_w, cell_h) - 12
     per_page = cols * rows
-    font = _sheet_font(22)
-    pages = []
-    page = None
-    for i, (img, name) in enumerate(zip(qr_images, file_names)):
+    color1, color2 = _colors(style, color1, color2)
+    for i, (dark, name) in enumerate(zip(matrices, file_names)):
         if i % per_page == 0:
-            page = Image.new("RGB", (PW, PH), "white")
+            pdf.add_page()
         r, c = divmod(i % per_page, cols)
-        x = margin + c * cell_w
+        x = margin + c * cell_w + (cell_w - qr_size) / 2
         y = margin + r * cell_h
-        qr_size = min(cell_w, cell_h) - 70
-        qr = img.convert("RGB").resize((qr_size, qr_size))
-        page.paste(qr, (x + (cell_w - qr_size) // 2, y))
-        draw = ImageDraw.Draw(page)
-        label = str(name)[:24]
-        bbox = draw.textbbox((0, 0), label, font=font)
-        draw.text((x + (cell_w - (bbox[2] - bbox[0])) // 2, y + qr_size + 8), label, font=font, fill="black")
-        if i % per_page == per_page - 1:
-            pages.append(page)
-    if page is not None and (page not in pages):
-        pages.append(page)
-    buf = io.BytesIO()
-    pages[0].save(buf, "PDF", save_all=True, append_images=pages[1:])
-    return buf.getvalue()
+        unit = qr_size / dark.shape[0]
+        row_colors = [tuple(rgb) for rgb in ramp(color1, color2, dark.shape[0]).tolist()]  # gradient runs top to bottom
+        fill = None
+        for row, col, length in _runs(dark):
+            if row_colors[row] != fill:
+                fill = row_colors[row]
+                pdf.set_fill_color(*fill)
+            pdf.rect(x + col * unit, y + row * unit, length * unit, unit, style=RenderStyle.F)
+        pdf.set_xy(margin + c * cell_w, y + qr_size + 1)
+        pdf.cell(cell_w, 5, str(name)[:24], align="C")
+    return pdf_bytes(pdf)
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
 
     st.markdown(f"<h2 style='text-align:center'>{t['title']}</h2>", unsafe_allow_html=True)
 
@@ -80,9 +77,13 @@ def run_single_qr(t):
             st.warning("❗ Please enter some text.")
             return
 
-        img = generate_qr_code(text, style, color1, color2)
+        dark = qr_matrix(text)
+        img = render_qr(dark, style, color1, color2)
         st.image(img, caption=t["download"])
-        st.download_button(label=t["download"], data=img_to_bytes(img), file_name="qrcode.png", mime="image/png")
+        col_png, col_svg = st.columns(2)
+        col_png.download_button(label=t["download"], data=img_to_bytes(img), file_name="qrcode.png", mime="image/png")
+        col_svg.download_button(label=t["qr_download_svg"], data=qr_svg(dark, style, color1, color2),
+                                file_name="qrcode.svg", mime="image/svg+xml")
 
 def run_batch_qr(t):
     """Batch QR Code generation from Excel file"""
@@ -113,68 +114,62 @@ def run_batch_qr(t):
         color1 = col1.color_picker(t["color1"], "#000000")
         color2 = col2.color_picker(t["color2"], "#000000")
     
+    fmt = st.radio(t["qr_format"], ["png", "svg"], format_func=str.upper, horizontal=True)
     uploaded_file = st.file_uploader(t["qr_upload"], type=['xlsx', 'xls', 'csv'])
     
     if uploaded_file and st.button(t["qr_generate_batch"]):
         try:
-            if uploaded_file.name.endswith('.csv'):
-                df = pd.read_csv(uploaded_file)
-            else:
-                df = pd.read_excel(uploaded_file)
-            
             # Get column names (handle variations)
-            cols = df.columns.tolist()
+            cols = columns(uploaded_file)
             text_col = cols[0]  # First column for URLs/text
             name_col = cols[1] if len(cols) > 1 else None
             
-            qr_images = []
+            texts = []
             file_names = []
             
-            progress_bar = st.progress(0)
-            status_text = st.empty()
+            # Only the two columns used are read, as text, chunk by chunk
+            row_no = 0
+            for chunk in read_table(uploaded_file, usecols=cols[:2], dtype=str, chunksize=CHUNK_ROWS):
+                names = chunk[name_col] if name_col else [None] * len(chunk)
+                for text_value, name_value in zip(chunk[text_col], names):
+                    row_no += 1
+                    if pd.isna(text_value):
+                        continue
+                    text_value = text_value.strip()
+                    if not text_value or text_value.lower() == 'url or text':
+                        continue
+                    
+                    # Generate file name
+                    if name_col and pd.notna(name_value) and name_value.strip():
+                        file_name = name_value.strip()
+                    else:
+                        file_name = f"qr_code_{row_no}"
+                    
+                    texts.append(text_value)
+                    file_names.append(file_name)
             
-            for idx, row in df.iterrows():
-                text_value = str(row[text_col]).strip()
-                if not text_value or text_value.lower() == 'url or text':
-                    continue
-                
-                # Generate file name
-                if name_col and pd.notna(row[name_col]):
-                    file_name = str(row[name_col]).strip()
-                else:
-                    file_name = f"qr_code_{idx + 1}"
-                
-                # Generate QR code
-                img = generate_qr_code(text_value, style, color1, color2)
-                qr_images.append(img)
-                file_names.append(file_name)
-                
-                # Update progress
-                progress = (idx + 1) / len(df)
-                progress_bar.progress(progress)
-                status_text.text(f"Generated {idx + 1}/{len(df)} QR codes...")
+            # Generate QR codes across the worker pool and stream each file into the ZIP
+            # as it arrives; only the module matrices are kept (for the print sheet/preview).
+            matrices = []
+            jobs = [(text_value, style, color1, color2, fmt) for text_value in texts]
+            with ZipSink() as zip_file:
+                for (data, dark), name in zip(pool_map(generate_qr_file, jobs, progress_text="QR codes"), file_names):
+                    zip_file.add(f"{name}.{fmt}", data)
+                    matrices.append(dark)
             
-            if qr_images:
+            if matrices:
                 st.success(t["qr_batch_success"])
                 
-                # Create ZIP file
-                zip_buffer = io.BytesIO()
-                with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                    for img, name in zip(qr_images, file_names):
-                        img_bytes = img_to_bytes(img)
-                        zip_file.writestr(f"{name}.png", img_bytes)
-                
-                zip_buffer.seek(0)
                 col_zip, col_pdf = st.columns(2)
                 col_zip.download_button(
                     label=t["qr_download_all"],
-                    data=zip_buffer.getvalue(),
+                    data=zip_file.file(),
                     file_name="qr_codes.zip",
                     mime="application/zip"
                 )
                 col_pdf.download_button(
                     label=t["qr_print_sheet"],
-                    data=make_qr_sheet(qr_images, file_names),
+                    data=make_qr_sheet(matrices, file_names, style, color1, color2),
                     file_name="qr_print_sheet.pdf",
                     mime="application/pdf"
                 )
@@ -182,48 +177,95 @@ def run_batch_qr(t):
                 # Show preview
                 st.subheader("Preview")
                 preview_cols = st.columns(3)
-                for idx, (img, name) in enumerate(zip(qr_images[:9], file_names[:9])):
+                for idx, (dark, name) in enumerate(zip(matrices[:9], file_names[:9])):
                     with preview_cols[idx % 3]:
-                        st.image(img, caption=name, use_container_width=True)
+                        st.image(render_qr(dark, style, color1, color2), caption=name, use_container_width=True)
             else:
                 st.warning("No valid data found in the file.")
             
         except Exception as e:
             st.error(f"{t['qr_batch_error']}{str(e)}")
 
-def generate_qr_code(text, style, color1, color2):
-    """Generate a QR code with specified style and colors"""
+_BOX = 10  # pixels per module (qrcode's default box_size)
+
+
+@functools.lru_cache(maxsize=64)
+def _palette(color1, color2):
+    """White plus the dark-module colours: one for a flat colour, a 255-step ramp for a gradient."""
+    steps = 1 if color1.lower() == color2.lower() else 255
+    return [255, 255, 255, *ramp(color1, color2, steps).ravel().tolist()], steps
+
+
+@functools.lru_cache(maxsize=64)
+def _row_index(size, steps):
+    """Palette index of the dark colour on each pixel row, top to bottom."""
+    return (1 + np.arange(size) * (steps - 1) // max(1, size - 1)).astype(np.uint8)
+
+
+def _colors(style, color1, color2):
+    """(top, bottom) colour of the dark modules for a style."""
+    if style == "gradient":
+        return color1, color2
+    if style == "solid":
+        return color1, color1
+    return "#000000", "#000000"
+
+
+def _runs(dark):
+    """(row, first column, length) of every horizontal run of dark modules, row by row."""
+    edges = np.diff(np.pad(dark.astype(np.int8), ((0, 0), (1, 1))), axis=1)
+    rows, starts = np.nonzero(edges == 1)
+    _, ends = np.nonzero(edges == -1)
+    return zip(rows.tolist(), starts.tolist(), (ends - starts).tolist())
+
+
+def qr_matrix(text):
+    """Boolean module matrix of a QR code for `text`, quiet zone included (True = dark)."""
     qr = qrcode.QRCode(error_correction=qrcode.constants.ERROR_CORRECT_H)
     qr.add_data(text)
     qr.make(fit=True)
+    return np.array(qr.get_matrix(), dtype=bool)
 
-    img = qr.make_image(fill_color="black", back_color="white").convert("RGBA")
-    width, height = img.size
-
-    if style == "gradient":
-        gradient = Image.new("RGBA", (width, height), "white")
-        draw = ImageDraw.Draw(gradient)
-        for y in range(height):
-            ratio = y / height
-            r = int(int(color1[1:3], 16) * (1 - ratio) + int(color2[1:3], 16) * ratio)
-            g = int(int(color1[3:5], 16) * (1 - ratio) + int(color2[3:5], 16) * ratio)
-            b = int(int(color1[5:7], 16) * (1 - ratio) + int(color2[5:7], 16) * ratio)
-            draw.line([(0, y), (width, y)], fill=(r, g, b, 255))
-
-        # Mask black pixels
-        bw = img.convert("L").point(lambda x: 0 if x > 128 else 255)
-        img = Image.composite(gradient, Image.new("RGBA", img.size, "white"), bw)
-
-    elif style == "solid":
-        r, g, b = tuple(int(color1[i:i + 2], 16) for i in (1, 3, 5))
-        solid = Image.new("RGBA", img.size, (r, g, b, 255))
-        white = Image.new("RGBA", img.size, "white")
-        # Mask: dark QR modules -> use the chosen color, light modules -> white.
-        mask = img.convert("L").point(lambda x: 255 if x < 128 else 0)
-        img = Image.composite(solid, white, mask)
 
+def render_qr(dark, style, color1, color2):
+    """A module matrix as a palette image, _BOX pixels per module."""
+    palette, steps = _palette(*_colors(style, color1, color2))
+    # Colour each pixel row at module width (gradient runs top to bottom), widen the modules last.
+    size = dark.shape[0] * _BOX
+    rows = np.repeat(dark, _BOX, axis=0) * _row_index(size, steps)[:, None]
+    img = Image.fromarray(np.repeat(rows, _BOX, axis=1))
+    img.putpalette(palette)
     return img
 
+
+def qr_svg(dark, style, color1, color2):
+    """A module matrix as an SVG document: one path of merged module runs on white."""
+    n = dark.shape[0]
+    color1, color2 = _colors(style, color1, color2)
+    path = "".join(f"M{col} {row}h{length}v1h-{length}z" for row, col, length in _runs(dark))
+    if color1 == color2:
+        defs, fill = "", color1
+    else:
+        defs = (f'<defs><linearGradient id="g" gradientUnits="userSpaceOnUse" x1="0" y1="0" x2="0" y2="{n}">'
+                f'<stop offset="0" stop-color="{color1}"/><stop offset="1" stop-color="{color2}"/>'
+                f'</linearGradient></defs>')
+        fill = "url(#g)"
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {n} {n}" width="{n * _BOX}" '
+            f'height="{n * _BOX}" shape-rendering="crispEdges">{defs}'
+            f'<rect width="{n}" height="{n}" fill="#ffffff"/><path d="{path}" fill="{fill}"/></svg>')
+
+
+def generate_qr_code(text, style, color1, color2):
+    """Generate a QR code with specified style and colors (a palette image)"""
+    return render_qr(qr_matrix(text), style, color1, color2)
+
+def generate_qr_file(text, style, color1, color2, fmt="png"):
+    """One batch item: (PNG or SVG bytes, module matrix) — the matrix feeds the print sheet and preview."""
+    dark = qr_matrix(text)
+    if fmt == "svg":
+        return qr_svg(dark, style, color1, color2).encode("utf-8"), dark
+    return img_to_bytes(render_qr(dark, style, color1, color2)), dark
+
 def img_to_bytes(img):
     """Convert PIL image to bytes"""
     buf = io.BytesIO()
@@ -1,12 +1,12 @@
 import streamlit as st
-from translations import translations
+from translations import for_lang
 from pdfutil import make_pdf, pdf_bytes
 
 PRIMARY = (67, 97, 238)
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["cv_title"])
 
     name = st.text_input(t["cv_name"])
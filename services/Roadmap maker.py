@@ -1,25 +1,11 @@
 import io
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 import streamlit as st
-from translations import translations
-
-FONT_PATHS = [
-    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-]
-
-
-def _font(size):
-    for p in FONT_PATHS:
-        try:
-            return ImageFont.truetype(p, size)
-        except Exception:
-            continue
-    return ImageFont.load_default()
-
+from translations import for_lang
+import fontutil
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["road_title"])
 
     heading = st.text_input(t["road_heading"], placeholder="Product Roadmap 2026")
@@ -45,12 +31,12 @@ def run(lang):
     img = Image.new("RGB", (W, H), "white")
     d = ImageDraw.Draw(img)
     if heading.strip():
-        d.text((40, 24), heading, font=_font(28), fill="#111827")
+        d.text((40, 24), heading, font=fontutil.font(28, "sans-bold", "sans"), fill="#111827")
 
     y = H // 2 + 20
     d.line([(70, y), (W - 70, y)], fill=primary, width=5)
     step = (W - 140) // (n - 1) if n > 1 else 0
-    lab_font, date_font = _font(19), _font(15)
+    lab_font, date_font = fontutil.font(19, "sans-bold", "sans"), fontutil.font(15, "sans-bold", "sans")
     for i, (label, date) in enumerate(items):
         x = 70 + (step * i if n > 1 else (W - 140) // 2)
         d.ellipse([x - 11, y - 11, x + 11, y + 11], fill=primary)
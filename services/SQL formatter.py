@@ -1,10 +1,12 @@
-import sqlparse
 import streamlit as st
-from translations import translations
+from translations import for_lang
+from lazyutil import lazy_import
+
+sqlparse = lazy_import("sqlparse")
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["sql_title"])
 
     raw = st.text_area(t["sql_input"], height=240, placeholder="select id,name from users where age>18 order by name")
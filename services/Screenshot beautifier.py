@@ -1,7 +1,8 @@
 import io
 from PIL import Image, ImageDraw, ImageFilter
 import streamlit as st
-from translations import translations
+from translations import for_lang
+from gradutil import gradient
 
 
 def _hex(c):
@@ -9,18 +10,6 @@ def _hex(c):
     return tuple(int(c[i:i + 2], 16) for i in (0, 2, 4))
 
 
-def _gradient(size, c1, c2):
-    w, h = size
-    base = Image.new("RGB", size, c1)
-    top = Image.new("RGB", size, c2)
-    mask = Image.new("L", size)
-    md = mask.load()
-    for y in range(h):
-        for x in range(w):
-            md[x, y] = int(255 * ((x + y) / (w + h)))
-    return Image.composite(top, base, mask)
-
-
 def _round(img, radius):
     mask = Image.new("L", img.size, 0)
     ImageDraw.Draw(mask).rounded_rectangle([0, 0, img.size[0], img.size[1]], radius=radius, fill=255)
@@ -30,7 +19,7 @@ def _round(img, radius):
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["beaut_title"])
 
     up = st.file_uploader(t["beaut_upload"], type=["png", "jpg", "jpeg", "webp"])
@@ -48,7 +37,7 @@ def run(lang):
     shot = Image.open(up).convert("RGBA")
     shot = _round(shot, radius)
     W, H = shot.width + padding * 2, shot.height + padding * 2
-    canvas = _gradient((W, H), _hex(bg1), _hex(bg2)).convert("RGBA")
+    canvas = gradient((W, H), _hex(bg1), _hex(bg2), "diagonal").convert("RGBA")
 
     if shadow > 0:
         sh = Image.new("RGBA", (W, H), (0, 0, 0, 0))
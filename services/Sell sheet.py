@@ -1,11 +1,11 @@
 import html
 import streamlit as st
 import streamlit.components.v1 as components
-from translations import translations
+from translations import for_lang
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["sell_title"])
 
     left, right = st.columns(2, gap="large")
@@ -1,7 +1,9 @@
 import io
-from PIL import Image, ImageDraw, ImageFont
+from PIL import ImageDraw
 import streamlit as st
-from translations import translations
+from translations import for_lang
+import fontutil
+from gradutil import gradient
 
 PRESETS = {
     "LinkedIn Banner (1584×396)": (1584, 396),
@@ -9,19 +11,6 @@ PRESETS = {
     "Facebook Cover (820×312)": (820, 312),
     "YouTube Banner (2048×1152)": (2048, 1152),
 }
-FONT_PATHS = {
-    "B": "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-    "": "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-}
-
-
-def _font(size, bold=True):
-    for key in (("B", "") if bold else ("", "B")):
-        try:
-            return ImageFont.truetype(FONT_PATHS[key], size)
-        except Exception:
-            continue
-    return ImageFont.load_default()
 
 
 def _hex(c):
@@ -29,20 +18,8 @@ def _hex(c):
     return tuple(int(c[i:i + 2], 16) for i in (0, 2, 4))
 
 
-def _gradient(size, c1, c2):
-    w, h = size
-    base, top = Image.new("RGB", size, c1), Image.new("RGB", size, c2)
-    mask = Image.new("L", size)
-    px = mask.load()
-    for x in range(w):
-        v = int(255 * x / max(1, w - 1))
-        for y in range(h):
-            px[x, y] = v
-    return Image.composite(top, base, mask)
-
-
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["sb_title"])
 
     preset = st.selectbox(t["sb_preset"], list(PRESETS.keys()))
@@ -56,12 +33,12 @@ def run(lang):
         return
 
     size = PRESETS[preset]
-    img = _gradient(size, _hex(bg1), _hex(bg2))
+    img = gradient(size, _hex(bg1), _hex(bg2), "horizontal")
     d = ImageDraw.Draw(img)
     W, H = size
-    d.text((60, H // 2 - 40), name, font=_font(max(28, H // 8), True), fill="#ffffff")
+    d.text((60, H // 2 - 40), name, font=fontutil.font(max(28, H // 8), "sans-bold", "sans"), fill="#ffffff")
     if tagline.strip():
-        d.text((62, H // 2 + 24), tagline, font=_font(max(16, H // 16), False), fill=(255, 255, 255, 220))
+        d.text((62, H // 2 + 24), tagline, font=fontutil.font(max(16, H // 16), "sans", "sans-bold"), fill=(255, 255, 255, 220))
 
     buf = io.BytesIO()
     img.save(buf, "PNG")
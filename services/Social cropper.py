@@ -1,8 +1,9 @@
 import io
-import zipfile
 from PIL import Image, ImageOps
 import streamlit as st
-from translations import translations
+from translations import for_lang
+from batchutil import pool_map
+from ziputil import ZipSink
 
 
 def _crop(img, size, mode, bg):
@@ -30,7 +31,7 @@ PRESETS = {
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["crop_title"])
 
     batch_map = {t["batch_single"]: "single", t["batch_multi"]: "batch"}
@@ -47,17 +48,20 @@ def run(lang):
                                  accept_multiple_files=True)
         if not files or not st.button("✂️ " + t["crop_make"]):
             return
-        zip_buf = io.BytesIO()
-        with zipfile.ZipFile(zip_buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        def jobs():  # decoded lazily, so only the in-flight images are held in memory
             for i, f in enumerate(files):
                 try:
                     img = Image.open(f)
+                    img.load()
                 except Exception:
                     continue
-                stem = f.name.rsplit(".", 1)[0] or f"image_{i + 1}"
-                zf.writestr(f"{stem}.png", _crop(img, size, mode, bg))
+                yield f.name.rsplit(".", 1)[0] or f"image_{i + 1}", (img, size, mode, bg)
+
+        with ZipSink() as zf:
+            for stem, data in pool_map(_crop, jobs(), total=len(files), tagged=True):
+                zf.add(f"{stem}.png", data)
         st.success(f"{t['batch_done']}: {len(files)}")
-        st.download_button("⬇️ " + t["batch_zip"], zip_buf.getvalue(), file_name="cropped.zip", mime="application/zip")
+        st.download_button("⬇️ " + t["batch_zip"], zf.file(), file_name="cropped.zip", mime="application/zip")
         return
 
     up = st.file_uploader(t["crop_upload"], type=["png", "jpg", "jpeg", "webp", "bmp"])
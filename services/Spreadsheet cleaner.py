@@ -1,8 +1,13 @@
 import io
+import itertools
 import re
+import numpy as np
 import pandas as pd
 import streamlit as st
-from translations import translations
+from translations import for_lang
+from tablutil import read_table, preview, columns, csv_file, CHUNK_ROWS
+
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
 
 
 def _snake(name):
@@ -11,8 +16,215 @@ def _snake(name):
     return s.lower() or "column"
 
 
+class RowHashes:
+    """A set of 64-bit row hashes (8 bytes a row), for de-duplicating across chunks.
+
+    Kept as a few sorted NumPy runs, merged when a new run is as large as the
+    last (like an LSM tree), so adding n hashes costs O(n log n) overall and
+    a lookup is a binary search per run.
+    """
+
+    def __init__(self):
+        self._runs = []
+
+    def __len__(self):
+        return sum(len(r) for r in self._runs)
+
+    def contains(self, hashes):
+        found = np.zeros(len(hashes), dtype=bool)
+        for run in self._runs:
+            pos = np.searchsorted(run, hashes).clip(max=len(run) - 1)
+            found |= run[pos] == hashes
+        return found
+
+    def add(self, hashes):
+        if not len(hashes):
+            return
+        run = np.unique(hashes)
+        while self._runs and len(self._runs[-1]) <= len(run):
+            run = np.union1d(self._runs.pop(), run)
+        self._runs.append(run)
+
+
+def _trim(df):
+    """Strip surrounding whitespace from every text cell, vectorized."""
+    for c in df.select_dtypes(include=["object", "str"]).columns:
+        col = df[c]
+        if col.dtype == object:  # Excel: text mixed with numbers and dates
+            is_text = col.map(type).eq(str)
+            if is_text.any():
+                col = col.copy()
+                col[is_text] = col[is_text].str.strip()
+            df[c] = col
+        else:
+            df[c] = col.str.strip()
+    return df
+
+
+def clean_chunks(chunks, trim, drop_empty, dedupe, stats):
+    """Clean DataFrame chunks one at a time; yield them ready to write.
+
+    Duplicates are found across chunks by 64-bit row hash
+    (pd.util.hash_pandas_object), so only 8 bytes per kept row stay in
+    memory. Dropping empty columns needs the whole file: `stats["filled"]`
+    marks the columns that had a value anywhere. `stats["rows_in"]` and
+    `stats["rows_out"]` count rows.
+    """
+    seen = RowHashes()
+    for chunk in chunks:
+        stats["rows_in"] += len(chunk)
+        if trim:
+            chunk = _trim(chunk)
+        if drop_empty:
+            chunk = chunk.dropna(axis=0, how="all")
+        if dedupe and len(chunk):
+            hashes = pd.util.hash_pandas_object(chunk, index=False).to_numpy()
+            keep = ~(pd.Series(hashes).duplicated().to_numpy() | seen.contains(hashes))
+            seen.add(hashes[keep])
+            chunk = chunk[keep]
+        filled = chunk.notna().any()
+        stats["filled"] = filled if "filled" not in stats else stats["filled"] | filled
+        stats["rows_out"] += len(chunk)
+        yield chunk
+
+
+# --- Fuzzy duplicates ---
+
+MINHASH_PERMS = 32   # signature length; similarity is estimated from matching positions
+LSH_BANDS = 8        # 8 bands x 4 rows: pairs from ~0.6 Jaccard upward usually share a bucket
+LSH_WINDOW = 3       # each key is compared with this many neighbours in its bucket
+MINHASH_SLACK = 0.2  # pairs estimated this far below the threshold still get the exact check
+SHINGLE_BATCH = 20_000
+
+_PUNCT = r"[!-/:-@\[-`{-~«»„“”‘’‚–—…·¿¡]"  # spelled out: RE2 (pyarrow) and Python disagree on \w
+_LEGAL = r"\b(?:inc|ltd|llc|gmbh|corp|corporation|co|company|plc|ag|sa|srl|bv|sp)\b"
+_FOLD = str.maketrans({"ł": "l", "ø": "o", "đ": "d", "ß": "ss", "æ": "ae", "œ": "oe"})  # no NFKD decomposition
+
+_rng = np.random.default_rng(20240601)  # fixed, so the same file always clusters the same way
+_MUL = _rng.integers(1, 2**63, MINHASH_PERMS, dtype=np.uint64) | np.uint64(1)
+_ADD = _rng.integers(0, 2**63, MINHASH_PERMS, dtype=np.uint64)
+
+
+def normalize_keys(df, columns):
+    """Comparison keys for rows: the columns joined, lower-cased, without accents, punctuation or legal forms."""
+    key = df[columns[0]].fillna("").astype("str")
+    for c in columns[1:]:
+        key = key + " " + df[c].fillna("").astype("str")
+    key = (key.str.lower().str.translate(_FOLD).str.normalize("NFKD")
+           .str.replace("[\u0300-\u036f]", "", regex=True)  # combining accents
+           .str.replace(_PUNCT, " ", regex=True)
+           .str.replace(_LEGAL, " ", regex=True)
+           .str.replace(r"\s+", " ", regex=True).str.strip())
+    return key
+
+
+def _signatures(keys):
+    """MinHash signatures (len(keys) x MINHASH_PERMS, uint32) over character bigrams."""
+    sig = np.empty((len(keys), MINHASH_PERMS), dtype=np.uint32)
+    for lo in range(0, len(keys), SHINGLE_BATCH):
+        batch = keys[lo:lo + SHINGLE_BATCH]
+        grams = [k[i:i + 2] for k in batch for i in range(max(1, len(k) - 1))]
+        starts = np.cumsum([0] + [max(1, len(k) - 1) for k in batch[:-1]])
+        hashed = pd.util.hash_array(np.array(grams, dtype=object))
+        for j in range(MINHASH_PERMS):  # one permutation at a time keeps memory at one gram array
+            sig[lo:lo + len(batch), j] = np.minimum.reduceat((hashed * _MUL[j] + _ADD[j]) >> np.uint64(32), starts)
+    return sig
+
+
+def _candidate_pairs(sig):
+    """Pairs of keys that share an LSH bucket, each key paired with its next LSH_WINDOW bucket neighbours."""
+    rows = MINHASH_PERMS // LSH_BANDS
+    pairs = []
+    for band in range(LSH_BANDS):
+        cols = sig[:, band * rows:(band + 1) * rows].astype(np.uint64)
+        bucket = np.zeros(len(sig), dtype=np.uint64)
+        for c in range(rows):
+            bucket = (bucket ^ cols[:, c]) * np.uint64(0x9E3779B97F4A7C15)
+        order = np.argsort(bucket, kind="stable")
+        ordered = bucket[order]
+        for d in range(1, LSH_WINDOW + 1):
+            same = ordered[d:] == ordered[:-d]
+            pairs.append(np.stack([order[:-d][same], order[d:][same]], axis=1))
+    pairs = np.concatenate(pairs) if pairs else np.empty((0, 2), dtype=np.int64)
+    return np.unique(np.sort(pairs, axis=1), axis=0)
+
+
+def _bigrams(key):
+    """The character bigrams of a key, as _signatures shingles it."""
+    return {key[i:i + 2] for i in range(max(1, len(key) - 1))}
+
+
+def _jaccard(a, b):
+    return len(a & b) / len(a | b)
+
+
+def _leaders(keys, pairs, threshold):
+    """Cluster label per key: the first key of its cluster (its representative).
+
+    Keys are taken in order. A key joins the cluster of an earlier key it is
+    paired with only if it is at least `threshold` similar (exact bigram
+    Jaccard) to that cluster's representative, and then the most similar such
+    cluster; otherwise it starts a cluster of its own. Clusters therefore
+    can't chain: every member is close to the representative, not just to
+    some other member.
+    """
+    labels = np.arange(len(keys))
+    if not len(pairs):
+        return labels
+    grams = {}
+
+    def bigrams(i):
+        if i not in grams:
+            grams[i] = _bigrams(keys[i])
+        return grams[i]
+
+    pairs = pairs[np.argsort(pairs[:, 1], kind="stable")]
+    ends = np.flatnonzero(np.diff(pairs[:, 1])) + 1
+    for group in np.split(pairs, ends):
+        j = int(group[0, 1])
+        best, label = threshold, j
+        for leader in dict.fromkeys(labels[group[:, 0]].tolist()):
+            score = _jaccard(bigrams(j), bigrams(leader))
+            if score >= best:
+                best, label = score, leader
+        labels[j] = label
+    return labels
+
+
+def fuzzy_clusters(df, columns, threshold=0.8):
+    """A cluster ID per row (0, 1, ... in order of first appearance); near-duplicate rows share one.
+
+    Rows are compared on normalize_keys(). Identical keys are one cluster
+    outright; distinct keys are blocked with MinHash/LSH, and only pairs that
+    share a bucket and whose MinHash estimate comes near the threshold are
+    checked, on the exact bigram Jaccard similarity of the two keys. So the
+    work grows near-linearly with the number of rows instead of with its
+    square. A key joins a cluster only if it passes the threshold against
+    the cluster's first key (see _leaders). Rows whose key is empty are
+    never merged.
+    """
+    codes, uniques = pd.factorize(normalize_keys(df, columns))
+    uniques = list(uniques)
+    sig = _signatures(uniques)
+    pairs = _candidate_pairs(sig)
+    if len(pairs):
+        # The 32-position estimate is rough (sd ~0.09): keep pairs well below the threshold for the exact check.
+        estimate = (sig[pairs[:, 0]] == sig[pairs[:, 1]]).mean(axis=1)
+        pairs = pairs[estimate >= threshold - MINHASH_SLACK]
+    empty = np.array([k == "" for k in uniques], dtype=bool)
+    pairs = pairs[~(empty[pairs[:, 0]] | empty[pairs[:, 1]])]
+    labels = _leaders(uniques, pairs, threshold)[codes]
+    labels = np.where(empty[codes], len(uniques) + np.arange(len(codes)), labels)  # empty keys: own cluster
+    return pd.factorize(labels)[0]
+
+
+def merge_clusters(df, ids):
+    """One row per cluster: the first non-empty value of each column among its rows."""
+    return df.groupby(ids, sort=False).first().reset_index(drop=True)
+
+
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["clean_title"])
 
     up = st.file_uploader(t["clean_upload"], type=["csv", "xlsx", "xls"])
@@ -21,27 +233,41 @@ def run(lang):
 
     is_csv = up.name.lower().endswith(".csv")
     try:
-        df = pd.read_csv(up) if is_csv else pd.read_excel(up)
+        head = preview(up)
     except Exception as e:
         st.error(f"{t['clean_error']} {e}")
         return
 
     st.subheader(t["clean_before"])
-    st.dataframe(df.head(50), use_container_width=True)
+    st.dataframe(head, use_container_width=True)
 
     st.markdown(f"**{t['clean_options']}**")
     trim = st.checkbox(t["clean_trim"], value=True)
     drop_empty = st.checkbox(t["clean_drop_empty"], value=True)
     dedupe = st.checkbox(t["clean_dedupe"], value=True)
     headers = st.checkbox(t["clean_headers"], value=False)
+    fuzzy = None
+    if st.checkbox(t["clean_fuzzy"], value=False):
+        key_cols = st.multiselect(t["clean_fuzzy_cols"], list(head.columns), default=list(head.columns[:1]))
+        threshold = st.slider(t["clean_fuzzy_threshold"], 0.5, 1.0, 0.8, 0.05)
+        fuzzy = (key_cols, threshold) if key_cols else None
 
     if not st.button("🧹 " + t["clean_run"]):
         return
 
+    if is_csv:
+        _clean_csv(t, up, trim, drop_empty, dedupe, headers, fuzzy)
+        return
+
+    # Excel is read whole, and only once the user asks for it, not on every option toggle.
+    try:
+        df = read_table(up)
+    except Exception as e:
+        st.error(f"{t['clean_error']} {e}")
+        return
     out = df.copy()
     if trim:
-        for c in out.select_dtypes(include="object"):
-            out[c] = out[c].map(lambda v: v.strip() if isinstance(v, str) else v)
+        out = _trim(out)
     if drop_empty:
         out = out.dropna(axis=0, how="all").dropna(axis=1, how="all")
     if dedupe:
@@ -52,14 +278,74 @@ def run(lang):
     st.subheader(t["clean_after"])
     st.dataframe(out.head(50), use_container_width=True)
     st.success(f"{t['clean_rows_removed']}: {len(df) - len(out)}")
+    if fuzzy:
+        clustered, merged = _fuzzy(t, out, headers, *fuzzy)
+        _download(t["clean_download_clusters"], _xlsx(clustered), "clustered.xlsx", XLSX_MIME)
+        _download(t["clean_download_merged"], _xlsx(merged), "merged.xlsx", XLSX_MIME)
+    else:
+        _download(t["clean_download"], _xlsx(out), "cleaned.xlsx", XLSX_MIME)
 
+
+def _xlsx(df):
     buf = io.BytesIO()
-    if is_csv:
-        out.to_csv(buf, index=False)
-        fname, mime = "cleaned.csv", "text/csv"
+    with pd.ExcelWriter(buf, engine="openpyxl") as w:
+        df.to_excel(w, index=False)
+    return buf.getvalue()
+
+
+def _download(label, data, name, mime):
+    st.download_button("⬇️ " + label, data, file_name=name, mime=mime)
+
+
+def _fuzzy(t, df, headers, key_cols, threshold):
+    """Cluster near-duplicate rows of the cleaned table; return (table with cluster_id first, merged table)."""
+    if headers:
+        key_cols = [_snake(c) for c in key_cols]
+    key_cols = [c for c in key_cols if c in df.columns]  # a key column may have been dropped as empty
+    if not key_cols or df.empty:
+        ids = np.arange(len(df))
+    else:
+        ids = fuzzy_clusters(df, key_cols, threshold)
+    merged = merge_clusters(df, ids)
+    clustered = df.reset_index(drop=True)
+    clustered.insert(0, "cluster_id", ids, allow_duplicates=True)
+    st.success(f"{t['clean_fuzzy_merged']}: {len(df) - len(merged)}")
+    return clustered, merged
+
+
+def _clean_csv(t, up, trim, drop_empty, dedupe, headers, fuzzy=None):
+    """CSV: stream chunk by chunk into a spooled output file, so memory stays bounded by the chunk size."""
+    # Read as text: chunks then hash a value the same way whatever types the parser would infer for them.
+    stats = {"rows_in": 0, "rows_out": 0}
+    chunks = clean_chunks(read_table(up, dtype=str, chunksize=CHUNK_ROWS), trim, drop_empty, dedupe, stats)
+    if headers:
+        chunks = (c.set_axis([_snake(n) for n in c.columns], axis=1) for c in chunks)
+    # The preview parsed only the first rows: a malformed row further down surfaces here.
+    try:
+        first = next(chunks, None)
+        if first is None:  # header only: no chunk comes through, but the header row is kept
+            first = pd.DataFrame(columns=columns(up), dtype=str)
+            if headers:
+                first.columns = [_snake(n) for n in first.columns]
+        data = csv_file(itertools.chain([first], chunks))
+        if drop_empty and stats["rows_out"] and not stats["filled"].all():
+            # Some column was empty in every chunk: rewrite the output without it (rare, so a second pass).
+            keep = [i for i, filled in enumerate(stats["filled"]) if filled]
+            data = csv_file(pd.read_csv(data, dtype=str, usecols=keep, chunksize=CHUNK_ROWS))
+            first = first.iloc[:, keep]
+    except Exception as e:
+        st.error(f"{t['clean_error']} {e}")
+        return
+
+    st.subheader(t["clean_after"])
+    st.dataframe(first.head(50), use_container_width=True)
+    st.success(f"{t['clean_rows_removed']}: {stats['rows_in'] - stats['rows_out']}")
+    if fuzzy:
+        # Clustering needs every row at once, so the cleaned table is read back into memory
+        # (nothing to read back when no row is left: `first` is the empty table).
+        table = pd.read_csv(data, dtype=str, keep_default_na=False, na_values=[""]) if stats["rows_out"] else first
+        clustered, merged = _fuzzy(t, table, headers, *fuzzy)
+        _download(t["clean_download_clusters"], csv_file([clustered]), "clustered.csv", "text/csv")
+        _download(t["clean_download_merged"], csv_file([merged]), "merged.csv", "text/csv")
     else:
-        with pd.ExcelWriter(buf, engine="openpyxl") as w:
-            out.to_excel(w, index=False)
-        fname = "cleaned.xlsx"
-        mime = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-    st.download_button("⬇️ " + t["clean_download"], buf.getvalue(), file_name=fname, mime=mime)
+        _download(t["clean_download"], data, "cleaned.csv", "text/csv")
@@ -2,11 +2,11 @@ import difflib
 import html
 import streamlit as st
 import streamlit.components.v1 as components
-from translations import translations
+from translations import for_lang
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["diff_title"])
 
     c1, c2 = st.columns(2)
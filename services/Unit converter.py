@@ -1,5 +1,5 @@
 import streamlit as st
-from translations import translations
+from translations import for_lang
 
 # Factor to the base unit of each category.
 UNITS = {
@@ -15,7 +15,7 @@ def _convert_temp(value, frm, to):
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.title(t["unit_title"])
 
     cat_map = {t["unit_length"]: "length", t["unit_mass"]: "mass", t["unit_temp"]: "temp", t["unit_data"]: "data"}
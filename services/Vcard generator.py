@@ -1,8 +1,8 @@
 import streamlit as st
 from io import BytesIO
 import qrcode
-from translations import translations
-from tablutil import read_table, template_bytes, TEMPLATE_MIME
+from translations import for_lang
+from tablutil import read_table, columns, template_bytes, TEMPLATE_MIME
 
 
 def escape_vcard(value):
@@ -44,7 +44,7 @@ FIELDS = [
 
 
 def run(lang):
-    t = translations.get(lang, translations["English"])
+    t = for_lang(lang)
     st.markdown(f"<h2 style='text-align:center'>{t['vcard_title']}</h2>", unsafe_allow_html=True)
 
     mode_map = {t["batch_single"]: "single", t["batch_multi"]: "batch"}
@@ -81,17 +81,20 @@ def run(lang):
     up = st.file_uploader(t["batch_upload"], type=["csv", "xlsx", "xls"])
     if not up:
         return
-    df = read_table(up)
-    cols = ["—"] + list(df.columns)
+    header = columns(up)
+    cols = ["—"] + header
     st.caption(t["batch_name_col"])
     mapping = {}
     grid = st.columns(3)
     for i, (field, key, _) in enumerate(FIELDS):
-        default = i + 1 if i < len(df.columns) else 0
+        default = i + 1 if i < len(header) else 0
         mapping[field] = grid[i % 3].selectbox(t[key], cols, index=default, key=f"vc_{field}")
 
     if not st.button(t["vcard_button"]):
         return
+    # Only the mapped columns, as text (keeps leading zeros and "+" in phone numbers).
+    used = list(dict.fromkeys(c for c in mapping.values() if c != "—"))
+    df = read_table(up, usecols=used, dtype=str)
 
     def val(row, field):
         c = mapping[field]
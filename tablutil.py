@@ -1,14 +1,133 @@
-"""Small helpers for batch-mode tools: read an uploaded CSV/Excel and build a
-downloadable Excel template. Lives at repo root so main.py doesn't list it as a tool."""
+"""Table ingestion and templates for batch-mode tools. Lives at repo root so
+main.py doesn't list it as a tool.
+
+    cols = columns(up)                              # header only
+    st.dataframe(preview(up), ...)                  # first PREVIEW_ROWS rows
+    df = read_table(up, usecols=[x, y])             # only the columns a tool needs
+    for chunk in read_table(up, dtype=str, chunksize=CHUNK_ROWS):
+        ...                                         # bounded memory for large CSVs
+    data = csv_file(chunks)                         # also jsonl_file / parquet_file
+
+This is the one ingestion path for uploaded CSV/Excel files. CSV is parsed by
+pandas' pyarrow engine when pyarrow is installed (multi-threaded, and typed
+columns instead of Python objects) and by the C engine otherwise, for previews
+(pyarrow has no `nrows`) and in chunked mode (no `chunksize`). Excel files are
+read whole — the upload limit bounds them — and sliced when chunks are asked
+for. Every call rewinds the upload first, so one file can be read repeatedly
+across reruns.
+"""
+import importlib.util
 import io
+import tempfile
+
 import pandas as pd
+from ziputil import SPOOL_LIMIT, readable
+
+PREVIEW_ROWS = 50
+CHUNK_ROWS = 100_000
+
+# find_spec instead of importing: pandas imports pyarrow itself when the engine is used.
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+_CSV_ENGINE = "pyarrow" if HAS_PYARROW else "c"
+
+
+def _is_csv(source):
+    return str(getattr(source, "name", source)).lower().endswith(".csv")
+
+
+def _rewind(source):
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return source
+
+
+def read_table(uploaded, usecols=None, dtype=None, chunksize=None):
+    """Read an uploaded CSV or Excel file (or a path) into a DataFrame.
+
+    `usecols` / `dtype` are passed through, so a tool parses only the columns
+    it uses, e.g. as `dtype=str` for names and codes. With `chunksize` an
+    iterator of DataFrames of at most that many rows is returned instead.
+    """
+    if chunksize:
+        return _chunks(uploaded, chunksize, usecols, dtype)
+    if not _is_csv(uploaded):
+        return pd.read_excel(_rewind(uploaded), usecols=usecols, dtype=dtype)
+    if _CSV_ENGINE == "pyarrow":
+        try:
+            return pd.read_csv(_rewind(uploaded), usecols=usecols, dtype=dtype, engine="pyarrow")
+        except Exception:
+            pass  # pyarrow rejects some files the C engine accepts (ragged rows, odd quoting)
+    return pd.read_csv(_rewind(uploaded), usecols=usecols, dtype=dtype)
+
+
+def _chunks(uploaded, chunksize, usecols, dtype):
+    if _is_csv(uploaded):
+        with pd.read_csv(_rewind(uploaded), usecols=usecols, dtype=dtype, chunksize=chunksize) as reader:
+            yield from reader
+        return
+    df = pd.read_excel(_rewind(uploaded), usecols=usecols, dtype=dtype)
+    for start in range(0, len(df), chunksize):
+        yield df.iloc[start:start + chunksize]
+
+
+def chunk_count(uploaded, chunksize=CHUNK_ROWS):
+    """About how many chunks read_table(csv, chunksize=...) yields, for progress bars.
+
+    Estimated from the line count (quoted newlines make it approximate),
+    counted in 1 MiB blocks so the upload isn't copied.
+    """
+    f = _rewind(uploaded)
+    lines = sum(block.count(b"\n") for block in iter(lambda: f.read(1 << 20), b""))
+    _rewind(uploaded)
+    return max(1, -(-max(0, lines - 1) // chunksize))
+
+
+def preview(uploaded, rows=PREVIEW_ROWS):
+    """The first `rows` rows, for st.dataframe — parses only those rows."""
+    if _is_csv(uploaded):
+        return pd.read_csv(_rewind(uploaded), nrows=rows)
+    return pd.read_excel(_rewind(uploaded), nrows=rows)
+
+
+def columns(uploaded):
+    """Column names of an uploaded table, from its header row."""
+    return list(preview(uploaded, rows=0).columns)
+
+
+def csv_file(chunks):
+    """Write DataFrame chunks as one CSV into a spooled temp file; return a handle for st.download_button."""
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_LIMIT, mode="w+b")
+    header = True
+    for chunk in chunks:
+        chunk.to_csv(spool, index=False, header=header)
+        header = False
+    return readable(spool)
+
+
+def jsonl_file(chunks):
+    """Like csv_file, as JSON Lines: one object per row."""
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_LIMIT, mode="w+b")
+    for chunk in chunks:
+        if len(chunk):
+            spool.write(chunk.to_json(orient="records", lines=True, force_ascii=False).encode())
+    return readable(spool)
+
 
+def parquet_file(chunks):
+    """Like csv_file, as Parquet with one row group per chunk. Needs pyarrow (see HAS_PYARROW)."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
 
-def read_table(uploaded):
-    """Read an uploaded CSV or Excel file into a DataFrame."""
-    if uploaded.name.lower().endswith(".csv"):
-        return pd.read_csv(uploaded)
-    return pd.read_excel(uploaded)
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_LIMIT, mode="w+b")
+    writer = None
+    for chunk in chunks:
+        table = pa.Table.from_pandas(chunk, preserve_index=False)
+        if writer is None:
+            writer = pq.ParquetWriter(spool, table.schema)
+        writer.write_table(table.cast(writer.schema))
+    if writer is not None:
+        writer.close()  # writes the footer; the spool itself stays open
+    return readable(spool)
 
 
 def template_bytes(columns, sample_rows):
@@ -0,0 +1,11 @@
+"""pytest setup: make the repo root importable (helpers such as tablutil, and
+toolutil.load_tool for the tools in services/)."""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# An AppTest script run directly (python tests/smoke_test.py), not a pytest module.
+collect_ignore = ["smoke_test.py"]
@@ -0,0 +1,84 @@
+"""Excel to calendar: events -> ICS (with RRULE folding) -> events again."""
+from datetime import date, datetime, timedelta
+from io import BytesIO
+
+import pandas as pd
+import pytest
+
+from toolutil import load_tool
+
+cal = load_tool("Excel to calendar.py")
+
+WINDOW = (datetime(2000, 1, 1), datetime(2100, 1, 1))
+
+
+def _table():
+    # Weekly stand-up on Mondays with one week skipped, a daily series, and one-offs
+    # whose text needs escaping.
+    mondays = [datetime(2024, 1, 1, 9) + timedelta(weeks=w) for w in range(8) if w != 3]
+    days = [datetime(2024, 3, 1, 7, 30) + timedelta(days=d) for d in range(4)]
+    rows = [(s, s + timedelta(minutes=15), "Stand-up", "Daily sync", "Room 1") for s in mondays]
+    rows += [(s, s + timedelta(hours=1), "Run", "", "") for s in days]
+    rows += [
+        (datetime(2024, 2, 14, 18), datetime(2024, 2, 14, 21), "Dinner, late", "Bring: wine; cheese\nand bread", "Café"),
+        (datetime(2024, 5, 1, 10), datetime(2024, 5, 1, 10, 30), "Call", "", "Zoom"),
+    ]
+    df = pd.DataFrame(rows, columns=["Start Date", "End Date", "Event Title", "Description", "Location"])
+    df["Start Date"] = df["Start Date"].dt.strftime("%Y-%m-%d %H:%M")
+    df["End Date"] = df["End Date"].dt.strftime("%Y-%m-%d %H:%M")
+    return df, sorted(rows)
+
+
+def _round_trip(df, recurring):
+    ics = cal.generate_ics(df, recurring=recurring)
+    return ics, sorted(cal.ics_rows(BytesIO(ics.encode("utf-8")), WINDOW))
+
+
+@pytest.mark.parametrize("recurring", [False, True])
+def test_ics_round_trip(recurring):
+    df, expected = _table()
+    _, rows = _round_trip(df, recurring)
+    assert rows == expected
+
+
+def test_repeats_fold_into_rrules():
+    df, _ = _table()
+    ics, _ = _round_trip(df, recurring=True)
+    assert ics.count("BEGIN:VEVENT") == 4  # stand-up series, run series, two one-offs
+    assert "RRULE:FREQ=WEEKLY" in ics and "RRULE:FREQ=DAILY" in ics
+    assert "EXDATE:20240122T090000" in ics  # the skipped Monday
+
+
+def test_recurrences_table():
+    ev = cal.recurrences(cal.events(_table()[0]))
+    assert len(ev) == 4
+    assert (ev["rrule"] != "").sum() == 2
+    assert ev.loc[ev["rrule"] != "", "exdate"].tolist() == ["20240122T090000", ""]
+
+
+def test_lines_are_crlf_and_folded():
+    df, _ = _table()
+    df.loc[0, "Description"] = "x" * 200
+    ics = cal.generate_ics(df)
+    lines = ics.split("\r\n")
+    assert all(len(line.encode("utf-8")) <= 75 for line in lines)
+    assert ics.endswith("END:VCALENDAR\r\n")
+
+
+def test_exdate_and_override():
+    ics = "\r\n".join([
+        "BEGIN:VCALENDAR",
+        "BEGIN:VEVENT", "UID:a", "DTSTART:20240101T090000", "DTEND:20240101T100000",
+        "RRULE:FREQ=DAILY;COUNT=4", "EXDATE:20240102T090000", "SUMMARY:Series", "END:VEVENT",
+        "BEGIN:VEVENT", "UID:a", "RECURRENCE-ID:20240103T090000",
+        "DTSTART:20240103T120000", "DTEND:20240103T130000", "SUMMARY:Moved", "END:VEVENT",
+        "END:VCALENDAR", "",
+    ])
+    rows = sorted(cal.ics_rows(BytesIO(ics.encode()), WINDOW))
+    assert [(r[0].day, r[0].hour, r[2]) for r in rows] == [(1, 9, "Series"), (3, 12, "Moved"), (4, 9, "Series")]
+
+
+def test_years_from_leap_day():
+    assert cal.years_from(date(2024, 2, 29), -1) == date(2023, 2, 28)
+    assert cal.years_from(date(2024, 2, 29), 4) == date(2028, 2, 29)
+    assert cal.years_from(date(2025, 10, 18), 2) == date(2027, 10, 18)
@@ -0,0 +1,88 @@
+"""Fake data generator: reproducible chunks and relational schemas."""
+import zipfile
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("faker")
+
+from toolutil import load_tool  # noqa: E402
+
+fake = load_tool("Fake data generator.py")
+
+FIELDS = ["name", "email"]
+
+
+def _inline(rows, seed, pool=False):
+    return pd.concat([fake.generate_chunk("en_US", FIELDS, FIELDS, seed, i, min(fake.CHUNK, rows - lo), pool)
+                      for i, lo in enumerate(range(0, rows, fake.CHUNK))], ignore_index=True)
+
+
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_seed_gives_the_same_rows_inline_and_pooled(monkeypatch, workers):
+    monkeypatch.setenv("TOOLS_WORKERS", workers)
+    monkeypatch.setattr(fake, "CHUNK", 300)
+    table = pd.concat(fake.generate("en_US", FIELDS, FIELDS, 750, seed=7), ignore_index=True)
+    assert len(table) == 750
+    pd.testing.assert_frame_equal(table, _inline(750, seed=7))
+    assert not table.equals(_inline(750, seed=8))
+
+
+def test_fast_mode_draws_at_most_pool_values(monkeypatch):
+    monkeypatch.setattr(fake, "POOL", 50)
+    pooled = fake.generate_chunk("en_US", FIELDS, FIELDS, 1, 0, 1_000, pool=True)
+    fresh = fake.generate_chunk("en_US", FIELDS, FIELDS, 1, 0, 1_000)
+    assert len(pooled) == len(fresh) == 1_000
+    assert pooled.nunique().max() <= 50
+    assert fresh["email"].nunique() > 500
+
+
+SCHEMA = """{"tables": [
+  {"name": "order_notes", "rows": 200, "foreign_keys": {"order_id": {"table": "orders"}},
+   "columns": {"author": "name"}},
+  {"name": "orders", "primary_key": "id",
+   "foreign_keys": {"customer_id": {"table": "customers", "per_parent": [0, 3]}}, "columns": {"city": "city"}},
+  {"name": "customers", "rows": 300, "primary_key": "id", "columns": {"name": "name"}}
+]}"""
+
+
+def _tables(schema, seed=3):
+    tables = fake.parse_schema(schema)
+    data, rows = fake.generate_schema("en_US", tables, seed, "csv")
+    with zipfile.ZipFile(data) as zf:
+        frames = {name[:-4]: pd.read_csv(zf.open(name)) for name in zf.namelist()}
+    data.close()
+    return tables, rows, frames
+
+
+def test_schema_foreign_keys_reference_parent_rows():
+    tables, rows, frames = _tables(SCHEMA)
+    assert [t["name"] for t in tables] == ["customers", "orders", "order_notes"]
+    customers, orders, notes = frames["customers"], frames["orders"], frames["order_notes"]
+    assert {name: len(df) for name, df in frames.items()} == rows
+    assert customers["id"].tolist() == list(range(1, 301))
+    assert orders["id"].tolist() == list(range(1, len(orders) + 1))
+    assert orders["customer_id"].isin(customers["id"]).all()
+    assert notes["order_id"].isin(orders["id"]).all()
+    per_customer = orders["customer_id"].value_counts().reindex(customers["id"], fill_value=0)
+    assert per_customer.between(0, 3).all()
+    assert per_customer.min() == 0 and per_customer.max() == 3
+
+
+def test_schema_is_reproducible():
+    assert _tables(SCHEMA)[2]["orders"].equals(_tables(SCHEMA)[2]["orders"])
+
+
+@pytest.mark.parametrize("schema,message", [
+    ('{"tables": [{"name": "a", "rows": 1, "primary_key": "id", "foreign_keys": {"b_id": {"table": "b"}}},'
+     ' {"name": "b", "rows": 1, "primary_key": "id", "foreign_keys": {"a_id": {"table": "a"}}}]}', "cycle"),
+    ('{"tables": [{"name": "a", "rows": 1, "foreign_keys": {"x_id": {"table": "x"}}}]}', "unknown table"),
+    ('{"tables": [{"name": "a/../b", "rows": 1}]}', "names may only use"),
+    ('{"tables": [{"name": "a", "rows": true}]}', '"rows"'),
+    ('{"tables": [{"name": "a", "rows": 1, "columns": {"c": "nope"}}]}', "unknown field"),
+    ('{"tables": [{"name": "p", "rows": 1, "primary_key": "id"},'
+     ' {"name": "a", "foreign_keys": {"p_id": {"table": "p", "per_parent": [3, 1]}}}]}', "per_parent"),
+])
+def test_parse_schema_rejects(schema, message):
+    with pytest.raises(ValueError, match=message):
+        fake.parse_schema(schema)
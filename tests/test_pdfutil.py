@@ -0,0 +1,56 @@
+"""pdfutil.merge_pdfs: shards rendered apart, merged into one file."""
+import io
+
+import pytest
+
+PyPDF2 = pytest.importorskip("PyPDF2")
+Image = pytest.importorskip("PIL.Image")
+
+from pdfutil import merge_pdfs  # noqa: E402
+from toolutil import load_tool  # noqa: E402
+
+cert = load_tool("Certificate generator.py")
+
+
+def _logo():
+    buf = io.BytesIO()
+    Image.new("RGB", (64, 32), (200, 30, 30)).save(buf, "PNG")
+    return buf.getvalue()
+
+
+def _shards(logo, sizes=(3, 3, 2)):
+    names = [f"Person {i}" for i in range(sum(sizes))]
+    shards, lo = [], 0
+    for n in sizes:
+        shards.append(cert.render_pages(names[lo:lo + n], "did it", "Signer", "2024-01-01", "classic", logo, 2.0))
+        lo += n
+    return shards
+
+
+def _images(reader):
+    """Distinct image XObjects (by object number) referenced from the pages."""
+    ids = set()
+    for page in reader.pages:
+        xobjects = page["/Resources"].get("/XObject")
+        if xobjects is not None:
+            xobjects = xobjects.get_object()
+            ids.update(xobjects.raw_get(name).idnum for name in xobjects)
+    return ids
+
+
+def test_merge_keeps_pages_and_stores_logo_once():
+    shards = _shards(_logo())
+    assert all(len(_images(PyPDF2.PdfReader(io.BytesIO(s)))) == 1 for s in shards)
+    merged = PyPDF2.PdfReader(io.BytesIO(merge_pdfs(shards)))
+    assert len(merged.pages) == 8
+    assert len(_images(merged)) == 1
+    assert "Person 7" in merged.pages[7].extract_text()
+
+
+def test_merge_without_images_and_is_deterministic():
+    shards = _shards(None, (2, 1))
+    data = merge_pdfs(shards)
+    assert data == merge_pdfs(shards)
+    merged = PyPDF2.PdfReader(io.BytesIO(data))
+    assert len(merged.pages) == 3
+    assert not _images(merged)
@@ -0,0 +1,86 @@
+"""Spreadsheet cleaner: chunked de-duplication and fuzzy clustering."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from toolutil import load_tool
+
+clean = load_tool("Spreadsheet cleaner.py")
+
+
+def _frame(n=5_000, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "a": rng.integers(0, 20, n),
+        "b": rng.choice(["x", "y", " y", None], n),
+        "c": rng.choice([1.5, 2.5, np.nan], n),
+    })
+
+
+def _run(df, chunk_rows, **options):
+    stats = {"rows_in": 0, "rows_out": 0}
+    chunks = (df.iloc[i:i + chunk_rows].copy() for i in range(0, len(df), chunk_rows))
+    out = pd.concat(list(clean.clean_chunks(chunks, stats=stats, **options)))
+    return out, stats
+
+
+@pytest.mark.parametrize("chunk_rows", [7, 100, 5_000])
+def test_dedupe_matches_drop_duplicates(chunk_rows):
+    df = _frame()
+    out, stats = _run(df, chunk_rows, trim=False, drop_empty=False, dedupe=True)
+    expected = df.drop_duplicates()
+    assert stats == {**stats, "rows_in": len(df), "rows_out": len(expected)}
+    pd.testing.assert_frame_equal(out, expected)
+
+
+def test_trim_then_dedupe():
+    df = _frame()
+    out, _ = _run(df, 333, trim=True, drop_empty=True, dedupe=True)
+    expected = df.assign(b=df["b"].str.strip()).dropna(how="all").drop_duplicates()
+    assert len(out) == len(expected)
+
+
+def test_row_hashes():
+    seen = clean.RowHashes()
+    for lo in range(0, 1000, 90):
+        seen.add(np.arange(lo, lo + 90, dtype=np.uint64) * 7)
+    assert len(seen) == 12 * 90
+    probe = np.array([0, 7, 8, 7 * 1079, 7 * 1080], dtype=np.uint64)
+    assert seen.contains(probe).tolist() == [True, True, False, True, False]
+    assert not clean.RowHashes().contains(probe).any()
+
+
+def test_fuzzy_cluster_acme():
+    df = pd.DataFrame({"company": ["ACME Inc.", "Acme, Inc", "acme", "Ácme Corp", "Globex", "Initech", None, None]})
+    ids = clean.fuzzy_clusters(df, ["company"])
+    assert ids.tolist()[:4] == [0, 0, 0, 0]
+    assert len(set(ids.tolist()[4:])) == 4  # the rest, empty keys included, stay apart
+    merged = clean.merge_clusters(df, ids)
+    assert merged["company"].tolist()[:3] == ["ACME Inc.", "Globex", "Initech"]
+    assert len(merged) == 5
+
+
+def test_fuzzy_keeps_different_names_apart():
+    df = pd.DataFrame({"name": ["Jon Smith", "John Smith", "Jane Doe"], "city": ["Bern", "Bern", "Bern"]})
+    ids = clean.fuzzy_clusters(df, ["name", "city"], threshold=0.6)
+    assert ids[0] == ids[1] != ids[2]
+
+
+def test_fuzzy_clusters_do_not_chain_distinct_names():
+    faker = pytest.importorskip("faker").Faker("en_US")
+    faker.seed_instance(1)
+    names = list(dict.fromkeys(faker.name() for _ in range(6_000)))
+    df = pd.DataFrame({"name": names})
+    ids = clean.fuzzy_clusters(df, ["name"])
+    keys = clean.normalize_keys(df, ["name"])
+    clusters = pd.Series(keys.to_numpy()).groupby(ids)
+    assert clusters.size().max() <= 4  # single-link chaining merged dozens of "... Rodriguez"
+    for _, members in clusters:
+        lead = clean._bigrams(members.iloc[0])
+        assert all(clean._jaccard(lead, clean._bigrams(k)) >= 0.8 for k in members)
+
+
+def test_fuzzy_clusters_find_typos():
+    df = pd.DataFrame({"name": ["Jonathan Richardson", "Tyler Rodriguez", "Jonathon Richardson",
+                                "Alexa Rodriguez", "Tyler Rodrigues", "Brian Rodriguez"]})
+    assert clean.fuzzy_clusters(df, ["name"]).tolist() == [0, 1, 0, 2, 1, 3]
@@ -0,0 +1,384 @@
+"""Headless batch runner for the tools' pure functions — no browser, no
+Streamlit session. Lives at repo root so main.py doesn't list it as a tool.
+
+    python -m toolcli qr codes.csv --out qr/ --workers 8 --sheet
+    python -m toolcli certificate names.jsonl --tar certs.tar --text "has completed the course"
+    python -m toolcli vcard contacts.csv --out cards/
+    python -m toolcli ics events.csv --out cal/
+    python -m toolcli paj flows.jsonl --out reports/
+    python -m toolcli resize photos/ --format WEBP --max-dim 1600 --tar - > photos.tar
+    python -m toolcli crop photos.csv --size 1080x1080 --out square/
+
+Rows are streamed from CSV or JSONL (.xlsx/.xls is read whole); image commands
+take files, directories, or a CSV/JSONL list with a `path` column. Results go to
+a directory (--out) or an uncompressed tar stream (--tar FILE, `-` = stdout).
+--workers N fans items out to N processes (the same worker entry point as the
+app's batch modes, batchutil.ordered), keeping output in input order.
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import re
+import shutil
+import sys
+import tarfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import batchutil
+from toolutil import load_tool
+
+IMAGE_EXTS = {".png", ".jpg", ".jpeg", ".webp", ".bmp", ".tiff"}
+
+
+# --- Input ---
+
+def read_rows(path):
+    """Yield one dict per row of a CSV, JSONL or Excel file (CSV/JSONL streamed)."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".jsonl", ".ndjson"):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    elif ext in (".xlsx", ".xls"):
+        from tablutil import read_table
+        for row in read_table(path, dtype=str).to_dict("records"):
+            yield {k: ("" if v != v else v) for k, v in row.items()}  # NaN -> ""
+    else:
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            yield from csv.DictReader(f)
+
+
+def column(row, wanted, position):
+    """Value of column `wanted` (if given) or of the column at `position`, as stripped text."""
+    if wanted:
+        value = row.get(wanted, "")
+    else:
+        values = list(row.values())
+        value = values[position] if position < len(values) else ""
+    return "" if value is None else str(value).strip()
+
+
+def image_paths(inputs):
+    """Expand image files, directories and CSV/JSONL lists (a `path` column) into paths."""
+    for src in inputs:
+        ext = os.path.splitext(src)[1].lower()
+        if os.path.isdir(src):
+            for name in sorted(os.listdir(src)):
+                if os.path.splitext(name)[1].lower() in IMAGE_EXTS:
+                    yield os.path.join(src, name)
+        elif ext in (".csv", ".jsonl", ".ndjson"):
+            for row in read_rows(src):
+                path = column(row, "path" if "path" in row else None, 0)
+                if path:
+                    yield path
+        else:
+            yield src
+
+
+def _open_image(path):
+    from PIL import Image
+    img = Image.open(path)
+    img.load()
+    return img
+
+
+# --- Output ---
+
+class DirSink:
+    def __init__(self, path):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+
+    def add(self, name, data):
+        with open(os.path.join(self.path, name), "wb") as f:
+            if hasattr(data, "read"):
+                shutil.copyfileobj(data, f, 1 << 20)
+            else:
+                f.write(data)
+
+    def close(self):
+        pass
+
+
+class TarSink:
+    def __init__(self, path):
+        self._own = path != "-"
+        self._fh = open(path, "wb") if self._own else sys.stdout.buffer
+        self._tar = tarfile.open(fileobj=self._fh, mode="w|")
+        self._mtime = time.time()
+
+    def add(self, name, data):
+        info = tarfile.TarInfo(name)
+        if hasattr(data, "read"):  # a file handle at offset 0
+            info.size = data.seek(0, io.SEEK_END)
+            data.seek(0)
+        else:
+            info.size = len(data)
+            data = io.BytesIO(data)
+        info.mtime = self._mtime
+        self._tar.addfile(info, data)
+
+    def close(self):
+        self._tar.close()
+        if self._own:
+            self._fh.close()
+        else:
+            self._fh.flush()
+
+
+class Output:
+    """Wraps a sink: de-duplicates member names and counts what was written."""
+
+    def __init__(self, args):
+        self.sink = TarSink(args.tar) if args.tar else DirSink(args.out)
+        self.seen = set()
+        self.count = 0
+
+    def add(self, name, data):
+        stem, ext = os.path.splitext(name)
+        n = 1
+        while name in self.seen:
+            n += 1
+            name = f"{stem}_{n}{ext}"
+        self.seen.add(name)
+        self.sink.add(name, data.encode("utf-8") if isinstance(data, str) else data)
+        self.count += 1
+
+    def close(self):
+        self.sink.close()
+
+
+def safe_name(text, fallback):
+    return re.sub(r"[^\w-]+", "_", text)[:40].strip("_") or fallback
+
+
+# --- Execution ---
+
+def run_jobs(func, items, workers):
+    """Yield `(tag, func(*args))` for `(tag, args)` items, in order, on `workers` processes."""
+    if workers <= 1:
+        for tag, args in items:
+            yield tag, func(*args)
+        return
+    with ProcessPoolExecutor(max_workers=workers, mp_context=batchutil.context()) as pool:
+        yield from batchutil.ordered(pool, func.__globals__["__file__"], func.__name__, items, 4 * workers)
+
+
+# --- Commands ---
+
+def cmd_qr(args, out):
+    qr = load_tool("QR code.py")
+
+    def jobs():
+        for i, row in enumerate(read_rows(args.input), 1):
+            text = column(row, args.text_col, 0)
+            if not text or text.lower() == "url or text":
+                continue
+            name = column(row, args.name_col, 1) or f"qr_code_{i}"
+            yield name, (text, args.style, args.color1, args.color2, args.format)
+
+    matrices, names = [], []
+    for name, (data, dark) in run_jobs(qr.generate_qr_file, jobs(), args.workers):
+        out.add(f"{name}.{args.format}", data)
+        if args.sheet:
+            matrices.append(dark)
+            names.append(name)
+    if args.sheet and matrices:
+        out.add("qr_print_sheet.pdf", qr.make_qr_sheet(matrices, names, args.style, args.color1, args.color2))
+
+
+def cmd_certificate(args, out):
+    cert = load_tool("Certificate image.py")
+    logo = cert.logo_png(_open_image(args.logo)) if args.logo else None
+
+    def jobs():
+        for row in read_rows(args.input):
+            name = column(row, args.name_col, 0)
+            if name:
+                yield name, (name, args.text, args.signer, args.style, logo)
+
+    for name, png in run_jobs(cert.render_certificate, jobs(), args.workers):
+        out.add(f"{safe_name(name, 'certificate')}.png", png)
+
+
+def cmd_vcard(args, out):
+    vc = load_tool("Vcard generator.py")
+
+    def lookup(row, field, col):
+        for key in (col, field):  # template header ("Full Name") or field name ("name")
+            if key in row:
+                return column(row, key, 0)
+        return ""
+
+    cards = []
+    for row in read_rows(args.input):
+        values = {field: lookup(row, field, col) for field, _, col in vc.FIELDS}
+        if not values["name"]:
+            continue
+        card = vc.build_vcard(**values)
+        if args.split:
+            out.add(f"{safe_name(values['name'], 'contact')}.vcf", card)
+        else:
+            cards.append(card)
+    if cards:
+        out.add("contacts.vcf", "\n".join(cards))
+
+
+def read_chunks(path):
+    """DataFrame chunks of a CSV, JSONL or Excel file, as the tools' upload path reads them."""
+    from tablutil import read_table, CHUNK_ROWS
+    if os.path.splitext(path)[1].lower() in (".jsonl", ".ndjson"):
+        import pandas as pd
+        with pd.read_json(path, lines=True, dtype=False, chunksize=CHUNK_ROWS) as reader:
+            yield from reader
+        return
+    yield from read_table(path, chunksize=CHUNK_ROWS)
+
+
+def cmd_ics(args, out):
+    cal = load_tool("Excel to calendar.py")
+    data = cal.ics_file(read_chunks(args.input))  # streamed chunk by chunk, like the tool itself
+    out.add("calendar.ics", data)
+    data.close()
+
+
+def cmd_paj(args, out):
+    checker = load_tool("Power Automate JSON checker.py")
+
+    def jobs():
+        for src in args.input:
+            if os.path.splitext(src)[1].lower() in (".jsonl", ".ndjson"):
+                with open(src, encoding="utf-8") as f:
+                    for n, line in enumerate(f, 1):
+                        if line.strip():
+                            yield f"{src}:{n}", (line,)
+            else:
+                with open(src, encoding="utf-8") as f:
+                    yield src, (f.read(),)
+
+    lines, invalid = [], 0
+    for source, (_, findings) in run_jobs(checker.validate, jobs(), args.workers):
+        errors = sum(1 for f in findings if f.level == "error")
+        invalid += bool(errors)
+        lines.append(json.dumps({"source": source, "valid": not errors,
+                                 "findings": [vars(f) for f in findings]}, ensure_ascii=False))
+    out.add("report.jsonl", "\n".join(lines) + "\n" if lines else "")
+    return 1 if invalid else 0
+
+
+def cmd_resize(args, out):
+    from PIL import Image
+    resizer = load_tool("Image resizer.py")
+    fmt = args.format.upper()
+
+    def jobs():
+        for path in image_paths(args.input):
+            img = _open_image(path)
+            stem = os.path.splitext(os.path.basename(path))[0] or "image"
+            if args.favicon:
+                yield f"{stem}_favicons.zip", (img,)
+            else:
+                if args.max_dim > 0:
+                    img.thumbnail((args.max_dim, args.max_dim), Image.LANCZOS)
+                yield f"{stem}.{resizer.EXT[fmt]}", (img, fmt, args.quality)
+
+    func = resizer._make_favicon_pack if args.favicon else resizer._encode
+    for name, data in run_jobs(func, jobs(), args.workers):
+        out.add(name, data)
+
+
+def cmd_crop(args, out):
+    cropper = load_tool("Social cropper.py")
+    if args.preset:
+        size = cropper.PRESETS[args.preset]
+    else:
+        w, _, h = args.size.lower().partition("x")
+        size = (int(w), int(h))
+
+    def jobs():
+        for path in image_paths(args.input):
+            stem = os.path.splitext(os.path.basename(path))[0] or "image"
+            yield f"{stem}.png", (_open_image(path), size, args.mode, args.bg)
+
+    for name, data in run_jobs(cropper._crop, jobs(), args.workers):
+        out.add(name, data)
+
+
+COMMANDS = {
+    "qr": cmd_qr, "certificate": cmd_certificate, "vcard": cmd_vcard, "ics": cmd_ics,
+    "paj": cmd_paj, "resize": cmd_resize, "crop": cmd_crop,
+}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m toolcli", description="Run tool batches without the web UI.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def command(name, help_text, many_inputs=False):
+        p = sub.add_parser(name, help=help_text)
+        if many_inputs:
+            p.add_argument("input", nargs="+", help="files, directories or CSV/JSONL lists")
+        else:
+            p.add_argument("input", help="CSV, JSONL or Excel file")
+        dest = p.add_mutually_exclusive_group(required=True)
+        dest.add_argument("--out", help="output directory")
+        dest.add_argument("--tar", help="write a tar stream to this file ('-' for stdout)")
+        p.add_argument("--workers", type=int, default=1, help="worker processes (default 1 = inline)")
+        return p
+
+    p = command("qr", "QR code PNGs or SVGs (+ optional vector print sheet) from rows of text/URL and file name")
+    p.add_argument("--text-col", help="column with the text/URL (default: first)")
+    p.add_argument("--name-col", help="column with the file name (default: second)")
+    p.add_argument("--style", choices=["solid", "gradient"], default="solid")
+    p.add_argument("--color1", default="#000000")
+    p.add_argument("--color2", default="#ff0000")
+    p.add_argument("--format", choices=["png", "svg"], default="png")
+    p.add_argument("--sheet", action="store_true", help="also write qr_print_sheet.pdf")
+
+    p = command("certificate", "certificate PNGs, one per name")
+    p.add_argument("--name-col", help="column with the recipient (default: first)")
+    p.add_argument("--text", default="has successfully completed the course")
+    p.add_argument("--signer", default="")
+    p.add_argument("--style", choices=["classic", "modern", "elegant", "minimal"], default="classic")
+    p.add_argument("--logo", help="logo image file")
+
+    p = command("vcard", "vCards from rows (columns as in the template, or name/phone/email/...)")
+    p.add_argument("--split", action="store_true", help="one .vcf per contact instead of contacts.vcf")
+
+    command("ics", "an .ics calendar from rows of Start, End, Title, Description, Location")
+    command("paj", "validate Power Automate JSON files / JSONL lines into report.jsonl", many_inputs=True)
+
+    p = command("resize", "resize and re-encode images, or build favicon packs", many_inputs=True)
+    p.add_argument("--format", choices=["PNG", "JPEG", "WEBP", "png", "jpeg", "webp"], default="PNG")
+    p.add_argument("--max-dim", type=int, default=0, help="longest side in px (0 = keep size)")
+    p.add_argument("--quality", type=int, default=85)
+    p.add_argument("--favicon", action="store_true", help="favicon pack (.zip) per image instead")
+
+    p = command("crop", "crop/fit images to a social-media size", many_inputs=True)
+    p.add_argument("--size", default="1080x1080", help="WIDTHxHEIGHT")
+    p.add_argument("--preset", help="a preset name from the Social cropper tool")
+    p.add_argument("--mode", choices=["cover", "contain"], default="cover")
+    p.add_argument("--bg", default="#ffffff", help="padding color for --mode contain")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    out = Output(args)
+    started = time.perf_counter()
+    try:
+        status = COMMANDS[args.command](args, out) or 0
+    finally:
+        out.close()
+    elapsed = time.perf_counter() - started
+    rate = out.count / elapsed if elapsed > 0 else 0
+    print(f"{args.command}: {out.count} file(s) in {elapsed:.1f}s ({rate:.1f}/s)", file=sys.stderr)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
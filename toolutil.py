@@ -0,0 +1,135 @@
+"""Per-process registry of imported tool modules. Lives at repo root so main.py
+doesn't list it as a tool.
+
+Each services/*.py is compiled and imported once per (path, mtime) and the
+module object is reused on every Streamlit rerun, so a widget interaction only
+calls `run(lang)` again instead of re-executing the module body. Saving a file
+bumps its mtime, which triggers a fresh import on the next rerun.
+"""
+import importlib.util
+import os
+import re
+import sys
+import threading
+import types
+
+SERVICES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "services")
+
+_registry = {}  # abs path -> (mtime_ns, module)
+_lock = threading.Lock()
+
+
+def module_name(path):
+    """Stable, importable-looking sys.modules name for a service file."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return "tools." + re.sub(r"\W+", "_", stem).strip("_").lower()
+
+
+def tool_path(filename):
+    """Absolute path of a service file given its filename (or a path)."""
+    return os.path.abspath(filename if os.path.dirname(filename) else os.path.join(SERVICES_DIR, filename))
+
+
+def load_tool(filename):
+    """Return the imported module for a service file, importing it at most once per mtime."""
+    path = tool_path(filename)
+    mtime = os.stat(path).st_mtime_ns
+    cached = _registry.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with _lock:
+        cached = _registry.get(path)  # another session may have loaded it meanwhile
+        if cached and cached[0] == mtime:
+            return cached[1]
+        name = module_name(path)
+        # pickle imports "tools" before "tools.<name>", so classes a tool defines
+        # (e.g. result dataclasses coming back from a worker) need the parent too.
+        sys.modules.setdefault("tools", types.ModuleType("tools"))
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(name, None)
+            raise
+        _registry[path] = (mtime, module)
+        return module
+
+
+def loaded_tools():
+    """Filenames of the tool modules currently held in the registry."""
+    return sorted(os.path.basename(p) for p in _registry)
+
+
+# --- Import profile (python toolutil.py --import-profile) ---
+# Each tool is imported in a fresh interpreter under `-X importtime`; modules the
+# app shell already pulls in (streamlit, translations, ...) are subtracted so the
+# table shows what opening that one tool costs.
+
+_BASELINE = "import toolutil, streamlit, translations"
+
+
+def _importtime(code):
+    """Run `code` under -X importtime; return {module: self_us}."""
+    import subprocess
+    root = os.path.dirname(os.path.abspath(__file__))
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          cwd=root, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "import failed")
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|", 2)
+        times[name.strip()] = int(self_us)
+    return times
+
+
+def import_profile(filenames=None, top=3):
+    """Return [(tool, total_ms, [(package, ms), ...]), ...], heaviest first."""
+    baseline = set(_importtime(_BASELINE))
+    names = filenames or sorted(f for f in os.listdir(SERVICES_DIR) if f.endswith(".py"))
+    rows = []
+    for fname in names:
+        try:
+            times = _importtime(f"import toolutil; toolutil.load_tool({fname!r})")
+        except RuntimeError as e:
+            rows.append((fname[:-3], None, [(str(e), 0.0)]))
+            continue
+        by_pkg = {}
+        for mod, us in times.items():
+            if mod not in baseline:
+                pkg = mod.split(".")[0]
+                by_pkg[pkg] = by_pkg.get(pkg, 0) + us
+        heavy = sorted(by_pkg.items(), key=lambda kv: -kv[1])[:top]
+        rows.append((fname[:-3], sum(by_pkg.values()) / 1000, [(p, us / 1000) for p, us in heavy]))
+    rows.sort(key=lambda r: -(r[1] or 0))
+    return rows
+
+
+def _print_profile(rows):
+    width = max([len(r[0]) for r in rows] + [4])
+    print(f"{'tool':<{width}}  {'import ms':>9}  heaviest packages")
+    print("-" * (width + 40))
+    for tool, total, heavy in rows:
+        if total is None:
+            print(f"{tool:<{width}}  {'FAIL':>9}  {heavy[0][0]}")
+            continue
+        pkgs = ", ".join(f"{p} {ms:.1f}" for p, ms in heavy)
+        print(f"{tool:<{width}}  {total:>9.1f}  {pkgs}")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Tool module utilities.")
+    parser.add_argument("--import-profile", action="store_true",
+                        help="print per-tool import time (beyond the app shell), heaviest first")
+    parser.add_argument("tools", nargs="*", help="service filenames to profile (default: all)")
+    args = parser.parse_args()
+    if not args.import_profile:
+        parser.print_help()
+        sys.exit(0)
+    wanted = [n if n.endswith(".py") else n + ".py" for n in args.tools]
+    _print_profile(import_profile(wanted or None))
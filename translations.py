@@ -57,6 +57,14 @@ translations = {
         "ical_download": "Download ICS Calendar",
         "ical_template": "Download Excel Template",
         "ical_error": "Error processing file: ",
+        "ical_direction": "Direction",
+        "ical_to_ics": "Excel → ICS",
+        "ical_to_excel": "ICS → Excel",
+        "ical_upload_ics": "Select your .ics calendar file:",
+        "ical_window": "Expand recurring events between",
+        "ical_convert_excel": "Convert to Excel",
+        "ical_download_excel": "Download Excel file",
+        "ical_recurring": "Merge repeating events into recurring ones (RRULE)",
         
         # Markdown Converter
         "md_title": "Office to Markdown",
@@ -187,6 +195,14 @@ translations = {
         "ical_download": "Pobierz kalendarz ICS",
         "ical_template": "Pobierz szablon Excela",
         "ical_error": "Błąd przetwarzania pliku: ",
+        "ical_direction": "Kierunek",
+        "ical_to_ics": "Excel → ICS",
+        "ical_to_excel": "ICS → Excel",
+        "ical_upload_ics": "Wybierz plik kalendarza .ics:",
+        "ical_window": "Rozwiń wydarzenia cykliczne w zakresie",
+        "ical_convert_excel": "Konwertuj do Excela",
+        "ical_download_excel": "Pobierz plik Excela",
+        "ical_recurring": "Scal powtarzające się wydarzenia w cykliczne (RRULE)",
         "md_title": "Office do Markdown",
         "md_upload": "Prześlij plik do konwersji",
         "md_youtube": "Lub wpisz link do YouTube",
@@ -297,6 +313,14 @@ translations = {
         "ical_download": "ICS-Kalender herunterladen",
         "ical_template": "Excel-Vorlage herunterladen",
         "ical_error": "Fehler bei der Verarbeitung der Datei: ",
+        "ical_direction": "Richtung",
+        "ical_to_ics": "Excel → ICS",
+        "ical_to_excel": "ICS → Excel",
+        "ical_upload_ics": "Wählen Sie Ihre .ics-Kalenderdatei:",
+        "ical_window": "Serientermine erweitern im Zeitraum",
+        "ical_convert_excel": "In Excel konvertieren",
+        "ical_download_excel": "Excel-Datei herunterladen",
+        "ical_recurring": "Wiederkehrende Termine zu Serien zusammenfassen (RRULE)",
         "md_title": "Office in Markdown",
         "md_upload": "Datei zum Konvertieren hochladen",
         "md_youtube": "Oder geben Sie eine YouTube-URL ein",
@@ -407,6 +431,14 @@ translations = {
         "ical_download": "Завантажити календар ICS",
         "ical_template": "Завантажити шаблон Excel",
         "ical_error": "Помилка обробки файлу: ",
+        "ical_direction": "Напрямок",
+        "ical_to_ics": "Excel → ICS",
+        "ical_to_excel": "ICS → Excel",
+        "ical_upload_ics": "Виберіть файл календаря .ics:",
+        "ical_window": "Розгорнути регулярні події в періоді",
+        "ical_convert_excel": "Конвертувати в Excel",
+        "ical_download_excel": "Завантажити файл Excel",
+        "ical_recurring": "Об'єднати повторювані події в регулярні (RRULE)",
         "md_title": "Office у Markdown",
         "md_upload": "Завантажте файл для конвертації",
         "md_youtube": "Або введіть посилання на YouTube",
@@ -517,6 +549,14 @@ translations = {
         "ical_download": "下载 ICS 日历",
         "ical_template": "下载 Excel 模板",
         "ical_error": "处理文件时出错：",
+        "ical_direction": "方向",
+        "ical_to_ics": "Excel → ICS",
+        "ical_to_excel": "ICS → Excel",
+        "ical_upload_ics": "选择 .ics 日历文件：",
+        "ical_window": "在此期间展开周期性事件",
+        "ical_convert_excel": "转换为 Excel",
+        "ical_download_excel": "下载 Excel 文件",
+        "ical_recurring": "将重复的事件合并为周期性事件（RRULE）",
         "md_title": "Office 转 Markdown",
         "md_upload": "上传要转换的文件",
         "md_youtube": "或输入 YouTube 链接",
@@ -850,6 +890,12 @@ _TOOLS_BATCH2 = {
         "clean_after": "After",
         "clean_rows_removed": "Rows removed",
         "clean_download": "Download cleaned file",
+        "clean_fuzzy": "Find near-duplicate rows (fuzzy)",
+        "clean_fuzzy_cols": "Compare rows on columns",
+        "clean_fuzzy_threshold": "Similarity threshold",
+        "clean_fuzzy_merged": "Near-duplicate rows merged",
+        "clean_download_clusters": "Download with cluster IDs",
+        "clean_download_merged": "Download merged file",
         "json_title": "JSON Formatter & Validator",
         "json_input": "Paste JSON:",
         "json_indent": "Indent (spaces)",
@@ -915,6 +961,12 @@ _TOOLS_BATCH2 = {
         "clean_after": "Po",
         "clean_rows_removed": "Usunięte wiersze",
         "clean_download": "Pobierz oczyszczony plik",
+        "clean_fuzzy": "Znajdź podobne wiersze (dopasowanie przybliżone)",
+        "clean_fuzzy_cols": "Porównuj wiersze według kolumn",
+        "clean_fuzzy_threshold": "Próg podobieństwa",
+        "clean_fuzzy_merged": "Scalone podobne wiersze",
+        "clean_download_clusters": "Pobierz z identyfikatorami grup",
+        "clean_download_merged": "Pobierz scalony plik",
         "json_title": "Formatowanie i walidacja JSON",
         "json_input": "Wklej JSON:",
         "json_indent": "Wcięcie (spacje)",
@@ -980,6 +1032,12 @@ _TOOLS_BATCH2 = {
         "clean_after": "Nachher",
         "clean_rows_removed": "Entfernte Zeilen",
         "clean_download": "Bereinigte Datei herunterladen",
+        "clean_fuzzy": "Ähnliche Zeilen finden (unscharf)",
+        "clean_fuzzy_cols": "Zeilen vergleichen anhand der Spalten",
+        "clean_fuzzy_threshold": "Ähnlichkeitsschwelle",
+        "clean_fuzzy_merged": "Zusammengeführte ähnliche Zeilen",
+        "clean_download_clusters": "Mit Cluster-IDs herunterladen",
+        "clean_download_merged": "Zusammengeführte Datei herunterladen",
         "json_title": "JSON-Formatierer & -Validator",
         "json_input": "JSON einfügen:",
         "json_indent": "Einrückung (Leerzeichen)",
@@ -1045,6 +1103,12 @@ _TOOLS_BATCH2 = {
         "clean_after": "Після",
         "clean_rows_removed": "Видалено рядків",
         "clean_download": "Завантажити очищений файл",
+        "clean_fuzzy": "Знайти схожі рядки (нечіткий пошук)",
+        "clean_fuzzy_cols": "Порівнювати рядки за стовпцями",
+        "clean_fuzzy_threshold": "Поріг схожості",
+        "clean_fuzzy_merged": "Об’єднано схожих рядків",
+        "clean_download_clusters": "Завантажити з ідентифікаторами груп",
+        "clean_download_merged": "Завантажити об’єднаний файл",
         "json_title": "Форматувальник і валідатор JSON",
         "json_input": "Вставте JSON:",
         "json_indent": "Відступ (пробіли)",
@@ -1110,6 +1174,12 @@ _TOOLS_BATCH2 = {
         "clean_after": "清理后",
         "clean_rows_removed": "已删除行数",
         "clean_download": "下载清理后的文件",
+        "clean_fuzzy": "查找近似重复行（模糊匹配）",
+        "clean_fuzzy_cols": "按以下列比较行",
+        "clean_fuzzy_threshold": "相似度阈值",
+        "clean_fuzzy_merged": "已合并的近似重复行",
+        "clean_download_clusters": "下载含分组 ID 的文件",
+        "clean_download_merged": "下载合并后的文件",
         "json_title": "JSON 格式化与校验",
         "json_input": "粘贴 JSON：",
         "json_indent": "缩进（空格）",
@@ -1205,14 +1275,24 @@ _TOOLS_BATCH3 = {
         "sql_format": "Format", "sql_empty": "Please paste some SQL.", "sql_download": "Download SQL",
         "anon_title": "Data Anonymizer", "anon_upload": "Upload a CSV or Excel file:",
         "anon_error": "Could not read the file:", "anon_options": "What to mask", "anon_emails": "Mask emails",
-        "anon_phones": "Mask phone numbers", "anon_names_col": "Hash this column (optional)",
+        "anon_phones": "Mask phone numbers", "anon_names_col": "Pseudonymize these columns (optional)",
         "anon_run": "Anonymize", "anon_none": "Select at least one option.",
         "anon_download": "Download anonymized file",
+        "anon_key": "Pseudonymization key (hex)",
+        "anon_key_help": "The same key gives the same pseudonyms, so files processed with it can still be joined. Leave empty to generate one; keep it secret.",
+        "anon_key_download": "Download key", "anon_key_invalid": "The key must be 16–64 bytes written as hex.",
         "faker_title": "Sample Data Generator", "faker_rows": "Number of rows", "faker_fields": "Fields",
-        "faker_generate": "Generate", "faker_download": "Download CSV", "faker_f_name": "Name",
+        "faker_generate": "Generate", "faker_download": "Download file", "faker_f_name": "Name",
         "faker_f_email": "Email", "faker_f_phone": "Phone", "faker_f_company": "Company",
         "faker_f_address": "Address", "faker_f_city": "City", "faker_f_country": "Country",
         "faker_f_job": "Job title", "faker_f_date": "Date",
+        "faker_format": "File format", "faker_seed": "Seed", "faker_seed_help": "The same seed, fields and row count always give the same file.",
+        "faker_done": "Rows generated", "faker_rate": "rows/s",
+        "faker_rows_help": "At most {rows} rows for these fields and format: the download is held in memory and capped at {mb} MB.",
+        "faker_pool": "Fast mode: reuse {n} values per column", "faker_pool_help": "About 20x faster, but values repeat, so columns such as email or name are not unique. Leave off for unique keys and realistic cardinality.",
+        "faker_mode": "Mode", "faker_mode_table": "Single table", "faker_mode_schema": "Related tables (schema)",
+        "faker_schema": "Schema (JSON or YAML)", "faker_schema_help": "Tables with primary keys, foreign keys (per_parent sets how many child rows each parent gets) and a field per column. Fields:",
+        "faker_schema_error": "Invalid schema:",
         "cur_title": "Currency Converter", "cur_amount": "Amount", "cur_from": "From", "cur_to": "To",
         "cur_convert": "Convert", "cur_result": "Result", "cur_rate": "Rate",
         "cur_error": "Could not fetch exchange rates. Please try again.",
@@ -1261,13 +1341,23 @@ _TOOLS_BATCH3 = {
         "anon_title": "Anonimizacja danych", "anon_upload": "Prześlij plik CSV lub Excel:",
         "anon_error": "Nie udało się odczytać pliku:", "anon_options": "Co zamaskować",
         "anon_emails": "Maskuj adresy e-mail", "anon_phones": "Maskuj numery telefonów",
-        "anon_names_col": "Zamień tę kolumnę na skrót hash (opcjonalnie)", "anon_run": "Anonimizuj",
+        "anon_names_col": "Pseudonimizuj te kolumny (opcjonalnie)", "anon_run": "Anonimizuj",
         "anon_none": "Wybierz przynajmniej jedną opcję.", "anon_download": "Pobierz zanonimizowany plik",
+        "anon_key": "Klucz pseudonimizacji (hex)",
+        "anon_key_help": "Ten sam klucz daje te same pseudonimy, więc pliki przetworzone nim można nadal łączyć. Zostaw puste, aby wygenerować nowy; zachowaj go w tajemnicy.",
+        "anon_key_download": "Pobierz klucz", "anon_key_invalid": "Klucz musi mieć 16–64 bajtów zapisanych szesnastkowo.",
         "faker_title": "Generator danych testowych", "faker_rows": "Liczba wierszy", "faker_fields": "Pola",
-        "faker_generate": "Generuj", "faker_download": "Pobierz CSV", "faker_f_name": "Imię i nazwisko",
+        "faker_generate": "Generuj", "faker_download": "Pobierz plik", "faker_f_name": "Imię i nazwisko",
         "faker_f_email": "E-mail", "faker_f_phone": "Telefon", "faker_f_company": "Firma",
         "faker_f_address": "Adres", "faker_f_city": "Miasto", "faker_f_country": "Kraj",
         "faker_f_job": "Stanowisko", "faker_f_date": "Data",
+        "faker_format": "Format pliku", "faker_seed": "Ziarno losowania", "faker_seed_help": "To samo ziarno, pola i liczba wierszy zawsze dają ten sam plik.",
+        "faker_done": "Wygenerowane wiersze", "faker_rate": "wierszy/s",
+        "faker_rows_help": "Najwyżej {rows} wierszy dla tych pól i formatu: plik do pobrania jest trzymany w pamięci i ograniczony do {mb} MB.",
+        "faker_pool": "Tryb szybki: powtarzaj {n} wartości na kolumnę", "faker_pool_help": "Około 20x szybciej, ale wartości się powtarzają, więc kolumny takie jak e-mail czy nazwisko nie są unikalne. Wyłącz dla unikalnych kluczy i realistycznej liczności.",
+        "faker_mode": "Tryb", "faker_mode_table": "Jedna tabela", "faker_mode_schema": "Powiązane tabele (schemat)",
+        "faker_schema": "Schemat (JSON lub YAML)", "faker_schema_help": "Tabele z kluczami głównymi, kluczami obcymi (per_parent określa, ile wierszy podrzędnych dostaje każdy wiersz nadrzędny) i polem dla każdej kolumny. Pola:",
+        "faker_schema_error": "Nieprawidłowy schemat:",
         "cur_title": "Przelicznik walut", "cur_amount": "Kwota", "cur_from": "Z", "cur_to": "Na",
         "cur_convert": "Przelicz", "cur_result": "Wynik", "cur_rate": "Kurs",
         "cur_error": "Nie udało się pobrać kursów walut. Spróbuj ponownie.",
@@ -1318,13 +1408,23 @@ _TOOLS_BATCH3 = {
         "anon_title": "Daten-Anonymisierung", "anon_upload": "CSV- oder Excel-Datei hochladen:",
         "anon_error": "Datei konnte nicht gelesen werden:", "anon_options": "Was maskieren",
         "anon_emails": "E-Mails maskieren", "anon_phones": "Telefonnummern maskieren",
-        "anon_names_col": "Diese Spalte hashen (optional)", "anon_run": "Anonymisieren",
+        "anon_names_col": "Diese Spalten pseudonymisieren (optional)", "anon_run": "Anonymisieren",
         "anon_none": "Bitte mindestens eine Option wählen.", "anon_download": "Anonymisierte Datei herunterladen",
+        "anon_key": "Pseudonymisierungsschlüssel (hex)",
+        "anon_key_help": "Derselbe Schlüssel ergibt dieselben Pseudonyme, so lassen sich damit bearbeitete Dateien weiter verknüpfen. Leer lassen, um einen zu erzeugen; geheim halten.",
+        "anon_key_download": "Schlüssel herunterladen", "anon_key_invalid": "Der Schlüssel muss 16–64 Bytes in Hex-Schreibweise haben.",
         "faker_title": "Testdaten-Generator", "faker_rows": "Anzahl der Zeilen", "faker_fields": "Felder",
-        "faker_generate": "Generieren", "faker_download": "CSV herunterladen", "faker_f_name": "Vollständiger Name",
+        "faker_generate": "Generieren", "faker_download": "Datei herunterladen", "faker_f_name": "Vollständiger Name",
         "faker_f_email": "E-Mail", "faker_f_phone": "Telefon", "faker_f_company": "Unternehmen",
         "faker_f_address": "Adresse", "faker_f_city": "Stadt", "faker_f_country": "Land",
         "faker_f_job": "Position", "faker_f_date": "Datum",
+        "faker_format": "Dateiformat", "faker_seed": "Startwert (Seed)", "faker_seed_help": "Gleicher Startwert, gleiche Felder und Zeilenzahl ergeben immer dieselbe Datei.",
+        "faker_done": "Erzeugte Zeilen", "faker_rate": "Zeilen/s",
+        "faker_rows_help": "Höchstens {rows} Zeilen für diese Felder und dieses Format: Der Download liegt im Speicher und ist auf {mb} MB begrenzt.",
+        "faker_pool": "Schnellmodus: {n} Werte pro Spalte wiederverwenden", "faker_pool_help": "Etwa 20x schneller, aber Werte wiederholen sich, sodass Spalten wie E-Mail oder Name nicht eindeutig sind. Für eindeutige Schlüssel und realistische Kardinalität ausgeschaltet lassen.",
+        "faker_mode": "Modus", "faker_mode_table": "Einzelne Tabelle", "faker_mode_schema": "Verknüpfte Tabellen (Schema)",
+        "faker_schema": "Schema (JSON oder YAML)", "faker_schema_help": "Tabellen mit Primärschlüsseln, Fremdschlüsseln (per_parent legt fest, wie viele Kindzeilen jede Elternzeile erhält) und einem Feld pro Spalte. Felder:",
+        "faker_schema_error": "Ungültiges Schema:",
         "cur_title": "Währungsrechner", "cur_amount": "Betrag", "cur_from": "Von", "cur_to": "Nach",
         "cur_convert": "Umrechnen", "cur_result": "Ergebnis", "cur_rate": "Kurs",
         "cur_error": "Wechselkurse konnten nicht abgerufen werden. Bitte erneut versuchen.",
@@ -1374,13 +1474,23 @@ _TOOLS_BATCH3 = {
         "anon_title": "Анонімізація даних", "anon_upload": "Завантажте файл CSV або Excel:",
         "anon_error": "Не вдалося прочитати файл:", "anon_options": "Що замаскувати",
         "anon_emails": "Маскувати електронні адреси", "anon_phones": "Маскувати номери телефонів",
-        "anon_names_col": "Хешувати цей стовпець (необов’язково)", "anon_run": "Анонімізувати",
+        "anon_names_col": "Псевдонімізувати ці стовпці (необов’язково)", "anon_run": "Анонімізувати",
         "anon_none": "Виберіть принаймні один варіант.", "anon_download": "Завантажити анонімізований файл",
+        "anon_key": "Ключ псевдонімізації (hex)",
+        "anon_key_help": "Той самий ключ дає ті самі псевдоніми, тож оброблені ним файли можна й далі об’єднувати. Залиште порожнім, щоб створити новий; зберігайте його в таємниці.",
+        "anon_key_download": "Завантажити ключ", "anon_key_invalid": "Ключ має містити 16–64 байти в шістнадцятковому записі.",
         "faker_title": "Генератор тестових даних", "faker_rows": "Кількість рядків", "faker_fields": "Поля",
-        "faker_generate": "Згенерувати", "faker_download": "Завантажити CSV", "faker_f_name": "Ім’я",
+        "faker_generate": "Згенерувати", "faker_download": "Завантажити файл", "faker_f_name": "Ім’я",
         "faker_f_email": "Електронна пошта", "faker_f_phone": "Телефон", "faker_f_company": "Компанія",
         "faker_f_address": "Адреса", "faker_f_city": "Місто", "faker_f_country": "Країна",
         "faker_f_job": "Посада", "faker_f_date": "Дата",
+        "faker_format": "Формат файлу", "faker_seed": "Початкове значення (seed)", "faker_seed_help": "Те саме значення, поля й кількість рядків завжди дають той самий файл.",
+        "faker_done": "Згенеровано рядків", "faker_rate": "рядків/с",
+        "faker_rows_help": "Щонайбільше {rows} рядків для цих полів і формату: файл для завантаження тримається в пам’яті й обмежений {mb} МБ.",
+        "faker_pool": "Швидкий режим: повторювати {n} значень на стовпець", "faker_pool_help": "Приблизно в 20 разів швидше, але значення повторюються, тож стовпці на кшталт e-mail чи імені не унікальні. Вимкніть для унікальних ключів і реалістичної кардинальності.",
+        "faker_mode": "Режим", "faker_mode_table": "Одна таблиця", "faker_mode_schema": "Пов’язані таблиці (схема)",
+        "faker_schema": "Схема (JSON або YAML)", "faker_schema_help": "Таблиці з первинними ключами, зовнішніми ключами (per_parent задає, скільки дочірніх рядків отримує кожен батьківський) і полем для кожного стовпця. Поля:",
+        "faker_schema_error": "Некоректна схема:",
         "cur_title": "Конвертер валют", "cur_amount": "Сума", "cur_from": "З", "cur_to": "У",
         "cur_convert": "Конвертувати", "cur_result": "Результат", "cur_rate": "Курс",
         "cur_error": "Не вдалося отримати курси валют. Спробуйте ще раз.",
@@ -1424,12 +1534,22 @@ _TOOLS_BATCH3 = {
         "sql_format": "格式化", "sql_empty": "请粘贴一些 SQL。", "sql_download": "下载 SQL",
         "anon_title": "数据匿名化", "anon_upload": "上传 CSV 或 Excel 文件：", "anon_error": "无法读取文件：",
         "anon_options": "匿名化内容", "anon_emails": "匿名化邮箱", "anon_phones": "匿名化电话号码",
-        "anon_names_col": "对该列生成哈希值（可选）", "anon_run": "匿名化", "anon_none": "请至少选择一项。",
+        "anon_names_col": "对这些列进行假名化（可选）", "anon_run": "匿名化", "anon_none": "请至少选择一项。",
         "anon_download": "下载匿名化文件",
+        "anon_key": "假名化密钥（十六进制）",
+        "anon_key_help": "相同的密钥生成相同的假名，因此用它处理的文件仍可关联。留空将生成新密钥；请妥善保密。",
+        "anon_key_download": "下载密钥", "anon_key_invalid": "密钥必须是 16–64 字节的十六进制字符串。",
         "faker_title": "测试数据生成器", "faker_rows": "行数", "faker_fields": "字段", "faker_generate": "生成",
-        "faker_download": "下载 CSV", "faker_f_name": "姓名", "faker_f_email": "邮箱", "faker_f_phone": "电话",
+        "faker_download": "下载文件", "faker_f_name": "姓名", "faker_f_email": "邮箱", "faker_f_phone": "电话",
         "faker_f_company": "公司", "faker_f_address": "地址", "faker_f_city": "城市", "faker_f_country": "国家",
         "faker_f_job": "职位", "faker_f_date": "日期",
+        "faker_format": "文件格式", "faker_seed": "随机种子", "faker_seed_help": "相同的种子、字段和行数总是生成相同的文件。",
+        "faker_done": "已生成行数", "faker_rate": "行/秒",
+        "faker_rows_help": "对于这些字段和格式最多 {rows} 行：下载文件保存在内存中，上限为 {mb} MB。",
+        "faker_pool": "快速模式：每列重复使用 {n} 个值", "faker_pool_help": "约快 20 倍，但值会重复，因此邮箱或姓名等列不唯一。需要唯一键和真实基数时请关闭。",
+        "faker_mode": "模式", "faker_mode_table": "单个表", "faker_mode_schema": "关联表（模式定义）",
+        "faker_schema": "模式定义（JSON 或 YAML）", "faker_schema_help": "包含主键、外键（per_parent 设置每个父行对应的子行数量）以及每列字段的表。可用字段：",
+        "faker_schema_error": "模式定义无效：",
         "cur_title": "货币转换器", "cur_amount": "金额", "cur_from": "从", "cur_to": "到", "cur_convert": "转换",
         "cur_result": "结果", "cur_rate": "汇率", "cur_error": "无法获取汇率，请重试。",
         "cur_note": "实时汇率来自 open.er-api.com，所选货币代码会发送至该服务。",
@@ -1502,6 +1622,7 @@ _TOOLS_BATCH4 = {
         "certimg_signer": "Signed by", "certimg_make": "Generate", "certimg_download": "Download image",
         "certimg_empty": "Enter a recipient name.",
         "qr_print_sheet": "Print sheet (PDF)",
+        "qr_download_svg": "Download SVG (vector)", "qr_format": "File format",
     },
     "Polski": {
         "news_title": "Kreator newslettera", "news_brand": "Nazwa marki / nadawcy", "news_headline": "Nagłówek",
@@ -1552,6 +1673,7 @@ _TOOLS_BATCH4 = {
         "certimg_text": "Treść certyfikatu", "certimg_signer": "Podpisano przez", "certimg_make": "Generuj",
         "certimg_download": "Pobierz obraz", "certimg_empty": "Podaj imię i nazwisko odbiorcy.",
         "qr_print_sheet": "Arkusz do druku (PDF)",
+        "qr_download_svg": "Pobierz SVG (wektor)", "qr_format": "Format pliku",
     },
     "Deutsch": {
         "news_title": "Newsletter-Generator", "news_brand": "Marken-/Absendername", "news_headline": "Überschrift",
@@ -1604,6 +1726,7 @@ _TOOLS_BATCH4 = {
         "certimg_text": "Zertifikatstext", "certimg_signer": "Unterzeichnet von", "certimg_make": "Generieren",
         "certimg_download": "Bild herunterladen", "certimg_empty": "Namen des Empfängers eingeben.",
         "qr_print_sheet": "Druckbogen (PDF)",
+        "qr_download_svg": "SVG herunterladen (Vektor)", "qr_format": "Dateiformat",
     },
     "Українська": {
         "news_title": "Конструктор розсилки", "news_brand": "Назва бренду / відправника",
@@ -1657,6 +1780,7 @@ _TOOLS_BATCH4 = {
         "certimg_text": "Текст сертифіката", "certimg_signer": "Підписано", "certimg_make": "Згенерувати",
         "certimg_download": "Завантажити зображення", "certimg_empty": "Вкажіть ім’я отримувача.",
         "qr_print_sheet": "Аркуш для друку (PDF)",
+        "qr_download_svg": "Завантажити SVG (вектор)", "qr_format": "Формат файлу",
     },
     "中文": {
         "news_title": "电子简报生成器", "news_brand": "品牌 / 发件人名称", "news_headline": "标题",
@@ -1698,6 +1822,7 @@ _TOOLS_BATCH4 = {
         "certimg_title": "证书图片", "certimg_recipient": "获奖者姓名", "certimg_text": "证书内容",
         "certimg_signer": "签发人", "certimg_make": "生成", "certimg_download": "下载图片", "certimg_empty": "请输入获奖者姓名。",
         "qr_print_sheet": "打印版表单 (PDF)",
+        "qr_download_svg": "下载 SVG（矢量）", "qr_format": "文件格式",
     },
 }
 for _lang, _extra in _TOOLS_BATCH4.items():
@@ -1994,3 +2119,36 @@ _LEGAL = {
 }
 for _lang, _extra in _LEGAL.items():
     translations.setdefault(_lang, {}).update(_extra)
+
+
+# --- Compiled lookup tables ---
+# Every language is merged over English once, at import, into a read-only table;
+# `for_lang(lang)` is the one accessor the app and the tools use, so a key missing
+# from a partial locale falls back to English instead of raising KeyError.
+# `MISSING_KEYS[lang]` lists what each language still falls back on
+# (`python translations.py` prints the report).
+from types import MappingProxyType as _Frozen
+
+
+def _compile(source, base="English"):
+    fallback = source[base]
+    tables = {lang: _Frozen({**fallback, **strings}) for lang, strings in source.items()}
+    missing = {lang: tuple(sorted(k for k in fallback if k not in strings)) for lang, strings in source.items()}
+    return _Frozen(tables), _Frozen(missing)
+
+
+TABLES, MISSING_KEYS = _compile(translations)
+LANGUAGES = tuple(TABLES)
+
+
+def for_lang(lang):
+    """Fully merged, read-only string table for `lang` (English for unknown languages)."""
+    return TABLES.get(lang) or TABLES["English"]
+
+
+if __name__ == "__main__":
+    for _lang in LANGUAGES:
+        _keys = MISSING_KEYS[_lang]
+        print(f"{_lang}: {len(TABLES[_lang])} keys, {len(_keys)} falling back to English")
+        for _key in _keys:
+            print(f"  {_key}")
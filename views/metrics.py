@@ -0,0 +1,74 @@
+import hmac
+import os
+import tracemalloc
+
+import streamlit as st
+
+import cacheutil
+import fontutil
+import perfutil
+
+# Hidden admin page: only reachable via ?admin=<TOOLS_ADMIN_KEY>, and only when
+# that environment variable is set. Operator-facing, so English fallbacks suffice.
+ADMIN_KEY_ENV = "TOOLS_ADMIN_KEY"
+
+_DEFAULTS = {
+    "metrics_title": "Tool metrics",
+    "metrics_intro": "Per-tool run times, CPU, peak memory and upload sizes since this process started "
+                     "(last {n} runs per tool).",
+    "metrics_empty": "No tool runs recorded yet.",
+    "metrics_tracing": "Trace peak memory (tracemalloc — slows every tool while on)",
+    "metrics_summary_csv": "Download summary (CSV)",
+    "metrics_samples_csv": "Download raw samples (CSV)",
+    "metrics_clear": "Clear",
+    "metrics_cache": "Result cache",
+    "metrics_cache_sizes": "Memory tier: {entries} entries, {mem} MB · disk tier: {disk}",
+    "metrics_fonts": "Fonts: {hits} cache hits, {loads} loads ({cached} cached) · "
+                     "{docs} PDFs served from the parsed DejaVu template",
+}
+
+
+def allowed(key):
+    """True when the metrics page is enabled and `key` matches the configured admin key."""
+    expected = os.environ.get(ADMIN_KEY_ENV)
+    return bool(expected) and isinstance(key, str) and hmac.compare_digest(key.encode(), expected.encode())
+
+
+def render(t):
+    t = {**_DEFAULTS, **t}
+    st.title("📈 " + t["metrics_title"])
+    st.caption(t["metrics_intro"].format(n=perfutil.MAX_SAMPLES))
+
+    tracing = st.toggle(t["metrics_tracing"], value=tracemalloc.is_tracing())
+    perfutil.set_memory_tracing(tracing)
+
+    rows = perfutil.summary()
+    if not rows:
+        st.info(t["metrics_empty"])
+        _cache_stats(t)
+        return
+    rows.sort(key=lambda r: -(r["wall_ms_p95"] or 0))
+    st.dataframe(rows, use_container_width=True, hide_index=True)
+
+    c1, c2, c3 = st.columns(3)
+    c1.download_button("⬇️ " + t["metrics_summary_csv"], perfutil.to_csv(rows),
+                       file_name="tool_metrics_summary.csv", mime="text/csv")
+    c2.download_button("⬇️ " + t["metrics_samples_csv"], perfutil.to_csv(perfutil.samples()),
+                       file_name="tool_metrics_samples.csv", mime="text/csv")
+    if c3.button(t["metrics_clear"]):
+        perfutil.clear()
+        cacheutil.clear()
+        st.rerun()
+    _cache_stats(t)
+
+
+def _cache_stats(t):
+    stats = cacheutil.stats()
+    st.subheader(t["metrics_cache"])
+    disk = "off" if stats["disk_mb"] is None else f"{stats['disk_mb']} MB"
+    st.caption(t["metrics_cache_sizes"].format(entries=stats["memory_entries"], mem=stats["memory_mb"], disk=disk))
+    if stats["rows"]:
+        st.dataframe(stats["rows"], use_container_width=True, hide_index=True)
+    fonts = fontutil.stats()
+    st.caption(t["metrics_fonts"].format(hits=fonts["pillow_hits"], loads=fonts["pillow_loads"],
+                                         cached=fonts["pillow_cached"], docs=fonts["pdf_documents"]))
@@ -0,0 +1,94 @@
+"""Disk-spooled ZIP archives for batch downloads. Lives at repo root so main.py
+doesn't list it as a tool.
+
+    with ZipSink() as zf:
+        for name, data in results:
+            zf.add(name, data)
+    st.download_button(label, zf.file(), file_name="out.zip", mime="application/zip")
+
+Entries are written as they are produced into a SpooledTemporaryFile that moves
+to disk past SPOOL_LIMIT, and the finished archive is handed over as a rewound
+file handle — no `BytesIO.getvalue()` copy of the whole archive. Members that are
+already compressed (PNG, JPEG, WEBP, ...) are stored instead of deflated.
+"""
+import io
+import os
+import shutil
+import tempfile
+import time
+import zipfile
+
+SPOOL_LIMIT = 32 * 1024 * 1024  # bytes kept in RAM before spilling to a temp file
+
+# Formats whose payload is already compressed; deflating them again only costs CPU.
+STORED_EXTS = {".png", ".jpg", ".jpeg", ".webp", ".gif", ".zip", ".gz", ".mp3", ".epub", ".docx", ".xlsx", ".pptx", ".parquet"}
+
+
+def readable(spool):
+    """A SpooledTemporaryFile as a handle st.download_button accepts, at offset 0.
+
+    st.download_button accepts BytesIO and BufferedReader: while the spool is
+    still in RAM a BytesIO sharing its buffer, once it has spilled to disk a reader
+    on the temp file, so the content is never copied here.
+    """
+    inner = spool._file  # BytesIO until rolled over, then a real temp file
+    if isinstance(inner, io.BytesIO):
+        # A new BytesIO over getvalue() shares the buffer (CPython), and unlike
+        # `inner` it isn't closed when the spool is garbage-collected.
+        return io.BytesIO(inner.getvalue())
+    inner.flush()
+    reader = open(os.dup(inner.fileno()), "rb")
+    reader.seek(0)
+    return reader
+
+
+class ZipSink:
+    """A ZIP archive written entry by entry into a spooled temporary file."""
+
+    def __init__(self, spool_limit=SPOOL_LIMIT):
+        self._buf = tempfile.SpooledTemporaryFile(max_size=spool_limit, mode="w+b")
+        self._zip = zipfile.ZipFile(self._buf, "w", zipfile.ZIP_DEFLATED)
+        self.count = 0
+
+    def add(self, name, data):
+        """Add one member; PNG/JPEG/... are stored, everything else is deflated."""
+        stored = os.path.splitext(name)[1].lower() in STORED_EXTS
+        self._zip.writestr(name, data, compress_type=zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED)
+        self.count += 1
+
+    def add_file(self, name, f):
+        """Add one member copied from a readable file handle in blocks, so it's never in memory whole."""
+        info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+        stored = os.path.splitext(name)[1].lower() in STORED_EXTS
+        info.compress_type = zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED
+        with self._zip.open(info, "w", force_zip64=True) as dest:  # size unknown up front: may pass 2 GiB
+            shutil.copyfileobj(f, dest, 1 << 20)
+        self.count += 1
+
+    def close(self):
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+
+    def file(self):
+        """The finished archive as a readable handle at offset 0, for st.download_button."""
+        self.close()
+        return readable(self._buf)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    def discard(self):
+        """Drop the archive (and its temp file) without finishing it."""
+        try:
+            if self._zip is not None:
+                self._zip.close()
+        finally:
+            self._zip = None
+            self._buf.close()